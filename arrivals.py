@@ -0,0 +1,153 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+from workload import WorkloadError
+
+
+class ArrivalIndex:
+    #tarefas que ainda vao chegar, ordenadas pelo tick de ingresso.
+    #monta uma vez no carregamento; o sort do python eh estavel, entao quem chega
+    #no mesmo tick continua na ordem do arquivo. um cursor marca ate onde ja chegou,
+    #assim cada tick so olha as k tarefas que chegam nele
+
+    def __init__(self, tasks):
+        self._tasks = sorted(tasks, key=lambda task: task.arrival_time)
+        self._times = [task.arrival_time for task in self._tasks]
+        self._cursor = 0
+
+    def __len__(self): #quantas ainda nao chegaram
+        return len(self._tasks) - self._cursor
+
+    def __bool__(self):
+        return self._cursor < len(self._tasks)
+
+    def __iter__(self): #so as pendentes, em ordem de chegada
+        return iter(self._tasks[self._cursor:])
+
+    def pop_due(self, tick):
+        #devolve (e marca como chegadas) as tarefas com ingresso ate esse tick
+        start = self._cursor
+        end = start
+        times = self._times
+        while end < len(times) and times[end] <= tick:
+            end += 1
+        self._cursor = end
+        return self._tasks[start:end]
+
+    def rewind(self): #todo mundo volta a ser "ainda vai chegar", reaproveitando a ordenacao
+        self._cursor = 0
+
+    def tell(self): #quantas ja chegaram (p/ checkpoint)
+        return self._cursor
+
+    def seek(self, position): #volta (ou avanca) o cursor p/ uma posicao salva com tell()
+        self._cursor = position
+
+    def peek_time(self): #tick da proxima chegada, None se nao tem mais ninguem
+        if self._cursor < len(self._times):
+            return self._times[self._cursor]
+        return None
+
+    def arriving_at(self, tick):
+        #todas que chegam nesse tick, ja tendo chegado ou nao (usado pela gui p/ desenhar os marcadores)
+        return self._tasks[bisect_left(self._times, tick):bisect_right(self._times, tick)]
+
+    def arriving_between(self, start, end): #as que chegam de start ate end (exclusivo), em ordem
+        return self._tasks[bisect_left(self._times, start):bisect_left(self._times, end)]
+
+
+class TableArrivalIndex:
+    #o mesmo indice, mas em cima de uma TaskTable: guarda so a ordem das linhas e os
+    #ingressos ordenados em arrays e cria a view da tarefa so quando ela chega
+    def __init__(self, table):
+        self._table = table
+        order = sorted(range(len(table)), key=table.arrival.__getitem__)
+        self._order = array("q", order)
+        self._times = array("q", [table.arrival[i] for i in order])
+        self._cursor = 0
+
+    def __len__(self):
+        return len(self._order) - self._cursor
+
+    def __bool__(self):
+        return self._cursor < len(self._order)
+
+    def __iter__(self):
+        table = self._table
+        return (table.view(i) for i in self._order[self._cursor:])
+
+    def pop_due(self, tick):
+        start = self._cursor
+        end = start
+        times = self._times
+        while end < len(times) and times[end] <= tick:
+            end += 1
+        self._cursor = end
+        table = self._table
+        return [table.view(i) for i in self._order[start:end]]
+
+    def rewind(self):
+        self._cursor = 0
+
+    def tell(self):
+        return self._cursor
+
+    def seek(self, position):
+        self._cursor = position
+
+    def peek_time(self):
+        if self._cursor < len(self._times):
+            return self._times[self._cursor]
+        return None
+
+    def arriving_at(self, tick):
+        return self.arriving_between(tick, tick + 1)
+
+    def arriving_between(self, start, end):
+        table = self._table
+        return [
+            table.view(i)
+            for i in self._order[bisect_left(self._times, start):bisect_left(self._times, end)]
+        ]
+
+
+class StreamingArrivalIndex:
+    #mesma interface do ArrivalIndex, mas p/ arquivo que ja vem ordenado por chegada:
+    #puxa a proxima tarefa do leitor so quando precisa, entao a memoria nao cresce
+    #com o tamanho do arquivo. tarefa fora de ordem nao da p/ encaixar sem ler tudo,
+    #entao vira erro (com o numero da linha) e eh ignorada
+    def __init__(self, reader):
+        self._reader = reader
+        self._source = iter(reader)
+        self._next = None
+        self._last_arrival = None
+        self._advance()
+
+    def _advance(self):
+        for task in self._source:
+            if self._last_arrival is not None and task.arrival_time < self._last_arrival:
+                self._reader.report(
+                    WorkloadError(
+                        self._reader.line_number,
+                        f"ingresso {task.arrival_time} fora de ordem (anterior: {self._last_arrival}), "
+                        "a leitura em fluxo precisa do arquivo ordenado por ingresso",
+                    )
+                )
+                continue
+            self._last_arrival = task.arrival_time
+            self._next = task
+            return
+        self._next = None
+
+    def __bool__(self):
+        return self._next is not None
+
+    def pop_due(self, tick):
+        due = []
+        while self._next is not None and self._next.arrival_time <= tick:
+            due.append(self._next)
+            self._advance()
+        return due
+
+    def peek_time(self):
+        return self._next.arrival_time if self._next is not None else None
@@ -0,0 +1,282 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from compare import check_algorithms
+from event_simulator import EventSimulator
+from simulator import Simulator
+from trace_sinks import NullSink
+from workload import Workload
+from workload_gen import SHAPES, write_workload
+
+try:
+    import resource #nao existe no windows, ai o pico de memoria fica sem medir
+except ImportError:
+    resource = None
+
+ENGINES = {"tick": Simulator, "event": EventSimulator}
+HERE = os.path.dirname(os.path.abspath(__file__))
+#historico fica ao lado do benchmark.py, nao na pasta de onde ele foi chamado
+DEFAULT_HISTORY = os.path.join(HERE, "benchmarks", "history.jsonl")
+
+#partida a frio de uma execucao em lote (main.py com argumentos): tempo do processo inteiro,
+#do python subir ate sair, e o que nao pode ter sido importado no caminho
+STARTUP_BUDGET = 0.15 #segundos
+STARTUP_CONFIG = os.path.join(HERE, "testes_exemplos", "config.txt") #relativo ao arquivo, roda de qualquer pasta
+GUI_MODULES = ("tkinter", "PIL", "numpy", "webbrowser", "multiprocessing")
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    #linux devolve em KB, macos em bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_case(path, algorithm_name, engine):
+    #roda num processo novo (ver run_benchmarks), entao o pico de memoria eh so deste caso
+    baseline_rss = _peak_rss_kb()
+
+    started = time.perf_counter()
+    workload = Workload.load(path)
+    parsed = time.perf_counter()
+    simulator = ENGINES[engine].from_workload(
+        workload, algorithm_name=algorithm_name, trace=NullSink(), record_schedule=False
+    )
+    ready = time.perf_counter()
+    simulator.run(collect=False)
+    finished = time.perf_counter()
+
+    peak_rss = _peak_rss_kb()
+    simulate_seconds = finished - ready
+    tasks = len(workload)
+    return {
+        "tasks": tasks,
+        "ticks": simulator.global_tick,
+        "context_switches": simulator.metrics.context_switches,
+        "phases": {
+            "parse": parsed - started,
+            "setup": ready - parsed,
+            "simulate": simulate_seconds,
+        },
+        "ticks_per_second": simulator.global_tick / simulate_seconds if simulate_seconds else None,
+        "tasks_per_second": tasks / simulate_seconds if simulate_seconds else None,
+        "peak_rss_kb": peak_rss,
+        "bytes_per_task": (
+            (peak_rss - baseline_rss) * 1024 / tasks
+            if peak_rss is not None and tasks
+            else None
+        ),
+    }
+
+
+def run_benchmarks(shapes, sizes, algorithms, engines, seed=0):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for shape in shapes:
+            for size in sizes:
+                generate_started = time.perf_counter()
+                path = write_workload(
+                    os.path.join(directory, f"{shape}_{size}.txt"), shape, size, seed=seed
+                )
+                generate_seconds = time.perf_counter() - generate_started
+                for algorithm_name in algorithms:
+                    for engine in engines:
+                        #um processo por caso p/ o pico de memoria de um nao contaminar o outro
+                        with ProcessPoolExecutor(max_workers=1) as executor:
+                            result = executor.submit(run_case, path, algorithm_name, engine).result()
+                        result["phases"]["generate"] = generate_seconds
+                        result.update(
+                            {"shape": shape, "size": size, "algorithm": algorithm_name, "engine": engine}
+                        )
+                        results.append(result)
+                        print(_describe(result), flush=True)
+    return results
+
+
+def measure_startup(config=STARTUP_CONFIG, runs=5):
+    #devolve (melhor tempo em segundos, modulos pesados que foram carregados). o melhor de
+    #varias execucoes, p/ nao contar o disco frio da primeira
+    script = os.path.join(HERE, "main.py")
+    command = [sys.executable, script, config, "--trace", "null"]
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    probe = (
+        "import runpy, sys\n"
+        f"sys.argv = {[script] + command[2:]!r}\n"
+        f"sys.path.insert(0, {HERE!r})\n" #como rodar o script direto: os modulos vem da pasta dele
+        "try:\n"
+        "    runpy.run_path(sys.argv[0], run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"sys.stderr.write(','.join(m for m in {GUI_MODULES!r} if m in sys.modules))\n"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", probe], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    ).stderr.strip().splitlines()
+    return best, [name for name in (loaded[-1] if loaded else "").split(",") if name]
+
+
+def check_startup(budget=STARTUP_BUDGET, config=STARTUP_CONFIG):
+    best, loaded = measure_startup(config)
+    print(f"Partida em lote (main.py {os.path.basename(config)}): {best * 1000:.0f} ms (limite: {budget * 1000:.0f} ms)")
+    ok = best <= budget
+    if loaded:
+        print(f"  módulos que não deviam carregar sem janela: {', '.join(loaded)}")
+        ok = False
+    return ok
+
+
+def case_key(result):
+    return (result["shape"], result["size"], result["algorithm"], result["engine"])
+
+
+def _describe(result):
+    rate = result["ticks_per_second"]
+    rss = result["peak_rss_kb"]
+    return (
+        f"{result['shape']:<7}{result['size']:>9} {result['algorithm']:<6}{result['engine']:<6}"
+        f"{result['phases']['simulate']:>10.3f}s"
+        f"{(f'{rate:,.0f}' if rate else '-'):>14} ticks/s"
+        f"{(f'{rss / 1024:.1f}' if rss else '-'):>9} MB"
+    )
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(path, results):
+    entry = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def compare_with_previous(history, results, threshold):
+    #compara a vazao com a ultima execucao que rodou o mesmo caso; devolve os que pioraram demais
+    previous = {}
+    for entry in history:
+        for result in entry["results"]:
+            previous[case_key(result)] = result
+    regressions = []
+    for result in results:
+        old = previous.get(case_key(result))
+        if not old or not old["ticks_per_second"] or not result["ticks_per_second"]:
+            continue
+        change = result["ticks_per_second"] / old["ticks_per_second"] - 1
+        print(f"  {' '.join(str(part) for part in case_key(result))}: {change:+.1%} em ticks/s")
+        if change < -threshold:
+            regressions.append((case_key(result), change))
+    return regressions
+
+
+def _split_list(text):
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Mede vazão, memória e tempo por fase do simulador em cargas sintéticas."
+    )
+    parser.add_argument("--shapes", type=_split_list, default=list(SHAPES), help="formatos de carga")
+    parser.add_argument(
+        "--sizes",
+        type=lambda text: [int(value) for value in _split_list(text)],
+        default=[1000],
+        help="quantidades de tarefas (padrão: 1000)",
+    )
+    parser.add_argument(
+        "--algorithms",
+        type=lambda text: [name.upper() for name in _split_list(text)],
+        default=["FIFO", "PRIOP", "SRTF"],
+        help="algoritmos (padrão: FIFO,PRIOP,SRTF)",
+    )
+    parser.add_argument(
+        "--engines", type=_split_list, default=["event", "tick"], help="motores (padrão: event,tick)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--history",
+        default=DEFAULT_HISTORY,
+        help="histórico em JSON Lines (padrão: benchmarks/history.jsonl ao lado do benchmark.py)",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        type=float,
+        metavar="FRACAO",
+        help="sai com erro se algum caso ficar mais lento que isso (ex: 0.2 = 20%%) em relação à última execução",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="só mede a partida a frio de uma execução em lote (main.py com argumentos) e sai com "
+        "erro se passar do limite ou carregar tkinter/PIL/numpy",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=STARTUP_BUDGET,
+        metavar="SEGUNDOS",
+        help=f"limite da partida a frio (padrão: {STARTUP_BUDGET})",
+    )
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        return 0 if check_startup(args.startup_budget) else 1
+
+    try:
+        args.algorithms = check_algorithms(args.algorithms)
+    except ValueError as e:
+        parser.error(str(e))
+
+    history = load_history(args.history)
+    results = run_benchmarks(args.shapes, args.sizes, args.algorithms, args.engines, args.seed)
+    print("Comparação com a execução anterior:")
+    regressions = compare_with_previous(history, results, args.fail_on_regression or 0)
+    append_history(args.history, results)
+
+    if args.fail_on_regression is not None and regressions:
+        print(f"{len(regressions)} caso(s) ficaram mais lentos que o limite.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
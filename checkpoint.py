@@ -0,0 +1,273 @@
+from bisect import bisect_right
+from timing_wheel import TimingWheel
+from trace_sinks import TraceSink
+
+#de quantos em quantos ticks tira uma foto completa do estado
+DEFAULT_INTERVAL = 64
+
+#o que muda numa tarefa durante a simulacao (o resto vem do arquivo e nao muda)
+TASK_FIELDS = (
+    "remaining_time",
+    "status",
+    "start_time",
+    "finish_time",
+    "waiting_since",
+    "waiting_time",
+    "next_io",
+)
+
+
+def _task_state(task):
+    return tuple(getattr(task, field) for field in TASK_FIELDS)
+
+
+def _set_task_state(task, state):
+    for field, value in zip(TASK_FIELDS, state):
+        setattr(task, field, value)
+
+
+def _scheduler_state(scheduler):
+    #so os dados do escalonador (ex: a fatia do round robin). funcao pendurada na instancia
+    #(o embrulho do profiler) fica de fora, senao voltar no tempo poe ela de volta depois do detach
+    return {name: value for name, value in vars(scheduler).items() if not callable(value)}
+
+
+class Keyframe:
+    #foto do estado no comeco de um tick (antes das chegadas dele). das tarefas so guarda as
+    #que mudaram desde a foto anterior (a primeira guarda todas): quem nao mexeu continua com o
+    #estado de uma foto mais velha, entao a memoria cresce com o que acontece e nao com
+    #tarefas x ticks (tarefa que ainda nao chegou ou ja acabou nao entra de novo)
+    def __init__(self, simulator, tasks):
+        self.tick = simulator.global_tick
+        self.task_states = {task: _task_state(task) for task in tasks}
+        self.ready = tuple(simulator.ready_queue) #na ordem em que sairiam da fila
+        self.running = simulator.running_task
+        self.blocked = simulator.blocked.items()
+        self.arrivals = simulator.arrivals.tell()
+        self.scheduler = _scheduler_state(simulator.scheduler) #ex: a fatia atual do round robin
+        self.metrics = simulator.metrics.copy()
+
+
+class Delta:
+    #o que um tick mudou: os eventos dele (refeitos em cima da foto anterior p/ remontar
+    #a fila, a roda de bloqueados e as metricas) e o estado final so das tarefas que mexeram
+    __slots__ = ("events", "states", "running", "ran", "arrivals", "scheduler")
+
+    def __init__(self):
+        self.events = []
+        self.states = None
+        self.running = None
+        self.ran = None
+        self.arrivals = 0
+        self.scheduler = None
+
+
+class _RecordingSink(TraceSink):
+    #fica entre o simulador e o rastro de verdade: repassa tudo e anota no delta do tick atual.
+    #toda mudanca de estado de tarefa passa por um desses eventos, entao eles dizem quem mexeu
+    def __init__(self, inner):
+        super().__init__(inner.stream, inner.verbosity)
+        self.inner = inner
+        self.delta = None
+
+    def _note(self, kind, tick, task, extra=None):
+        if self.delta is not None:
+            self.delta.events.append((kind, tick, task, extra))
+
+    def tick_started(self, tick):
+        self.inner.tick_started(tick)
+
+    def arrived(self, tick, task):
+        self._note("arrived", tick, task)
+        self.inner.arrived(tick, task)
+
+    def preempted(self, tick, task):
+        self._note("preempted", tick, task)
+        self.inner.preempted(tick, task)
+
+    def dispatched(self, tick, task):
+        self._note("dispatched", tick, task)
+        self.inner.dispatched(tick, task)
+
+    def ran(self, task, start, end):
+        self._note("ran", start, task, end)
+        self.inner.ran(task, start, end)
+
+    def idle(self, start, end):
+        self._note("idle", start, None, end)
+        self.inner.idle(start, end)
+
+    def blocked(self, tick, task, until):
+        self._note("blocked", tick, task, until)
+        self.inner.blocked(tick, task, until)
+
+    def woke(self, tick, task):
+        self._note("woke", tick, task)
+        self.inner.woke(tick, task)
+
+    def finished(self, tick, task):
+        self._note("finished", tick, task)
+        self.inner.finished(tick, task)
+
+    def completed(self, tick):
+        self.inner.completed(tick)
+
+    def close(self):
+        self.inner.close()
+
+
+class Checkpointer:
+    #historico da simulacao p/ voltar no tempo: uma foto (Keyframe) a cada interval ticks e,
+    #entre elas, so o que cada tick mudou (Delta). voltar p/ um tick T carrega a foto anterior
+    #e aplica no maximo interval deltas; das tarefas so volta as que mexeram depois da foto
+    #(as outras ja estao certas), procurando o estado delas da foto p/ tras.
+    #so funciona no motor de ticks (o da janela) e com a lista de tarefas na memoria
+    def __init__(self, simulator, interval=DEFAULT_INTERVAL):
+        if not simulator.original_task_list and simulator.arrivals:
+            raise ValueError("checkpoint precisa da lista de tarefas (não funciona no modo em fluxo)")
+        self.simulator = simulator
+        self.interval = max(interval, 1)
+        self._tasks = list(simulator.original_task_list)
+        self._recorder = _RecordingSink(simulator.trace)
+        simulator.trace = self._recorder
+        self._keyframes = [Keyframe(simulator, self._tasks)]
+        self._keyframe_ticks = [simulator.global_tick]
+        self._deltas = [] #_deltas[i] = o que o tick (primeira foto + i) mudou
+        self._changed = {} #tarefas que mexeram desde a ultima foto (vao na proxima)
+
+    @property
+    def first_tick(self): #o tick mais antigo p/ onde da p/ voltar
+        return self._keyframe_ticks[0]
+
+    @property
+    def last_tick(self): #o tick mais novo ja simulado
+        return self._keyframe_ticks[0] + len(self._deltas)
+
+    def tick(self):
+        #igual ao Simulator.tick, mas guardando o que mudou
+        simulator = self.simulator
+        start = simulator.global_tick
+        if start - self._keyframe_ticks[-1] >= self.interval:
+            self._keyframes.append(Keyframe(simulator, self._changed))
+            self._keyframe_ticks.append(start)
+            self._changed = {}
+        delta = Delta()
+        self._recorder.delta = delta
+        try:
+            task = simulator.tick()
+        finally:
+            self._recorder.delta = None
+        if simulator.global_tick == start: #ja tinha acabado, nada mudou
+            return task
+        touched = {}
+        for _, _, event_task, _ in delta.events:
+            if event_task is not None:
+                touched[event_task] = True
+        delta.states = [(event_task, _task_state(event_task)) for event_task in touched]
+        self._changed.update(touched)
+        delta.running = simulator.running_task
+        delta.ran = task
+        delta.arrivals = simulator.arrivals.tell()
+        delta.scheduler = _scheduler_state(simulator.scheduler) or None
+        self._deltas.append(delta)
+        return task
+
+    def restore(self, tick):
+        #volta o simulador inteiro p/ o comeco do tick (como se tivesse acabado de rodar tick-1).
+        #o que vinha depois eh descartado: andar p/ frente de novo simula de verdade
+        if not self.first_tick <= tick <= self.last_tick:
+            raise ValueError(
+                f"tick {tick} fora do histórico ({self.first_tick} a {self.last_tick})"
+            )
+        simulator = self.simulator
+        index = bisect_right(self._keyframe_ticks, tick) - 1
+        keyframe = self._keyframes[index]
+        first = keyframe.tick - self.first_tick
+        #so quem mexeu depois da foto ta diferente dela; o estado de cada uma eh o da foto
+        #mais nova (ate essa) que tem ela, e a primeira foto tem todas
+        pending = {task for delta in self._deltas[first:] for task, _ in delta.states}
+        for older in reversed(self._keyframes[:index + 1]):
+            if not pending:
+                break
+            found = [task for task in pending if task in older.task_states]
+            for task in found:
+                _set_task_state(task, older.task_states[task])
+            pending.difference_update(found)
+
+        ready_queue = simulator.scheduler.make_ready_queue()
+        for task in keyframe.ready:
+            ready_queue.append(task)
+        blocked = {task: (until, order) for order, (until, task) in enumerate(keyframe.blocked)}
+        order = len(blocked)
+        metrics = keyframe.metrics.copy()
+        running = keyframe.running
+        arrivals = keyframe.arrivals
+        scheduler_state = keyframe.scheduler
+
+        for delta in self._deltas[first:tick - self.first_tick]:
+            #estado final do tick primeiro: as metricas leem inicio/espera ja atualizados
+            for task, state in delta.states:
+                _set_task_state(task, state)
+            for kind, event_tick, task, extra in delta.events:
+                if kind == "arrived":
+                    ready_queue.append(task)
+                elif kind == "woke":
+                    ready_queue.append(task)
+                    del blocked[task]
+                elif kind == "preempted":
+                    metrics.on_preempt(task, event_tick)
+                    ready_queue.append(task)
+                elif kind == "dispatched":
+                    if task in ready_queue:
+                        ready_queue.remove(task)
+                    metrics.on_dispatch(task, event_tick)
+                elif kind == "blocked":
+                    if task in ready_queue: #chegou e ja foi direto p/ E/S
+                        ready_queue.remove(task)
+                    order += 1
+                    blocked[task] = (extra, order)
+                elif kind == "ran":
+                    metrics.on_run(extra - event_tick)
+                elif kind == "idle":
+                    metrics.on_idle(extra - event_tick)
+                elif kind == "finished":
+                    metrics.on_finish(task, event_tick)
+            running = delta.running
+            arrivals = delta.arrivals
+            scheduler_state = delta.scheduler or {}
+
+        wheel = TimingWheel(now=max(tick - 1, 0))
+        for task, (until, _) in sorted(blocked.items(), key=lambda item: item[1]):
+            wheel.schedule(task, until)
+
+        simulator.global_tick = tick
+        simulator.ready_queue = ready_queue
+        simulator.blocked = wheel
+        simulator.running_task = running
+        simulator.arrivals.seek(arrivals)
+        simulator.scheduler.__dict__.update(scheduler_state)
+        simulator.metrics = metrics
+        if simulator.schedule is not None:
+            #quem rodou no tick anterior, p/ a escala continuar o mesmo intervalo
+            ran = self._deltas[tick - self.first_tick - 1].ran if tick > self.first_tick else None
+            simulator.schedule.truncate(tick, last_task=ran)
+
+        del self._deltas[tick - self.first_tick:]
+        del self._keyframes[index + 1:], self._keyframe_ticks[index + 1:]
+        self._changed = {task: True for delta in self._deltas[first:] for task, _ in delta.states}
+
+    def step_back(self): #desfaz o ultimo tick (devolve False se ja ta no comeco)
+        if self.simulator.global_tick <= self.first_tick:
+            return False
+        self.restore(self.simulator.global_tick - 1)
+        return True
+
+    def seek(self, tick):
+        #vai p/ o tick: p/ tras restaura do historico, p/ frente simula ate la (ou ate acabar)
+        tick = max(tick, self.first_tick)
+        if tick <= self.last_tick:
+            self.restore(tick)
+            return
+        simulator = self.simulator
+        while simulator.global_tick < tick and not simulator._is_simulation_complete():
+            self.tick()
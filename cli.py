@@ -0,0 +1,314 @@
+import argparse
+import cProfile
+import os
+import sys
+
+from compare import check_algorithms, compare_algorithms, format_comparison
+from event_simulator import EventSimulator
+from gantt_export import export_gantt, export_lanes, nearest_zoom
+from metrics import format_summary, task_metrics
+from profiling import Profiler, format_report
+from simulator import Simulator
+from smp import QUEUE_MODES, SmpSimulator, format_core_summary
+from sweep import format_sensitivity, quantum_sensitivity
+from trace_sinks import SINKS, create_sink
+from workload import Workload
+
+#motores disponiveis: o de ticks (o mesmo da janela) e o orientado a eventos (bem mais rapido)
+ENGINES = {"tick": Simulator, "event": EventSimulator}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Roda uma simulação de escalonamento sem abrir a janela."
+    )
+    parser.add_argument("config", help="arquivo de configuração (.txt)")
+    parser.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default="event",
+        help="motor de simulação (padrão: event)",
+    )
+    parser.add_argument(
+        "--trace",
+        choices=sorted(SINKS),
+        default="text",
+        help="formato do rastro da simulação (padrão: text)",
+    )
+    parser.add_argument(
+        "-o", "--output", help="arquivo onde gravar o rastro (padrão: saída padrão)"
+    )
+    parser.add_argument(
+        "--schedule",
+        help="grava a escala (intervalos de execução) nesse arquivo binário, consultável com schedule.py",
+    )
+    parser.add_argument(
+        "--gantt",
+        metavar="ARQ.png|ARQ.svg",
+        help="desenha o gráfico de Gantt da simulação inteira nesse arquivo (gráficos longos viram vários)",
+    )
+    parser.add_argument(
+        "--gantt-scale",
+        type=_positive_float,
+        default=30,
+        metavar="PX",
+        help="pixels por tick no --gantt; menos de 1 junta vários ticks num pixel (padrão: 30)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="lê as tarefas do arquivo conforme chegam, sem carregar tudo (o arquivo precisa estar ordenado por ingresso)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="guarda as tarefas numa tabela em colunas (bem menos memória com milhões de tarefas)",
+    )
+    parser.add_argument(
+        "--cpus",
+        type=int,
+        default=1,
+        help="número de núcleos; com mais de 1 usa o simulador multiprocessado (padrão: 1)",
+    )
+    parser.add_argument(
+        "--smp-queue",
+        choices=QUEUE_MODES,
+        default="percore",
+        help="percore = uma fila por núcleo com balanceamento, global = uma fila compartilhada (padrão: percore)",
+    )
+    parser.add_argument(
+        "--balance-interval",
+        type=int,
+        default=10,
+        help="a cada quantos ticks os núcleos sem fila roubam trabalho dos outros, 0 = nunca (padrão: 10)",
+    )
+    parser.add_argument(
+        "--affinity",
+        action="append",
+        type=_parse_affinity,
+        default=[],
+        metavar="TAREFA=N,N",
+        help="núcleos onde a tarefa pode rodar, ex: T1=0,1 (pode repetir)",
+    )
+    parser.add_argument(
+        "--quanta",
+        type=lambda text: [int(value) for value in text.split(",") if value.strip()],
+        help="sensibilidade ao quantum: roda a carga em round robin com cada quantum (ex: 1,2,4,8) "
+        "e compara trocas de contexto e tempo de resposta",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="ARQ.json|ARQ.folded|ARQ.prof",
+        help="mede o tempo de cada fase do laço (chegadas, despacho, escolha do escalonador...) e grava em "
+        ".json ou em pilhas dobradas p/ flamegraph; .prof grava o perfil do cProfile (pstats/snakeviz)",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="ALG,ALG",
+        type=lambda text: [name.strip().upper() for name in text.split(",") if name.strip()],
+        help="compara algoritmos na mesma carga (ex: FIFO,SRTF,PRIOP), lendo o arquivo uma vez só; "
+        "com --gantt sai uma faixa por algoritmo no mesmo gráfico",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="com --compare, quantos algoritmos rodam em paralelo (um processo cada; padrão: 1)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbosity",
+        type=int,
+        choices=(0, 1, 2),
+        default=0,
+        help="0 = só o resumo, 1 = eventos, 2 = cada tick (padrão: 0)",
+    )
+    return parser
+
+
+def _parse_affinity(text):
+    task_id, _, cores = text.partition("=")
+    try:
+        return task_id.strip(), [int(core) for core in cores.split(",") if core.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"afinidade inválida: {text!r} (esperado TAREFA=0,1)")
+
+
+def _positive_float(text):
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inválido: {text!r}")
+    if not 0 < value < float("inf"): #tambem pega nan
+        raise argparse.ArgumentTypeError(f"precisa ser um número positivo: {text!r}")
+    return value
+
+
+def build_simulator(args, **options):
+    if args.cpus > 1:
+        return SmpSimulator(
+            args.config,
+            cpus=args.cpus,
+            queue_mode=args.smp_queue,
+            affinity=dict(args.affinity),
+            balance_interval=args.balance_interval,
+            **options
+        )
+    return ENGINES[args.engine](args.config, **options)
+
+
+def print_summary(simulator, stream, show_tasks=True):
+    stream.write(
+        f"Algoritmo: {simulator.scheduling_algorithm_name} | Quantum: {simulator.quantum} | Ticks: {simulator.global_tick}\n"
+    )
+    if simulator.load_errors:
+        stream.write(f"Linhas ignoradas por erro: {len(simulator.load_errors)}\n")
+    if show_tasks:
+        _print_task_table(simulator, stream)
+    stream.write("\n" + format_summary(simulator.metrics.summary()) + "\n")
+    if isinstance(simulator, SmpSimulator):
+        stream.write("\n" + format_core_summary(simulator.core_summary(), simulator.migrations) + "\n")
+
+
+def _print_task_table(simulator, stream):
+    stream.write(
+        f"{'Tarefa':<12}{'Ingresso':>10}{'Duração':>10}{'Início':>10}{'Fim':>10}"
+        f"{'Turnaround':>12}{'Espera':>10}{'Resposta':>10}\n"
+    )
+    for task in simulator.original_task_list:
+        values = task_metrics(task)
+        stream.write(
+            f"{task.task_id:<12}{task.arrival_time:>10}{task.duration:>10}{task.start_time:>10}{task.finish_time:>10}"
+            f"{_cell(values['turnaround']):>12}{_cell(values['waiting']):>10}{_cell(values['response']):>10}\n"
+        )
+
+
+def _cell(value):
+    return "-" if value is None else str(value)
+
+
+def _export_gantt(simulator, path, zoom):
+    #com varios nucleos sai um grafico por nucleo: ARQ.cpu0.png, ARQ.cpu1.png...
+    if isinstance(simulator, SmpSimulator):
+        base, extension = os.path.splitext(path)
+        targets = [(cpu.schedule, f"{base}.cpu{cpu.index}{extension}") for cpu in simulator.cpus]
+    else:
+        targets = [(simulator.schedule, path)]
+    for schedule, target in targets:
+        try:
+            written = export_gantt(schedule, target, zoom=zoom)
+        except ImportError:
+            print("Erro: exportar PNG precisa do Pillow (pip install pillow); SVG funciona sem ele", file=sys.stderr)
+            return
+        print(f"Gráfico de Gantt salvo em: {', '.join(written)}", file=sys.stderr)
+
+
+def _run_profiled(simulator, path, stream):
+    #sem --profile roda direto, sem embrulho nenhum no laco
+    if not path:
+        simulator.run(collect=False)
+        return
+    if os.path.splitext(path)[1].lower() in (".prof", ".pstats"):
+        profile = cProfile.Profile()
+        profile.runcall(simulator.run, collect=False)
+        profile.dump_stats(path)
+    else:
+        profiler = Profiler()
+        profiler.attach(simulator)
+        simulator.run(collect=False)
+        profiler.detach()
+        profiler.save(path, simulator)
+        stream.write(format_report(profiler.report(simulator)) + "\n\n")
+    print(f"Perfil salvo em: {path}", file=sys.stderr)
+
+
+def run_sensitivity(args):
+    #le e ordena a carga uma vez so; cada quantum reaproveita isso (Simulator.restart)
+    simulator = build_simulator(
+        args, trace=create_sink("null"), compact=args.compact, record_schedule=False
+    )
+    rows = quantum_sensitivity(simulator, args.quanta)
+    print(f"Sensibilidade ao quantum (RR) | Tarefas: {len(simulator.original_task_list)}")
+    print(format_sensitivity(rows))
+    return 0
+
+
+def run_comparison(args):
+    #le a carga uma vez so; cada algoritmo roda nas suas proprias Task (compare.py)
+    workload = Workload.load(args.config)
+    results = compare_algorithms(
+        workload, args.compare, workers=args.workers, record_schedule=args.gantt is not None
+    )
+    print(f"Comparação de algoritmos | Tarefas: {len(workload)} | Quantum: {results[0]['quantum']}")
+    if workload.errors:
+        print(f"Linhas ignoradas por erro: {len(workload.errors)}")
+    print(format_comparison(results))
+    if args.gantt:
+        lanes = [(result["algorithm"], result["schedule"]) for result in results]
+        try:
+            written = export_lanes(lanes, args.gantt, args.gantt_scale)
+        except ImportError:
+            print("Erro: exportar PNG precisa do Pillow (pip install pillow); SVG funciona sem ele", file=sys.stderr)
+            return 1
+        print(f"Gráfico de Gantt salvo em: {', '.join(written)}", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.cpus < 1:
+        parser.error(f"--cpus precisa de pelo menos 1 núcleo: {args.cpus}")
+    for task_id, cores in args.affinity: #nucleo que nao existe viraria traceback la no SmpSimulator
+        if not cores or not all(0 <= core < args.cpus for core in cores):
+            parser.error(f"--affinity {task_id}: núcleos precisam estar entre 0 e {args.cpus - 1}")
+    if args.affinity and args.smp_queue == "global":
+        parser.error("--affinity só funciona com --smp-queue percore")
+    if args.quanta:
+        if args.stream:
+            parser.error("--quanta precisa rodar a carga várias vezes, não dá p/ usar com --stream")
+        return run_sensitivity(args)
+    if args.compare:
+        if args.stream or args.cpus > 1:
+            parser.error("--compare roda a carga inteira em um núcleo, não dá p/ usar com --stream nem --cpus")
+        try:
+            check_algorithms(args.compare)
+        except ValueError as e:
+            parser.error(str(e))
+        return run_comparison(args)
+
+    trace_stream = open(args.output, "w", encoding="utf-8", newline="") if args.output else None
+    trace = create_sink(args.trace, trace_stream, args.verbosity)
+    #se o rastro de maquina vai p/ saida padrao, o resumo vai p/ stderr p/ nao estragar o csv/jsonl
+    if args.trace in ("csv", "jsonl") and trace_stream is None:
+        summary_stream = sys.stderr
+    else:
+        summary_stream = sys.stdout
+
+    try:
+        simulator = build_simulator(
+            args,
+            trace=trace,
+            streaming=args.stream,
+            compact=args.compact,
+            record_schedule=args.schedule is not None or args.gantt is not None,
+        )
+        _run_profiled(simulator, args.profile, summary_stream)
+        if args.schedule and isinstance(simulator, SmpSimulator):
+            for cpu in simulator.cpus: #uma escala por nucleo: ARQ.cpu0, ARQ.cpu1...
+                cpu.schedule.save(f"{args.schedule}.cpu{cpu.index}")
+        elif args.schedule:
+            simulator.schedule.save(args.schedule)
+        if args.gantt:
+            _export_gantt(simulator, args.gantt, nearest_zoom(args.gantt_scale))
+    finally:
+        trace.close()
+
+    #em fluxo as tarefas nao ficam guardadas (original_task_list vazia): so o resumo
+    print_summary(simulator, summary_stream, show_tasks=not args.stream)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import os
+
+from event_simulator import EventSimulator
+from scheduler import SCHEDULERS
+from trace_sinks import NullSink
+
+#comparacao de algoritmos numa carga so: o arquivo eh lido uma vez (Workload) e cada algoritmo
+#roda em cima das suas proprias Task, criadas da mesma tabela de campos ja lidos. os campos do
+#arquivo (id, cor, ingresso, duracao, eventos) sao os mesmos objetos em todas as rodadas; so o
+#estado de execucao (restante, inicio, fim, espera...) eh de cada uma
+
+#o que roda quando ninguem escolhe (FCFS eh so outro nome do FIFO)
+DEFAULT_ALGORITHMS = ("FIFO", "SRTF", "PRIOP", "RR")
+
+#linhas da tabela de metricas: (titulo, valor tirado do resultado de uma rodada)
+METRIC_ROWS = (
+    ("Ticks", lambda result: result["ticks"]),
+    ("Uso da CPU (%)", lambda result: result["summary"]["cpu_utilization"] * 100),
+    ("Trocas de contexto", lambda result: result["summary"]["context_switches"]),
+    ("Preempções", lambda result: result["summary"]["preemptions"]),
+    ("Turnaround médio", lambda result: result["summary"]["turnaround"]["mean"]),
+    ("Turnaround p95", lambda result: result["summary"]["turnaround"]["p95"]),
+    ("Espera média", lambda result: result["summary"]["waiting"]["mean"]),
+    ("Espera p95", lambda result: result["summary"]["waiting"]["p95"]),
+    ("Resposta média", lambda result: result["summary"]["response"]["mean"]),
+    ("Resposta p95", lambda result: result["summary"]["response"]["p95"]),
+)
+
+#carga ja lida, uma copia por processo (mandada uma vez so pelo initializer do pool)
+_worker_workload = {}
+
+
+def _init_worker(workload):
+    _worker_workload["workload"] = workload
+
+
+def check_algorithms(algorithms):
+    #nomes em maiusculas, sem repetir; nome desconhecido eh erro (o simulador cairia no fifo calado)
+    names = list(dict.fromkeys(name.strip().upper() for name in algorithms if name.strip()))
+    unknown = [name for name in names if name not in SCHEDULERS]
+    if unknown:
+        raise ValueError(
+            f"algoritmo desconhecido: {', '.join(unknown)} (use {', '.join(SCHEDULERS)})"
+        )
+    if not names:
+        raise ValueError("nenhum algoritmo p/ comparar")
+    return names
+
+
+def run_algorithm(workload, algorithm_name, quantum=None, record_schedule=True):
+    #uma rodada da comparacao. devolve so coisas que dao p/ mandar de volta de outro processo
+    simulator = EventSimulator.from_workload(
+        workload,
+        algorithm_name=algorithm_name,
+        quantum=quantum,
+        trace=NullSink(),
+        record_schedule=record_schedule,
+    )
+    simulator.run(collect=False)
+    return {
+        "algorithm": algorithm_name,
+        "quantum": simulator.quantum,
+        "ticks": simulator.global_tick,
+        "summary": simulator.metrics.summary(),
+        "schedule": simulator.schedule,
+    }
+
+
+def _run_in_worker(algorithm_name, quantum, record_schedule):
+    return run_algorithm(_worker_workload["workload"], algorithm_name, quantum, record_schedule)
+
+
+def compare_algorithms(workload, algorithms=DEFAULT_ALGORITHMS, quantum=None, workers=1, record_schedule=True):
+    #roda cada algoritmo na mesma carga ja lida e devolve os resultados na ordem pedida.
+    #workers=1 roda um depois do outro aqui mesmo; mais que isso usa um pool de processos,
+    #com a carga mandada uma vez so p/ cada processo (igual ao sweep.py)
+    algorithms = check_algorithms(algorithms)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(algorithms)))
+
+    if workers == 1:
+        return [run_algorithm(workload, name, quantum, record_schedule) for name in algorithms]
+
+    #o pool so eh importado aqui: carregar multiprocessing atrasa toda execucao que nao usa
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(workload,)
+    ) as executor:
+        count = len(algorithms)
+        return list(
+            executor.map(_run_in_worker, algorithms, [quantum] * count, [record_schedule] * count)
+        )
+
+
+def comparison_table(results):
+    #(titulo, [valor de cada algoritmo]) p/ cada linha de METRIC_ROWS, valores ja formatados
+    return [
+        (title, [_format_value(value(result)) for result in results])
+        for title, value in METRIC_ROWS
+    ]
+
+
+def format_comparison(results):
+    width = max([len(result["algorithm"]) for result in results] + [10]) + 2
+    lines = [f"{'Métrica':<22}" + "".join(f"{result['algorithm']:>{width}}" for result in results)]
+    for title, cells in comparison_table(results):
+        lines.append(f"{title:<22}" + "".join(f"{cell:>{width}}" for cell in cells))
+    return "\n".join(lines)
+
+
+def _format_value(value):
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
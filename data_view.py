@@ -0,0 +1,112 @@
+from metrics import task_metrics
+
+#colunas da tabela de dados: (chave, titulo, se muda durante a simulacao)
+COLUMNS = (
+    ("id", "ID da Tarefa", False),
+    ("color", "Cor", False),
+    ("arrival", "Ingresso (Tick)", False),
+    ("duration", "Duração", False),
+    ("priority", "Prioridade", False),
+    ("remaining", "Restante", True),
+    ("status", "Estado", True),
+    ("start", "Início", True),
+    ("finish", "Fim", True),
+    ("turnaround", "Turnaround", True),
+    ("waiting", "Espera", True),
+)
+COLUMN_KEYS = tuple(key for key, _, _ in COLUMNS)
+RUNTIME_COLUMNS = frozenset(key for key, _, runtime in COLUMNS if runtime)
+
+
+def task_row(task):
+    #valores de uma tarefa na ordem de COLUMNS (None = ainda nao tem, ex: fim de quem nao terminou)
+    values = task_metrics(task)
+    return (
+        task.task_id,
+        task.color,
+        task.arrival_time,
+        task.duration,
+        task.priority,
+        task.remaining_time,
+        task.status,
+        None if task.start_time == -1 else task.start_time,
+        None if task.finish_time == -1 else task.finish_time,
+        values["turnaround"],
+        task.waiting_time,
+    )
+
+
+class TaskDataModel:
+    #o que a tabela de dados mostra: uma ordem (indices em tasks) ja ordenada e filtrada.
+    #a janela so pede as linhas que vai exibir (rows), entao abrir a tabela nao depende do
+    #tamanho do arquivo. as ordenacoes das colunas que nao mudam (as do arquivo) ficam
+    #guardadas; as de tempo de execucao sao refeitas a cada pedido, com os valores do momento
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.sort_column = None
+        self.descending = False
+        self.filter_text = ""
+        self._static_orders = {} #coluna -> indices ordenados (crescente)
+        self._search_keys = None #"id cor" em minusculas, montado no primeiro filtro
+        self.order = range(len(tasks))
+
+    def __len__(self):
+        return len(self.order)
+
+    def _sorted(self, column, descending=False):
+        index = COLUMN_KEYS.index(column)
+        if column in RUNTIME_COLUMNS:
+            #None (ainda nao tem, ex: fim de quem nao terminou) fica no fim nos dois sentidos:
+            #so quem tem valor eh ordenado (e invertido)
+            values = [task_row(task)[index] for task in self.tasks]
+            filled = sorted((i for i in range(len(values)) if values[i] is not None), key=values.__getitem__)
+            if descending:
+                filled.reverse()
+            return filled + [i for i in range(len(values)) if values[i] is None]
+        order = self._static_orders.get(column)
+        if order is None:
+            getter = {
+                "id": lambda task: task.task_id,
+                "color": lambda task: task.color,
+                "arrival": lambda task: task.arrival_time,
+                "duration": lambda task: task.duration,
+                "priority": lambda task: task.priority,
+            }[column]
+            values = [getter(task) for task in self.tasks]
+            order = sorted(range(len(values)), key=values.__getitem__)
+            self._static_orders[column] = order
+        return order[::-1] if descending else order
+
+    def _matches(self):
+        if self._search_keys is None:
+            self._search_keys = [f"{task.task_id} {task.color}".lower() for task in self.tasks]
+        text = self.filter_text.lower()
+        return [text in key for key in self._search_keys]
+
+    def refresh(self):
+        #refaz a ordem com a coluna/sentido/filtro atuais
+        if self.sort_column:
+            order = self._sorted(self.sort_column, self.descending)
+        else:
+            order = range(len(self.tasks))[::-1] if self.descending else range(len(self.tasks))
+        if self.filter_text:
+            matches = self._matches()
+            order = [i for i in order if matches[i]]
+        self.order = order
+
+    def sort_by(self, column):
+        #clicar de novo na mesma coluna inverte o sentido
+        if column == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+        self.refresh()
+
+    def set_filter(self, text):
+        self.filter_text = text.strip()
+        self.refresh()
+
+    def rows(self, start, count):
+        #(indice da tarefa, valores) das linhas start ate start+count da ordem atual
+        return [(i, task_row(self.tasks[i])) for i in self.order[start:start + count]]
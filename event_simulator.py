@@ -0,0 +1,79 @@
+from fifo_fast import can_use_closed_form, run_closed_form
+from simulator import Simulator, append_interval
+
+
+class EventSimulator(Simulator):
+    #motor orientado a eventos: em vez de andar de 1 em 1 tick, pula direto
+    #p/ o proximo ponto onde algo pode mudar (chegada, termino, preempcao ou E/S).
+    #usa o mesmo carregamento e a mesma decisao (_dispatch) do Simulator,
+    #entao o resultado bate tick a tick com o motor antigo
+
+    def _next_arrival_time(self):
+        #proximo tick em que alguem chega ou acorda da E/S (None se nao tem mais ninguem)
+        next_arrival = self.arrivals.peek_time()
+        next_wake = self.blocked.next_expiry()
+        if next_wake is None:
+            return next_arrival
+        if next_arrival is None:
+            return next_wake
+        return min(next_arrival, next_wake)
+
+    def step(self):
+        #avanca ate o proximo evento e devolve o intervalo (tarefa, inicio, fim)
+        #tarefa None = cpu ociosa no intervalo. devolve None quando acabou
+        if self._is_simulation_complete():
+            self.trace.completed(self.global_tick)
+            return None
+
+        self._check_for_new_arrivals()
+        self._dispatch()
+
+        start = self.global_tick
+        next_arrival = self._next_arrival_time()
+
+        if self.running_task is None:
+            if next_arrival is None: #sobrou tarefa que nunca vai chegar, igual o tick ficaria preso
+                return None
+            self.trace.idle(start, next_arrival)
+            if self.schedule is not None:
+                self.schedule.record(None, start, next_arrival)
+            self.metrics.on_idle(next_arrival - start)
+            self.global_tick = next_arrival
+            return (None, start, next_arrival)
+
+        task = self.running_task
+        #tarefa com duracao 0 ainda gasta 1 tick, igual no tick()
+        end = start + max(task.remaining_time, 1)
+        if next_arrival is not None:
+            end = min(end, next_arrival)
+        horizon = self.scheduler.decision_horizon(self.ready_queue, task)
+        if horizon is not None:
+            end = min(end, start + horizon)
+        until_io = self._ticks_until_io(task)
+        if until_io is not None:
+            end = min(end, start + until_io)
+
+        self.trace.ran(task, start, end)
+        task.remaining_time -= end - start
+        if self.schedule is not None:
+            self.schedule.record(task, start, end) #pedacos seguidos da mesma tarefa viram um intervalo so
+        self.metrics.on_run(end - start)
+        if self._leave_cpu(task, end): #terminou ou foi p/ E/S
+            self.running_task = None
+
+        self.global_tick = end
+        return (task, start, end)
+
+    def run(self, collect=True):
+        #roda tudo e devolve a lista de intervalos ja juntando os pedacos seguidos da mesma tarefa.
+        #fifo sem E/S e sem rastro detalhado nem precisa simular: sai da conta fechada (fifo_fast.py)
+        if can_use_closed_form(self):
+            return run_closed_form(self, collect)
+        intervals = []
+        while True:
+            interval = self.step()
+            if interval is None:
+                return intervals
+            if collect:
+                append_interval(intervals, *interval)
+
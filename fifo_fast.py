@@ -0,0 +1,126 @@
+from array import array
+from itertools import accumulate
+
+from arrivals import ArrivalIndex, TableArrivalIndex
+from schedule import REASON_FINISHED
+from scheduler import FifoScheduler
+from task_table import STATUS_CODES
+from trace_sinks import VERBOSITY_SUMMARY
+
+#fifo sem E/S nunca preempta nem bloqueia: as tarefas rodam na ordem de chegada, cada uma
+#assim que a cpu fica livre. entao nao precisa simular, da p/ calcular tudo de uma vez:
+#  custo_i = max(duracao_i, 1) (duracao 0 ainda gasta 1 tick, igual no tick())
+#  fim_i = max(chegada_i, fim_i-1) + custo_i
+#com P_i = soma dos custos ate i, fim_i - P_i = max(chegada_j - P_j-1 p/ j <= i), ou seja
+#fim = soma acumulada + maximo acumulado, e inicio = fim - custo
+
+#numpy eh opcional e so vale a pena em carga grande: importar ele custa mais que a conta
+#inteira em python puro p/ umas milhares de tarefas, e toda execucao em lote pagaria isso
+NUMPY_MIN_TASKS = 20000
+_numpy = [] #[modulo ou None] depois da primeira tentativa de importar
+
+
+def _load_numpy():
+    if not _numpy:
+        try:
+            import numpy
+        except ImportError: #sem ele a mesma conta roda em python puro
+            numpy = None
+        _numpy.append(numpy)
+    return _numpy[0]
+
+
+def fifo_times(arrivals, durations):
+    #arrivals/durations na ordem de atendimento (por chegada); devolve (inicios, fins) em listas
+    numpy = _load_numpy() if len(arrivals) >= NUMPY_MIN_TASKS else None
+    if numpy is not None:
+        arrival = numpy.asarray(arrivals, dtype=numpy.int64)
+        cost = numpy.maximum(numpy.asarray(durations, dtype=numpy.int64), 1)
+        total = numpy.cumsum(cost)
+        finish = total + numpy.maximum.accumulate(arrival - (total - cost))
+        return (finish - cost).tolist(), finish.tolist()
+    cost = [max(duration, 1) for duration in durations]
+    total = list(accumulate(cost))
+    offset = accumulate((a - t + c for a, t, c in zip(arrivals, total, cost)), max)
+    finish = [t + o for t, o in zip(total, offset)]
+    return [f - c for f, c in zip(finish, cost)], finish
+
+
+def can_use_closed_form(simulator):
+    #so do zero, com fifo, sem E/S, com todas as tarefas ja carregadas (nao em fluxo) e sem
+    #rastro de eventos/ticks (o atalho nao passa por cada evento p/ avisar o rastro)
+    if not isinstance(simulator.scheduler, FifoScheduler):
+        return False
+    if simulator.trace.verbosity > VERBOSITY_SUMMARY:
+        return False
+    if simulator.global_tick != 0 or simulator.running_task is not None:
+        return False
+    if simulator.ready_queue or simulator.blocked:
+        return False
+    if simulator.task_table is not None:
+        return isinstance(simulator.arrivals, TableArrivalIndex) and not simulator.task_table.io_events
+    if not isinstance(simulator.arrivals, ArrivalIndex):
+        return False
+    return not any(task.io_events for task in simulator.original_task_list)
+
+
+def run_closed_form(simulator, collect=True):
+    #deixa o simulador no mesmo estado em que o run() do motor de eventos deixaria (tarefas,
+    #metricas, escala, tick) e devolve os mesmos intervalos
+    tasks = list(simulator.arrivals) #ordem estavel por chegada = ordem de atendimento
+    arrivals = [task.arrival_time for task in tasks]
+    durations = [task.duration for task in tasks]
+    starts, finishes = fifo_times(arrivals, durations)
+
+    if simulator.task_table is not None:
+        _fill_table(simulator.task_table, tasks, starts, finishes)
+    else:
+        for task, start, finish in zip(tasks, starts, finishes):
+            task.start_time = start
+            task.finish_time = finish
+            task.waiting_time = start - task.arrival_time
+            task.remaining_time = task.duration - (finish - start)
+            task.status = "TERMINADO"
+    simulator.arrivals.seek(len(tasks))
+
+    metrics = simulator.metrics
+    schedule = simulator.schedule
+    intervals = []
+    previous = 0
+    for task, arrival, start, finish in zip(tasks, arrivals, starts, finishes):
+        if start > previous: #cpu ociosa ate essa tarefa chegar
+            metrics.on_idle(start - previous)
+            if schedule is not None:
+                schedule.record(None, previous, start)
+            if collect:
+                intervals.append((None, previous, start))
+        metrics.on_dispatch(task, start)
+        metrics.on_run(finish - start)
+        metrics.on_finish(task, finish)
+        if schedule is not None:
+            schedule.record(task, start, finish)
+            schedule.close(REASON_FINISHED)
+        if collect:
+            intervals.append((task, start, finish))
+        previous = finish
+
+    simulator.global_tick = previous
+    simulator.trace.completed(previous)
+    return intervals
+
+
+def _fill_table(table, tasks, starts, finishes):
+    #modo compacto: escreve as colunas de uma vez (na ordem das linhas da tabela)
+    size = len(table)
+    start_column = array("q", [-1]) * size
+    finish_column = array("q", [-1]) * size
+    for task, start, finish in zip(tasks, starts, finishes):
+        start_column[task.index] = start
+        finish_column[task.index] = finish
+    table.start = start_column
+    table.finish = finish_column
+    table.waited = array("q", [s - a for s, a in zip(start_column, table.arrival)])
+    table.remaining = array(
+        "q", [d - (f - s) for d, s, f in zip(table.duration, start_column, finish_column)]
+    )
+    table.state = array("b", [STATUS_CODES["TERMINADO"]]) * size
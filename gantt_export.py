@@ -0,0 +1,208 @@
+import math
+import os
+import sys
+from html import escape
+
+from gantt_view import DEFAULT_ZOOM, MIN_LABEL_SPACING, ZOOM_LEVELS, GanttViewport, lane_bars, nice_step
+from schedule import Schedule
+
+#desenho direto da escala gravada p/ arquivo (png ou svg), sem janela e sem captura de tela.
+#grafico maior que MAX_TILE_* vira varios arquivos (ladrilhos): ARQ_001.png, ARQ_002.png...
+#numerados por faixa de tempo e, dentro dela, por faixa de tarefas
+MAX_TILE_WIDTH = 8000
+MAX_TILE_HEIGHT = 8000
+LEFT, TOP, ROW_HEIGHT, ROW_GAP, MARGIN = 90, 50, 24, 4, 20
+FORMATS = (".png", ".svg")
+
+#cores do tema claro da janela
+LIGHT_COLORS = {"background": "#F8F9F9", "text": "#060607", "axes": "#5C6773"}
+
+
+def nearest_zoom(pixels_per_tick):
+    #nivel de zoom (indice em ZOOM_LEVELS) mais perto de tantos pixels por tick
+    return min(
+        range(len(ZOOM_LEVELS)),
+        key=lambda i: abs(math.log(ZOOM_LEVELS[i]) - math.log(pixels_per_tick)),
+    )
+
+
+class _SvgImage:
+    def __init__(self, width, height, background):
+        self.width, self.height = width, height
+        self.parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}" font-family="Segoe UI, sans-serif" font-size="11">',
+            f'<rect width="{width}" height="{height}" fill="{background}"/>',
+        ]
+
+    def rect(self, x0, y0, x1, y1, fill):
+        self.parts.append(
+            f'<rect x="{x0}" y="{y0}" width="{x1 - x0}" height="{y1 - y0}" fill="{escape(fill)}"/>'
+        )
+
+    def line(self, x0, y0, x1, y1, color, width=1):
+        self.parts.append(
+            f'<line x1="{x0}" y1="{y0}" x2="{x1}" y2="{y1}" stroke="{color}" stroke-width="{width}"/>'
+        )
+
+    def text(self, x, y, text, color, anchor="middle"):
+        self.parts.append(
+            f'<text x="{x}" y="{y}" fill="{color}" text-anchor="{anchor}" '
+            f'dominant-baseline="middle">{escape(str(text))}</text>'
+        )
+
+    def save(self, path):
+        self.parts.append("</svg>")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.parts))
+
+
+class _PngImage:
+    #pillow so eh importado aqui, p/ exportar svg (e rodar o resto) sem ele instalado
+    def __init__(self, width, height, background):
+        from PIL import Image, ImageColor, ImageDraw
+
+        self._color = ImageColor.getrgb
+        self.image = Image.new("RGB", (width, height), self._rgb(background))
+        self.draw = ImageDraw.Draw(self.image)
+
+    def _rgb(self, color):
+        try:
+            return self._color(color)
+        except ValueError: #cor que so o tk conhece
+            return (128, 128, 128)
+
+    def rect(self, x0, y0, x1, y1, fill):
+        self.draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=self._rgb(fill))
+
+    def line(self, x0, y0, x1, y1, color, width=1):
+        self.draw.line((x0, y0, x1, y1), fill=self._rgb(color), width=width)
+
+    def text(self, x, y, text, color, anchor="middle"):
+        anchors = {"middle": "mm", "end": "rm", "start": "lm"}
+        self.draw.text((x, y), str(text), fill=self._rgb(color), anchor=anchors[anchor])
+
+    def save(self, path):
+        self.image.save(path)
+
+
+def _tile_paths(path, count):
+    if count == 1:
+        return [path]
+    base, extension = os.path.splitext(path)
+    return [f"{base}_{i + 1:03d}{extension}" for i in range(count)]
+
+
+def export_gantt(
+    schedule,
+    path,
+    zoom=DEFAULT_ZOOM,
+    rows=None,
+    colors=None,
+    tile_width=MAX_TILE_WIDTH,
+    tile_height=MAX_TILE_HEIGHT,
+):
+    #desenha a escala inteira em path (.png ou .svg) e devolve os arquivos gravados.
+    #rows = {id da tarefa: linha} p/ usar a mesma ordem da janela (padrao: ordem em que
+    #apareceram na escala); colors = cores de fundo/texto/eixos (padrao: tema claro)
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"formato de imagem não suportado: {extension!r} (use .png ou .svg)")
+    image_class = _PngImage if extension == ".png" else _SvgImage
+    colors = dict(LIGHT_COLORS, **(colors or {}))
+    labels = schedule.labels
+    if rows is None:
+        rows = {}
+        for task_id, _ in labels:
+            rows.setdefault(task_id, len(rows))
+    row_names = {row: task_id for task_id, row in rows.items()}
+
+    view = GanttViewport(LEFT, TOP, ROW_HEIGHT, ROW_GAP, zoom)
+    end_tick = max(schedule.end_tick, 1)
+    ticks_per_tile = max(int((tile_width - LEFT - MARGIN) / view.pixels_per_tick), 1)
+    rows_per_tile = max((tile_height - TOP - MARGIN) // view.row_pitch, 1)
+    total_rows = max(len(rows), 1)
+    tiles = [
+        (first_tick, first_row)
+        for first_tick in range(0, end_tick, ticks_per_tile)
+        for first_row in range(0, total_rows, rows_per_tile)
+    ]
+
+    paths = _tile_paths(path, len(tiles))
+    for (first_tick, first_row), tile_path in zip(tiles, paths):
+        last_tick = min(first_tick + ticks_per_tile, end_tick)
+        row_count = min(rows_per_tile, total_rows - first_row)
+        width = LEFT + int(math.ceil((last_tick - first_tick) * view.pixels_per_tick)) + MARGIN
+        height = TOP + row_count * view.row_pitch + MARGIN
+        #a janela do viewport vira exatamente o ladrilho
+        view.resize(width - MARGIN, TOP + row_count * view.row_pitch - 1)
+        view.first_tick, view.first_row = first_tick, first_row
+        image = image_class(width, height, colors["background"])
+        _draw_axes(image, view, first_tick, last_tick, row_count, colors, row_names)
+        for row, x0, x1, number in view.bars(schedule, row_names.get, last_tick):
+            y0 = view.row_to_y(row)
+            image.rect(x0, y0, x1, y0 + ROW_HEIGHT, labels[number][1])
+        image.save(tile_path)
+    return paths
+
+
+def _draw_axes(image, view, first_tick, last_tick, row_count, colors, row_names):
+    axis_y = TOP - 15
+    right = view.tick_to_x(last_tick)
+    image.line(LEFT, axis_y, right, axis_y, colors["axes"])
+    image.line(LEFT, axis_y, LEFT, TOP + row_count * view.row_pitch, colors["axes"])
+    label_step = view.label_step()
+    mark_step = 1 if view.pixels_per_tick >= 5 else max(label_step // 5, 1)
+    for tick in range(first_tick - first_tick % mark_step, last_tick + 1, mark_step):
+        if tick < first_tick:
+            continue
+        x = view.tick_to_x(tick)
+        image.line(x, axis_y - 4, x, axis_y + 4, colors["axes"])
+        if tick % label_step == 0:
+            image.text(x, axis_y - 14, tick, colors["axes"])
+    for row in range(view.first_row, view.first_row + row_count):
+        name = row_names.get(row)
+        if name is not None:
+            image.text(LEFT - 8, view.row_to_y(row) + ROW_HEIGHT // 2, name, colors["text"], "end")
+
+
+def export_lanes(lanes, path, pixels_per_tick, colors=None, max_width=MAX_TILE_WIDTH):
+    #faixas empilhadas no mesmo eixo do tempo, uma por escala (ex: uma por algoritmo na
+    #comparacao), cada uma com todas as tarefas na mesma linha. lanes = [(nome, escala)].
+    #sai sempre num arquivo so: se nao cabe em max_width, o tempo encolhe ate caber
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"formato de imagem não suportado: {extension!r} (use .png ou .svg)")
+    image_class = _PngImage if extension == ".png" else _SvgImage
+    colors = dict(LIGHT_COLORS, **(colors or {}))
+    end_tick = max([schedule.end_tick for _, schedule in lanes] + [1])
+    pixels_per_tick = min(pixels_per_tick, (max_width - LEFT - MARGIN) / end_tick)
+    pitch = ROW_HEIGHT + ROW_GAP
+    right = LEFT + int(math.ceil(end_tick * pixels_per_tick))
+    image = image_class(right + MARGIN, TOP + len(lanes) * pitch + MARGIN, colors["background"])
+
+    axis_y = TOP - 15
+    image.line(LEFT, axis_y, right, axis_y, colors["axes"])
+    image.line(LEFT, axis_y, LEFT, TOP + len(lanes) * pitch, colors["axes"])
+    label_step = nice_step(MIN_LABEL_SPACING / pixels_per_tick)
+    for tick in range(0, end_tick + 1, label_step):
+        x = LEFT + int(tick * pixels_per_tick)
+        image.line(x, axis_y - 4, x, axis_y + 4, colors["axes"])
+        image.text(x, axis_y - 14, tick, colors["axes"])
+    for lane, (name, schedule) in enumerate(lanes):
+        y0 = TOP + lane * pitch
+        image.text(LEFT - 8, y0 + ROW_HEIGHT // 2, name, colors["text"], "end")
+        for x0, x1, number in lane_bars(schedule, pixels_per_tick):
+            image.rect(LEFT + x0, y0, LEFT + x1, y0 + ROW_HEIGHT, schedule.labels[number][1])
+    image.save(path)
+    return [path]
+
+
+if __name__ == "__main__":
+    #escala ja gravada (cli.py --schedule) p/ imagem: python gantt_export.py ESCALA saida.svg [px/tick]
+    if len(sys.argv) < 3:
+        print("uso: python gantt_export.py ESCALA SAIDA.png|SAIDA.svg [PIXELS_POR_TICK]")
+        sys.exit(2)
+    zoom = nearest_zoom(float(sys.argv[3])) if len(sys.argv) > 3 else DEFAULT_ZOOM
+    for written in export_gantt(Schedule.load(sys.argv[1]), sys.argv[2], zoom=zoom):
+        print(written)
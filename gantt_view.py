@@ -0,0 +1,249 @@
+from array import array
+from bisect import bisect_left, bisect_right
+import math
+
+from schedule import IDLE
+
+#zoom em pixels por tick: do mais perto (um tick bem largo) ate mil ticks num pixel so
+ZOOM_LEVELS = (60, 30, 15, 8, 4, 2, 1, 0.5, 0.2, 0.1, 0.05, 0.02, 0.01, 0.005, 0.002, 0.001)
+DEFAULT_ZOOM = 1 #30 px por tick, o tamanho de sempre
+#distancia minima (px) entre dois numeros do eixo do tempo
+MIN_LABEL_SPACING = 50
+
+
+def nice_step(minimum):
+    #menor passo "redondo" (1, 2, 5, 10, 20, 50...) que seja >= minimum
+    if minimum <= 1:
+        return 1
+    power = 10 ** int(math.floor(math.log10(minimum)))
+    for factor in (1, 2, 5, 10):
+        if factor * power >= minimum:
+            return factor * power
+    return 10 * power
+
+
+class TaskIntervals:
+    #intervalos de uma tarefa (posicao na escala, inicio, fim, numero) e, p/ cada largura de
+    #coluna (ticks por pixel), os retangulos ja juntados: intervalos na mesma coluna ou em
+    #colunas encostadas viram um so. os retangulos so sao montados p/ o zoom que alguem pediu
+    #e depois so crescem com o que entrou na escala
+    __slots__ = ("positions", "starts", "ends", "numbers", "runs")
+
+    def __init__(self):
+        self.positions = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.numbers = array("i")
+        self.runs = {} #ticks por coluna -> [coluna inicial, coluna final, primeiro intervalo, quantos ja juntou]
+
+    def columns(self, width):
+        runs = self.runs.get(width)
+        if runs is None:
+            runs = self.runs[width] = [array("q"), array("q"), array("q"), 0]
+        first_columns, last_columns, firsts, done = runs
+        starts, ends = self.starts, self.ends
+        #o ultimo ja juntado passa de novo: ele eh o intervalo aberto e pode ter esticado
+        for i in range(max(done - 1, 0), len(starts)):
+            first_column = starts[i] // width
+            last_column = (ends[i] - 1) // width + 1
+            if last_columns and first_column <= last_columns[-1]:
+                if last_column > last_columns[-1]:
+                    last_columns[-1] = last_column
+            else:
+                first_columns.append(first_column)
+                last_columns.append(last_column)
+                firsts.append(i)
+        runs[3] = len(starts)
+        return runs
+
+    def cut(self, position):
+        #escala truncada: fica so o que vinha antes da posicao (e o ultimo pode ter encolhido)
+        count = bisect_left(self.positions, position)
+        del self.positions[count:], self.starts[count:], self.ends[count:], self.numbers[count:]
+        for width, runs in self.runs.items():
+            if runs[3] < count: #nem tinha chegado no corte, continua de onde parou
+                continue
+            k = bisect_left(runs[2], count)
+            del runs[0][k:], runs[1][k:], runs[2][k:]
+            if runs[2]: #o retangulo que sobrou termina no fim do ultimo intervalo dele
+                runs[1][-1] = (self.ends[count - 1] - 1) // width + 1
+            runs[3] = count
+
+
+class ScheduleIndex:
+    #os intervalos da escala separados por tarefa, acompanhando a escala enquanto ela cresce:
+    #cada sync so indexa o que entrou depois do ultimo, e um truncate (voltar no tempo) so
+    #desfaz o que foi cortado
+    def __init__(self, schedule):
+        self.schedule = schedule
+        self.tasks = {} #id da tarefa -> TaskIntervals
+        self._indexed = 0 #intervalos da escala ja indexados
+        self._truncations = 0 #cortes da escala ja vistos
+
+    def sync(self):
+        schedule = self.schedule
+        tasks, labels, ends = schedule.tasks, schedule.labels, schedule.ends
+        cuts = schedule.truncations
+        cut = None
+        if len(cuts) > self._truncations:
+            cut = min(min(cuts[self._truncations:]), self._indexed)
+            self._truncations = len(cuts)
+            self._indexed = cut
+        last = self._indexed - 1
+        if last >= 0 and tasks[last] != IDLE:
+            #o ultimo intervalo eh o aberto: pode ter esticado (ou sido cortado) desde o sync anterior
+            intervals = self.tasks[labels[tasks[last]][0]]
+            k = bisect_right(intervals.positions, last) - 1
+            intervals.ends[k] = ends[last]
+        if cut is not None:
+            for intervals in self.tasks.values():
+                intervals.cut(cut)
+        for i in range(self._indexed, len(tasks)):
+            number = tasks[i]
+            if number == IDLE:
+                continue
+            task_id = labels[number][0]
+            intervals = self.tasks.get(task_id)
+            if intervals is None:
+                intervals = self.tasks[task_id] = TaskIntervals()
+            intervals.positions.append(i)
+            intervals.starts.append(schedule.starts[i])
+            intervals.ends.append(ends[i])
+            intervals.numbers.append(number)
+        self._indexed = len(tasks)
+
+
+class GanttViewport:
+    #janela visivel do grafico de gantt: qual faixa de ticks e quais linhas (tarefas) aparecem
+    #e em que zoom. a janela so desenha o que cai aqui dentro, lendo da escala gravada, entao
+    #o numero de itens no canvas depende do tamanho da tela e nao do tamanho da simulacao
+    def __init__(self, left, top, row_height, row_gap=5, zoom=DEFAULT_ZOOM):
+        self.left = left #onde comeca o tick first_tick (px)
+        self.top = top #onde comeca a linha first_row (px)
+        self.row_height = row_height
+        self.row_pitch = row_height + row_gap
+        self.zoom = zoom #indice em ZOOM_LEVELS
+        self.first_tick = 0
+        self.first_row = 0
+        self.width = 1 #tamanho do canvas (px), atualizado quando a janela muda
+        self.height = 1
+        self._index = None #ScheduleIndex da ultima escala desenhada
+
+    @property
+    def pixels_per_tick(self):
+        return ZOOM_LEVELS[self.zoom]
+
+    def resize(self, width, height):
+        self.width = max(width, 1)
+        self.height = max(height, 1)
+
+    def visible_ticks(self): #(primeiro, ultimo + 1) que aparecem, mesmo que pela metade
+        span = max(self.width - self.left, 1) / self.pixels_per_tick
+        return self.first_tick, self.first_tick + int(math.ceil(span))
+
+    def visible_rows(self):
+        count = max(self.height - self.top, 1) // self.row_pitch + 1
+        return self.first_row, self.first_row + count
+
+    def tick_to_x(self, tick):
+        return self.left + (tick - self.first_tick) * self.pixels_per_tick
+
+    def x_to_tick(self, x):
+        return self.first_tick + int((x - self.left) / self.pixels_per_tick)
+
+    def row_to_y(self, row):
+        return self.top + (row - self.first_row) * self.row_pitch
+
+    def scroll_to_tick(self, tick, total_ticks):
+        #segura a janela entre 0 e o fim da simulacao (com uma folga de meia tela)
+        start, end = self.visible_ticks()
+        span = end - start
+        self.first_tick = max(0, min(int(tick), max(total_ticks - span // 2, 0)))
+
+    def scroll_to_row(self, row, total_rows):
+        start, end = self.visible_rows()
+        self.first_row = max(0, min(int(row), max(total_rows - (end - start) + 1, 0)))
+
+    def follow(self, tick, total_ticks):
+        #se o tick atual saiu da tela (pela direita, ou pela esquerda depois de voltar no
+        #tempo), anda a janela p/ ele ficar a 3/4 da largura
+        start, end = self.visible_ticks()
+        if tick >= end or tick < start:
+            self.scroll_to_tick(tick - (end - start) * 3 // 4, total_ticks)
+
+    def set_zoom(self, zoom, anchor_x=None):
+        #troca o zoom mantendo parado o tick que esta embaixo de anchor_x (o mouse)
+        zoom = max(0, min(zoom, len(ZOOM_LEVELS) - 1))
+        if anchor_x is None:
+            anchor_x = self.left
+        anchor_tick = self.first_tick + (anchor_x - self.left) / self.pixels_per_tick
+        self.zoom = zoom
+        self.first_tick = max(0, int(anchor_tick - (anchor_x - self.left) / self.pixels_per_tick))
+
+    def label_step(self): #de quantos em quantos ticks vai numero no eixo
+        return nice_step(MIN_LABEL_SPACING / self.pixels_per_tick)
+
+    def bars(self, schedule, task_at_row, end_tick=None):
+        #retangulos (linha, x0, x1, numero da tarefa) do que rodou na janela visivel.
+        #task_at_row(linha) = id da tarefa naquela linha (ou None). cada pixel eh uma coluna
+        #de ticks e o que cai em colunas seguidas da mesma linha vira um retangulo so, ja juntado
+        #no indice da escala; aqui so sai a busca binaria do primeiro retangulo de cada linha,
+        #entao o custo depende de quantos retangulos aparecem e nao do tamanho da escala
+        if self._index is None or self._index.schedule is not schedule:
+            self._index = ScheduleIndex(schedule)
+        self._index.sync()
+        start, end = self.visible_ticks()
+        if end_tick is not None:
+            end = min(end, end_tick)
+        if end <= start:
+            return []
+        row_start, row_end = self.visible_rows()
+        first = self.first_tick
+        ppt = self.pixels_per_tick
+        left = self.left
+        width = max(int(round(1 / ppt)), 1) #ticks por coluna
+        result = []
+        for row in range(row_start, row_end):
+            task_id = task_at_row(row)
+            intervals = self._index.tasks.get(task_id) if task_id is not None else None
+            if intervals is None:
+                continue
+            first_columns, last_columns, firsts, _ = intervals.columns(width)
+            starts, ends, numbers = intervals.starts, intervals.ends, intervals.numbers
+            k = bisect_right(last_columns, start // width)
+            while k < len(firsts) and starts[firsts[k]] < end:
+                last_column = last_columns[k]
+                if last_column * width > end:
+                    #corta no fim: so conta o que comecou antes dele
+                    i = bisect_left(starts, end) - 1
+                    last_column = (min(ends[i], end) - 1) // width + 1
+                x0 = left + int((max(first_columns[k] * width, start) - first) * ppt)
+                x1 = max(left + int((min(last_column * width, end) - first) * ppt), x0 + 1)
+                result.append([row, x0, x1, numbers[firsts[k]]])
+                k += 1
+        return result
+
+
+def lane_bars(schedule, pixels_per_tick, end_tick=None):
+    #retangulos (x0, x1, numero da tarefa) da escala inteira numa faixa so (todas as tarefas
+    #na mesma linha, como nas faixas da comparacao de algoritmos), x contado a partir do tick 0.
+    #pixel ja pintado nao eh pintado de novo, entao sao no maximo (largura) retangulos
+    end = schedule.end_tick if end_tick is None else min(end_tick, schedule.end_tick)
+    starts, ends, tasks = schedule.starts, schedule.ends, schedule.tasks
+    result = []
+    i = 0
+    while i < len(starts) and starts[i] < end:
+        number = tasks[i]
+        if number >= 0:
+            x0 = int(starts[i] * pixels_per_tick)
+            x1 = max(int(min(ends[i], end) * pixels_per_tick), x0 + 1)
+            last = result[-1] if result else None
+            if last is not None and x0 <= last[1] and (number == last[2] or x0 < last[1]):
+                if number == last[2]:
+                    last[1] = max(last[1], x1)
+                elif x1 > last[1]:
+                    result.append([last[1], x1, number])
+            else:
+                result.append([x0, x1, number])
+        i += 1
+    return result
@@ -0,0 +1,227 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+from event_simulator import EventSimulator
+from simulator import Simulator
+from trace_sinks import VERBOSITY_EVENTS, NullSink, TraceSink
+from workload_gen import SHAPES, write_workload
+
+#regressao por escala "de ouro": cada carga roda em cada algoritmo no motor de referencia
+#(Simulator.tick, o mesmo da janela) e a sequencia de intervalos + inicio/fim de cada tarefa
+#vira um hash guardado em golden/. os motores otimizados tem que dar exatamente a mesma coisa;
+#quando nao dao, sai o primeiro tick em que discordam da referencia
+#relativos ao proprio arquivo, p/ rodar de qualquer pasta
+HERE = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(HERE, "golden")
+SAMPLES_DIR = os.path.join(HERE, "testes_exemplos")
+SAMPLES = os.path.join(SAMPLES_DIR, "*.txt")
+ALGORITHMS = ("FIFO", "SRTF", "PRIOP", "RR")
+REFERENCE = "tick"
+
+#cargas geradas (workload_gen, semente fixa): tamanho pequeno o bastante p/ a referencia
+#tick a tick rodar tudo em poucos segundos
+GENERATED = {"burst": 200, "sparse": 200, "long": 8, "short": 300, "io": 100}
+
+#motor -> (classe, opcoes, rastro). o rastro de eventos sem saida nenhuma (TraceSink base)
+#desliga o atalho do fifo (fifo_fast.py), p/ o laco de eventos tambem ser conferido com fifo
+ENGINES = {
+    "tick": (Simulator, {}, NullSink),
+    "event": (EventSimulator, {}, NullSink),
+    "event-loop": (EventSimulator, {}, lambda: TraceSink(verbosity=VERBOSITY_EVENTS)),
+    "compact": (EventSimulator, {"compact": True}, NullSink),
+}
+
+
+def run_case(path, algorithm_name, engine):
+    #(intervalos, tempos por tarefa, ultimo tick) de uma carga num algoritmo e num motor.
+    #intervalos = [(id ou None se ociosa, inicio, fim)], pedacos seguidos da mesma tarefa juntos
+    engine_class, options, trace = ENGINES[engine]
+    simulator = engine_class(path, trace=trace(), record_schedule=False, **options)
+    simulator.restart(algorithm_name=algorithm_name)
+    runs = []
+    for task, start, end in simulator.run():
+        task_id = None if task is None else task.task_id
+        if runs and runs[-1][0] == task_id and runs[-1][2] == start:
+            runs[-1] = (task_id, runs[-1][1], end)
+        else:
+            runs.append((task_id, start, end))
+    times = [(task.task_id, task.start_time, task.finish_time) for task in simulator.original_task_list]
+    return runs, times, simulator.global_tick
+
+
+def _digest(values):
+    #hash que nao depende de versao do python nem de plataforma (json com separadores fixos)
+    text = json.dumps(values, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def fingerprint(result):
+    runs, times, ticks = result
+    return {"ticks": ticks, "intervals": _digest(runs), "tasks": _digest(times)}
+
+
+def first_difference(expected, actual):
+    #primeiro tick em que as duas sequencias de intervalos mostram coisas diferentes na cpu.
+    #as duas cobrem [0, fim) sem buraco (a ociosidade tambem eh intervalo); None se sao iguais
+    i = j = 0
+    tick = 0
+    while i < len(expected) and j < len(actual):
+        if expected[i][0] != actual[j][0]:
+            return tick
+        tick = min(expected[i][2], actual[j][2])
+        if expected[i][2] == tick:
+            i += 1
+        if actual[j][2] == tick:
+            j += 1
+    if i < len(expected) or j < len(actual): #uma acabou antes da outra
+        return tick
+    return None
+
+
+def _running_at(runs, tick):
+    for task_id, start, end in runs:
+        if start <= tick < end:
+            return task_id if task_id is not None else "(ociosa)"
+    return "(fim)"
+
+
+def describe_difference(reference, result, engine):
+    #texto curto de onde o motor saiu da referencia
+    runs, times, ticks = result
+    tick = first_difference(reference[0], runs)
+    if tick is not None:
+        return (
+            f"primeiro tick diferente: {tick} "
+            f"({REFERENCE}: {_running_at(reference[0], tick)}, {engine}: {_running_at(runs, tick)})"
+        )
+    for expected, actual in zip(reference[1], times):
+        if expected != actual:
+            return (
+                f"tarefa {expected[0]}: {REFERENCE} início/fim {expected[1]}/{expected[2]}, "
+                f"{engine} {actual[1]}/{actual[2]}"
+            )
+    return f"fim em {ticks} ({REFERENCE}: {reference[2]})"
+
+
+def workloads(directory):
+    #(nome, arquivo) de cada exemplo e de cada carga gerada (gravada em directory)
+    result = [
+        (os.path.splitext(os.path.basename(path))[0], path) for path in sorted(glob.glob(SAMPLES))
+    ]
+    for shape in SHAPES:
+        count = GENERATED.get(shape)
+        if count:
+            path = write_workload(os.path.join(directory, f"{shape}.txt"), shape, count)
+            result.append((f"gerado-{shape}-{count}", path))
+    return result
+
+
+def _golden_path(name):
+    return os.path.join(GOLDEN_DIR, f"{name}.json")
+
+
+def load_golden(name):
+    try:
+        with open(_golden_path(name), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_golden(name, source, cases):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(_golden_path(name), "w", encoding="utf-8", newline="\n") as f:
+        json.dump({"source": source, "cases": cases}, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def check(engines, algorithms, update=False, verbose=False):
+    #devolve quantos problemas achou (0 = tudo igual ao golden e a referencia)
+    problems = 0
+    cases = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for name, path in workloads(directory):
+            golden = load_golden(name)
+            if os.path.dirname(path) == SAMPLES_DIR:
+                source = f"testes_exemplos/{os.path.basename(path)}"
+            else:
+                source = f"workload_gen {name}"
+            stored = {} if golden is None else golden["cases"]
+            fresh = {}
+            for algorithm_name in algorithms:
+                cases += 1
+                reference = run_case(path, algorithm_name, REFERENCE)
+                fresh[algorithm_name] = fingerprint(reference)
+                label = f"{name} {algorithm_name}"
+                if not update:
+                    expected = stored.get(algorithm_name)
+                    if expected is None:
+                        problems += 1
+                        print(f"SEM GOLDEN  {label} (rode com --update)")
+                    elif expected != fresh[algorithm_name]:
+                        problems += 1
+                        print(f"MUDOU       {label}: a referência ({REFERENCE}) não bate mais com {_golden_path(name)}")
+                for engine in engines:
+                    if engine == REFERENCE:
+                        continue
+                    result = run_case(path, algorithm_name, engine)
+                    if result != reference:
+                        problems += 1
+                        print(f"DIFERENTE   {label} [{engine}]: {describe_difference(reference, result, engine)}")
+                    elif verbose:
+                        print(f"ok          {label} [{engine}]")
+            if update:
+                save_golden(name, source, dict(stored, **fresh))
+    return cases, problems
+
+
+def _split_list(text):
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Confere se os motores otimizados dão a mesma escala que a referência tick a tick "
+        "e que a referência continua igual aos arquivos em golden/."
+    )
+    parser.add_argument(
+        "--engines",
+        type=_split_list,
+        default=list(ENGINES),
+        help=f"motores a conferir (padrão: {','.join(ENGINES)})",
+    )
+    parser.add_argument(
+        "--algorithms",
+        type=lambda text: [name.upper() for name in _split_list(text)],
+        default=list(ALGORITHMS),
+        help=f"algoritmos (padrão: {','.join(ALGORITHMS)})",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="regrava golden/ com o resultado atual da referência (só quando a mudança de escala é de propósito)",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="mostra também os casos que bateram")
+    args = parser.parse_args(argv)
+    unknown = [engine for engine in args.engines if engine not in ENGINES]
+    if unknown:
+        parser.error(f"motor desconhecido: {', '.join(unknown)} (use {', '.join(ENGINES)})")
+
+    started = time.perf_counter()
+    cases, problems = check(args.engines, args.algorithms, args.update, args.verbose)
+    elapsed = time.perf_counter() - started
+    if args.update:
+        print(f"{cases} caso(s) gravados em {GOLDEN_DIR} em {elapsed:.1f}s")
+        return 1 if problems else 0
+    print(f"{cases} caso(s), {problems} problema(s) em {elapsed:.1f}s")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,20 @@
 import sys
 import os
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk, ImageGrab
+from tkinter import ttk, filedialog, messagebox, simpledialog
 from simulator import Simulator
-import webbrowser
+from checkpoint import Checkpointer
+from compare import DEFAULT_ALGORITHMS, compare_algorithms, comparison_table
+from gantt_export import export_gantt
+from gantt_view import GanttViewport, lane_bars, nice_step
+from playback import PlaybackWorker
+from data_view import COLUMNS, TaskDataModel, task_row
+from metrics import format_summary, task_metrics
+from profiling import Profiler
+from trace_sinks import NullSink
+from workload import Workload
 
 THEMES = {
     "dark": {
@@ -30,6 +40,21 @@ THEMES = {
 }
 
 TICK_WIDTH, BAR_HEIGHT, Y_OFFSET, X_OFFSET = 30, 40, 70, 60
+# velocidades do "Executar Tudo" em ticks por segundo (0 = o mais rapido possivel)
+SPEEDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000, 0)
+DEFAULT_SPEED = 2 # 5 ticks/s, o passo de 200 ms de antes
+FRAME_MS = 16 # ~60 quadros por segundo
+# legenda: cada tarefa ocupa uma celula, em linhas que quebram na largura da janela
+LEGEND_ITEM_WIDTH, LEGEND_ROW_HEIGHT, LEGEND_ROWS = 120, 26, 2
+# tabela de dados: quantas linhas entram por vez conforme rola, e de quanto em quanto
+# tempo (ms) as colunas de execucao visiveis sao atualizadas
+DATA_PAGE, DATA_REFRESH_MS = 200, 500
+# comparacao: altura e espaco de cada faixa (um algoritmo por faixa) e margem esquerda dos nomes
+LANE_HEIGHT, LANE_GAP, LANE_LEFT = 30, 8, 70
+# painel de desempenho: de quanto em quanto tempo (ms) a tabela de fases eh atualizada
+PROFILE_REFRESH_MS = 500
+# metodos da janela medidos junto com os do simulador quando o perfil esta ligado
+GUI_PHASES = (("_show_ticks", "gui_ticks"), ("_render_gantt", "draw_gantt"), ("_render_legend", "draw_legend"))
 HEADER_HEIGHT, FOOTER_HEIGHT, CANVAS_PADDING_Y = 60, 80, 10
 
 
@@ -85,25 +110,50 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def load_image(relative_path, height):
+    #decodifica uma imagem do programa ja na altura pedida. o pillow so eh importado aqui;
+    #sem ele o proprio tk le o png e reduz por um fator inteiro (fica um pouco maior)
+    path = resource_path(relative_path)
+    try:
+        from PIL import Image, ImageTk
+    except ImportError:
+        image = tk.PhotoImage(file=path)
+        return image.subsample(max(image.height() // height, 1))
+    image = Image.open(path)
+    width = int(height / image.height * image.width)
+    return ImageTk.PhotoImage(image.resize((width, height), Image.Resampling.LANCZOS))
+
+
 class AppGUI:
     def __init__(self, master):
         self.master = master
         self.simulator = None
+        self.config_path = None # arquivo carregado, p/ a comparacao ler a carga de novo uma vez so
+        self.checkpoints = None #historico p/ voltar passo / ir p/ um tick
+        self.profiler = None # so existe com a medicao de desempenho ligada (painel "Desempenho")
         self.is_running = False
         self.task_y_positions = {}
+        self.task_rows = [] # id da tarefa de cada linha do gantt (o inverso de task_y_positions)
+        self.gantt_drawn = None # o que esta desenhado no gantt agora, p/ nao refazer igual
+        # janela visivel do gantt (faixa de ticks, linhas e zoom); so o que cai nela eh desenhado
+        self.viewport = GanttViewport(X_OFFSET, Y_OFFSET, BAR_HEIGHT)
+        self.follow_tick = True # anda a janela junto com a simulacao
+        # no "Executar Tudo" a simulacao roda numa thread na frente do desenho; display_tick
+        # eh ate onde a janela ja mostrou e render_lock protege a escala enquanto desenha
+        self.playback = None
+        self.display_tick = 0
+        self.render_lock = threading.Lock()
+        self._tick_budget = 0.0
+        self._last_frame = 0.0
         self.is_dark_theme = tk.BooleanVar(value=False)
 
-        self.github_icon_light_tk = None
-        self.github_icon_dark_tk = None
-        self.book_icon_tk = None
-        self.logo_tk = None
+        # icones e logo so sao decodificados depois que a janela aparece (_load_icons), e o
+        # do github so na cor do tema em uso; ficam aqui p/ o tk nao jogar a imagem fora
+        self.icons = {}
+        self.icons_loaded = False
 
         self.base_title = "Simulador Interativo de Escalonamento de Processos"
         master.title(self.base_title)
-        try:
-            master.iconbitmap(resource_path('icone_janela.ico'))
-        except Exception as e:
-            print(f"Aviso: Não foi possível carregar o ícone da janela: {e}")
         master.geometry("1200x800")
         master.resizable(True, True)
         self.style = ttk.Style(master)
@@ -123,6 +173,7 @@ class AppGUI:
 
         self.legend_frame = ttk.Frame(self.main_content_frame, padding=(10, 5))
         self.legend_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+        self._setup_legend()
 
         self.footer_frame = ttk.Frame(self.master, height=FOOTER_HEIGHT)
         self.footer_frame.pack(side=tk.BOTTOM, fill=tk.X, expand=False)
@@ -130,6 +181,7 @@ class AppGUI:
         self._setup_widgets()
         self._setup_footer()
         self._apply_theme()
+        master.after_idle(self._load_icons)
 
     def _apply_theme(self):
         theme = "dark" if self.is_dark_theme.get() else "light"
@@ -168,14 +220,9 @@ class AppGUI:
             background=colors["header_footer"], foreground=colors["text"]
         )
 
-    
-        if hasattr(self, 'legend_frame'):
-            for child in self.legend_frame.winfo_children():
-                 if isinstance(child, ttk.Frame): 
-                     for widget in child.winfo_children():
-                         if isinstance(widget, ttk.Label) and widget.winfo_class() == 'TLabel':
-                             self.style.configure("Legend.TLabel", background=colors["header_footer"], foreground=colors["text"])
-                             widget.configure(style="Legend.TLabel") 
+        if hasattr(self, 'legend_canvas'):
+            self.legend_canvas.configure(bg=colors["header_footer"])
+            self._render_legend()
 
         self.style.configure(
             "Treeview",
@@ -200,10 +247,7 @@ class AppGUI:
 
         if hasattr(self, "github_icon_label"):
             self.github_icon_label.configure(bg=colors["header_footer"])
-            if self.is_dark_theme.get():
-                self.github_icon_label.config(image=self.github_icon_light_tk)
-            else:
-                self.github_icon_label.config(image=self.github_icon_dark_tk)
+            self._update_github_icon()
 
         if hasattr(self, "book_icon_label"):
             self.book_icon_label.configure(bg=colors["header_footer"])
@@ -217,7 +261,7 @@ class AppGUI:
 
     
     def _redraw_canvas_elements(self):
-        self._draw_axes()
+        self._render_gantt() # refaz eixos e barras com as cores do tema novo
        
 
 
@@ -236,37 +280,16 @@ class AppGUI:
         right_empty_frame = ttk.Frame(self.header_frame, style="Header.TFrame")
         right_empty_frame.grid(row=0, column=2, sticky="nse")
 
-        try:
-            img_light = Image.open(resource_path("github-mark-white.png")).resize(
-                (32, 32), Image.Resampling.LANCZOS
-            )
-            img_dark = Image.open(resource_path("github-mark.png")).resize(
-                (32, 32), Image.Resampling.LANCZOS
-            )
-            self.github_icon_light_tk = ImageTk.PhotoImage(img_light)
-            self.github_icon_dark_tk = ImageTk.PhotoImage(img_dark)
-            self.github_icon_label = tk.Label(left_icons_frame, cursor="hand2")
-            self.github_icon_label.image = self.github_icon_dark_tk
-            self.github_icon_label.pack(side=tk.LEFT, padx=10, pady=10)
-            self.github_icon_label.bind("<Button-1>", self._open_github_link)
-            Tooltip(self.github_icon_label, "Abre o perfil do desenvolvedor no GitHub")
-        except Exception as e:
-            print(f"Erro ao carregar ícones do GitHub: {e}")
+        # as imagens entram depois, em _load_icons
+        self.github_icon_label = tk.Label(left_icons_frame, cursor="hand2")
+        self.github_icon_label.pack(side=tk.LEFT, padx=10, pady=10)
+        self.github_icon_label.bind("<Button-1>", self._open_github_link)
+        Tooltip(self.github_icon_label, "Abre o perfil do desenvolvedor no GitHub")
 
-        try:
-            img_book = Image.open(resource_path("todos.png")).resize(
-                (32, 32), Image.Resampling.LANCZOS
-            )
-            photo_book = ImageTk.PhotoImage(img_book)
-            self.book_icon_label = tk.Label(
-                left_icons_frame, image=photo_book, cursor="hand2"
-            )
-            self.book_icon_label.image = photo_book
-            self.book_icon_label.pack(side=tk.LEFT, padx=10, pady=10)
-            self.book_icon_label.bind("<Button-1>", self._open_book_link)
-            Tooltip(self.book_icon_label, "Abrir PDF de referência sobre escalonamento")
-        except Exception as e:
-            print(f"Erro ao carregar ícone do livro: {e}")
+        self.book_icon_label = tk.Label(left_icons_frame, cursor="hand2")
+        self.book_icon_label.pack(side=tk.LEFT, padx=10, pady=10)
+        self.book_icon_label.bind("<Button-1>", self._open_book_link)
+        Tooltip(self.book_icon_label, "Abrir PDF de referência sobre escalonamento")
 
         header_text = "Ferramenta para Simulação e Análise Visual de Algoritmos de Escalonamento de Processos"
         self.header_label = ttk.Label(
@@ -300,6 +323,49 @@ class AppGUI:
             "Mostra os dados de entrada do arquivo de simulação carregado",
         )
 
+        self.btn_metrics = ttk.Button(
+            button_container,
+            text="Métricas",
+            command=self._show_metrics_dialog,
+            state="disabled",
+        )
+        self.btn_metrics.pack(side=tk.LEFT, padx=5)
+        Tooltip(
+            self.btn_metrics,
+            "Mostra turnaround, espera, resposta, uso da CPU e trocas de contexto até o tick atual",
+        )
+
+        self.btn_compare = ttk.Button(
+            button_container,
+            text="Comparar Algoritmos",
+            command=self._show_compare_dialog,
+            state="disabled",
+        )
+        self.btn_compare.pack(side=tk.LEFT, padx=5)
+        Tooltip(
+            self.btn_compare,
+            "Roda vários algoritmos na mesma carga e mostra os gráficos e as métricas lado a lado",
+        )
+
+        self.btn_profile = ttk.Button(
+            button_container,
+            text="Desempenho",
+            command=self._show_profile_dialog,
+        )
+        self.btn_profile.pack(side=tk.LEFT, padx=5)
+        Tooltip(
+            self.btn_profile,
+            "Mede quanto tempo cada fase da simulação e do desenho está levando",
+        )
+
+        self.btn_step_back = ttk.Button(
+            button_container,
+            text="Voltar Passo",
+            command=self._step_back_clicked,
+            state="disabled",
+        )
+        self.btn_step_back.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.btn_step_back, "Volta a simulação um tick")
         self.btn_next_step = ttk.Button(
             button_container,
             text="Próximo Passo",
@@ -316,6 +382,14 @@ class AppGUI:
         )
         self.btn_run_all.pack(side=tk.LEFT, padx=5)
         Tooltip(self.btn_run_all, "Inicia ou para a execução automática da simulação")
+        self.btn_goto = ttk.Button(
+            button_container,
+            text="Ir para Tick...",
+            command=self._goto_tick_clicked,
+            state="disabled",
+        )
+        self.btn_goto.pack(side=tk.LEFT, padx=5)
+        Tooltip(self.btn_goto, "Pula a simulação para um tick qualquer, para frente ou para trás")
         self.btn_save = ttk.Button(
             button_container,
             text="Salvar Imagem",
@@ -323,7 +397,30 @@ class AppGUI:
             state="disabled",
         )
         self.btn_save.pack(side=tk.LEFT, padx=5)
-        Tooltip(self.btn_save, "Salva o gráfico de Gantt atual como uma imagem PNG")
+        Tooltip(self.btn_save, "Salva o gráfico de Gantt inteiro como imagem PNG ou SVG")
+        self.btn_zoom_out = ttk.Button(
+            button_container, text="−", width=3, command=lambda: self._zoom(1)
+        )
+        self.btn_zoom_out.pack(side=tk.LEFT, padx=(15, 2))
+        Tooltip(self.btn_zoom_out, "Diminui o zoom (mais ticks por tela)")
+        self.btn_zoom_in = ttk.Button(
+            button_container, text="+", width=3, command=lambda: self._zoom(-1)
+        )
+        self.btn_zoom_in.pack(side=tk.LEFT, padx=2)
+        Tooltip(self.btn_zoom_in, "Aumenta o zoom (Ctrl + roda do mouse também)")
+
+        speed_frame = ttk.Frame(self.control_frame)
+        speed_frame.pack(side=tk.LEFT, padx=10)
+        self.lbl_speed = ttk.Label(speed_frame, font=("Segoe UI", 9))
+        self.lbl_speed.pack(side=tk.TOP)
+        self.speed_scale = ttk.Scale(
+            speed_frame, from_=0, to=len(SPEEDS) - 1, orient=tk.HORIZONTAL,
+            length=140, command=self._speed_changed,
+        )
+        self.speed_scale.set(DEFAULT_SPEED)
+        self._speed_changed(DEFAULT_SPEED)
+        self.speed_scale.pack(side=tk.TOP)
+        Tooltip(self.speed_scale, "Velocidade do Executar Tudo, de 1 tick/s até o máximo")
 
         self.lbl_tick = ttk.Label(
             self.control_frame, text="Tick: --", font=("Segoe UI", 12)
@@ -333,19 +430,26 @@ class AppGUI:
             self.control_frame, text="Algoritmo: --", font=("Segoe UI", 12)
         )
         self.lbl_algorithm.pack(side=tk.RIGHT, padx=20)
-        self.canvas = tk.Canvas(
-            self.canvas_frame, scrollregion=(0, 0, 5000, 2000), highlightthickness=0
-        )
-        hbar = ttk.Scrollbar(
-            self.canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview
+        self.canvas = tk.Canvas(self.canvas_frame, highlightthickness=0)
+        # as barras de rolagem mexem na janela visivel (viewport), nao num canvas gigante
+        self.hbar = ttk.Scrollbar(
+            self.canvas_frame, orient=tk.HORIZONTAL, command=self._on_hscroll
         )
-        hbar.pack(side=tk.BOTTOM, fill=tk.X)
-        vbar = ttk.Scrollbar(
-            self.canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview
+        self.hbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.vbar = ttk.Scrollbar(
+            self.canvas_frame, orient=tk.VERTICAL, command=self._on_vscroll
         )
-        vbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.config(xscrollcommand=hbar.set, yscrollcommand=vbar.set)
+        self.vbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.canvas.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+        # roda do mouse rola no tempo, shift+roda nas tarefas, ctrl+roda da zoom
+        self.canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.canvas.bind("<Shift-MouseWheel>", self._on_mouse_wheel)
+        self.canvas.bind("<Control-MouseWheel>", self._on_mouse_wheel)
+        for button in ("4", "5"): # linux manda a roda como botao 4/5
+            self.canvas.bind(f"<Button-{button}>", self._on_mouse_wheel)
+            self.canvas.bind(f"<Shift-Button-{button}>", self._on_mouse_wheel)
+            self.canvas.bind(f"<Control-Button-{button}>", self._on_mouse_wheel)
 
     def _setup_footer(self):
         left_footer = ttk.Frame(self.footer_frame, style="Footer.TFrame")
@@ -365,18 +469,9 @@ class AppGUI:
         center_content = ttk.Frame(center_footer, style="Footer.TFrame")
         center_content.pack(expand=True)
 
-        logo_path = resource_path("logo_utf.png")
-        if os.path.exists(logo_path):
-            try:
-                logo_image = Image.open(logo_path)
-                h, w = 50, int((50 / logo_image.height) * logo_image.width)
-                logo_image = logo_image.resize((w, h), Image.Resampling.LANCZOS)
-                self.logo_tk = ImageTk.PhotoImage(logo_image)
-                self.logo_label = tk.Label(center_content, image=self.logo_tk)
-                self.logo_label.image = self.logo_tk
-                self.logo_label.pack(side=tk.LEFT, padx=10, pady=5)
-            except Exception as e:
-                print(f"Erro ao carregar a logo: {e}")
+        if os.path.exists(resource_path("logo_utf.png")):
+            self.logo_label = tk.Label(center_content) # a logo entra em _load_icons
+            self.logo_label.pack(side=tk.LEFT, padx=10, pady=5)
 
         footer_text = (
             "Simulador de Escalonamento v1.5 | 2025 Vinicius Wandembruck | Licença MIT"
@@ -392,11 +487,51 @@ class AppGUI:
         self.btn_about.pack(expand=True, padx=10)
         Tooltip(self.btn_about, "Exibe informações sobre o projeto e referências")
 
+    def _icon(self, relative_path, height):
+        # decodifica na primeira vez que alguem pede e guarda (None se nao deu p/ ler)
+        key = (relative_path, height)
+        if key not in self.icons:
+            try:
+                self.icons[key] = load_image(relative_path, height)
+            except Exception as e:
+                print(f"Erro ao carregar a imagem {relative_path}: {e}")
+                self.icons[key] = None
+        return self.icons[key]
+
+    def _load_icons(self):
+        # roda quando a janela ja esta na tela: nada disso atrasa ela abrir
+        try:
+            self.master.iconbitmap(resource_path('icone_janela.ico'))
+        except Exception as e:
+            print(f"Aviso: Não foi possível carregar o ícone da janela: {e}")
+        book = self._icon("todos.png", 32)
+        if book is not None:
+            self.book_icon_label.config(image=book)
+        if getattr(self, "logo_label", None) is not None:
+            logo = self._icon("logo_utf.png", 50)
+            if logo is not None:
+                self.logo_label.config(image=logo)
+        self.icons_loaded = True
+        self._update_github_icon()
+
+    def _update_github_icon(self):
+        # icone claro no tema escuro e vice-versa; o outro so eh lido se trocar de tema
+        if not self.icons_loaded:
+            return
+        name = "github-mark-white.png" if self.is_dark_theme.get() else "github-mark.png"
+        icon = self._icon(name, 32)
+        if icon is not None:
+            self.github_icon_label.config(image=icon)
+
     def _open_github_link(self, event=None):
+        import webbrowser # so carrega quando alguem clica
+
         url = "https://github.com/KureishiDev"
         webbrowser.open_new_tab(url)
 
     def _open_book_link(self, event=None):
+        import webbrowser
+
         url = (
             "https://wiki.inf.ufpr.br/maziero/lib/exe/fetch.php?media=socm:socm-06.pdf"
         )
@@ -436,7 +571,7 @@ class AppGUI:
 
         data_window = tk.Toplevel(self.master)
         data_window.title("Dados do Arquivo de Simulação")
-        data_window.geometry("650x400")
+        data_window.geometry("1100x480")
         data_window.transient(self.master)
         data_window.grab_set()
 
@@ -450,51 +585,415 @@ class AppGUI:
         info_text = f"Algoritmo: {self.simulator.scheduling_algorithm_name}   |   Quantum: {self.simulator.quantum}"
         ttk.Label(top_frame, text=info_text, font=("Segoe UI", 12, "bold")).pack()
 
+        filter_frame = ttk.Frame(data_window, padding=(10, 5, 10, 0))
+        filter_frame.pack(fill="x")
+        ttk.Label(filter_frame, text="Filtrar (ID ou cor):").pack(side=tk.LEFT)
+        filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_frame, textvariable=filter_var, width=30)
+        filter_entry.pack(side=tk.LEFT, padx=5)
+        count_label = ttk.Label(filter_frame)
+        count_label.pack(side=tk.RIGHT)
+
         table_frame = ttk.Frame(data_window, padding=(10, 10, 10, 5))
         table_frame.pack(expand=True, fill="both")
 
-        columns = ("id", "color", "arrival", "duration", "priority")
+        # a tabela so recebe as linhas conforme rola (DATA_PAGE por vez); ordenar e filtrar
+        # usam o TaskDataModel, que ja tem a ordem pronta, e recomecam do topo
+        model = TaskDataModel(self.simulator.original_task_list)
+        columns = tuple(key for key, _, _ in COLUMNS)
         tree = ttk.Treeview(
             table_frame, columns=columns, show="headings", style="Treeview"
         )
+        for key, title, _ in COLUMNS:
+            tree.heading(key, text=title, command=lambda key=key: sort_by(key))
+            tree.column(key, width=95, anchor=tk.CENTER)
+        loaded = [0]
+
+        def show(values):
+            return tuple("-" if value is None else value for value in values)
+
+        def load_more():
+            for index, values in model.rows(loaded[0], DATA_PAGE):
+                tree.insert("", tk.END, iid=str(index), values=show(values))
+            loaded[0] = min(loaded[0] + DATA_PAGE, len(model))
+            count_label.config(text=f"{len(model)} de {len(model.tasks)} tarefas")
+
+        def reload():
+            tree.delete(*tree.get_children())
+            loaded[0] = 0
+            load_more()
+            for key, title, _ in COLUMNS:
+                arrow = ""
+                if key == model.sort_column:
+                    arrow = " ▼" if model.descending else " ▲"
+                tree.heading(key, text=title + arrow)
+
+        def sort_by(key):
+            model.sort_by(key)
+            reload()
+
+        pending_filter = [None]
+
+        def apply_filter():
+            pending_filter[0] = None
+            model.set_filter(filter_var.get())
+            reload()
+
+        def filter_changed(event=None):
+            # espera parar de digitar um pouco antes de refiltrar
+            if pending_filter[0] is not None:
+                data_window.after_cancel(pending_filter[0])
+            pending_filter[0] = data_window.after(250, apply_filter)
+
+        filter_entry.bind("<KeyRelease>", filter_changed)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) > 0.9 and loaded[0] < len(model):
+                load_more()
+
+        def refresh_visible():
+            # so as linhas que estao na tela: restante, estado, inicio, fim... vao mudando
+            if not data_window.winfo_exists():
+                return
+            item = tree.identify_row(5)
+            height = tree.winfo_height()
+            while item and tree.bbox(item) and tree.bbox(item)[1] < height:
+                task = model.tasks[int(item)]
+                tree.item(item, values=show(task_row(task)))
+                item = tree.next(item)
+            data_window.after(DATA_REFRESH_MS, refresh_visible)
 
-        tree.heading("id", text="ID da Tarefa")
-        tree.heading("color", text="Cor")
-        tree.heading("arrival", text="Ingresso (Tick)")
-        tree.heading("duration", text="Duração")
-        tree.heading("priority", text="Prioridade")
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=on_scroll)
+
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        load_more()
+        data_window.after(DATA_REFRESH_MS, refresh_visible)
+
+        button_frame = ttk.Frame(data_window, padding=(10, 5, 10, 10))
+        button_frame.pack(fill="x")
+        ok_button = ttk.Button(
+            button_frame, text="OK", command=data_window.destroy, style="TButton"
+        )
+        ok_button.pack()
 
-        tree.column("id", width=100, anchor=tk.CENTER)
-        tree.column("color", width=100, anchor=tk.CENTER)
-        tree.column("arrival", width=110, anchor=tk.CENTER)
-        tree.column("duration", width=100, anchor=tk.CENTER)
-        tree.column("priority", width=100, anchor=tk.CENTER)
+    def _show_metrics_dialog(self):
+        if not self.simulator:
+            messagebox.showinfo("Informação", "Nenhum dado de simulação carregado.")
+            return
+        self._stop_playback() # as metricas tem que ser as do tick que esta na tela
+
+        metrics_window = tk.Toplevel(self.master)
+        metrics_window.title("Métricas da Simulação")
+        metrics_window.geometry("760x480")
+        metrics_window.transient(self.master)
+        metrics_window.grab_set()
+
+        theme = "dark" if self.is_dark_theme.get() else "light"
+        colors = THEMES[theme]
+        metrics_window.configure(bg=colors["background"])
+
+        top_frame = ttk.Frame(metrics_window, padding=(10, 10, 10, 0))
+        top_frame.pack(fill="x")
+
+        #o coletor ja tem tudo atualizado, so formata (vale no meio da simulacao tambem)
+        summary_text = (
+            f"Algoritmo: {self.simulator.scheduling_algorithm_name}   |   Tick: {self.simulator.global_tick}\n\n"
+            + format_summary(self.simulator.metrics.summary())
+        )
+        ttk.Label(
+            top_frame, text=summary_text, font=("Consolas", 10), justify=tk.LEFT
+        ).pack(anchor="w")
+
+        table_frame = ttk.Frame(metrics_window, padding=(10, 10, 10, 5))
+        table_frame.pack(expand=True, fill="both")
+
+        columns = ("id", "start", "finish", "turnaround", "waiting", "response")
+        tree = ttk.Treeview(
+            table_frame, columns=columns, show="headings", style="Treeview"
+        )
+        tree.heading("id", text="ID da Tarefa")
+        tree.heading("start", text="Início")
+        tree.heading("finish", text="Fim")
+        tree.heading("turnaround", text="Turnaround")
+        tree.heading("waiting", text="Espera")
+        tree.heading("response", text="Resposta")
+        for column in columns:
+            tree.column(column, width=110, anchor=tk.CENTER)
 
         for task in self.simulator.original_task_list:
+            values = task_metrics(task)
             tree.insert(
                 "",
                 tk.END,
-                values=(
-                    task.task_id,
-                    task.color,
-                    task.arrival_time,
-                    task.duration,
-                    task.priority,
+                values=tuple(
+                    "-" if values[key] is None or values[key] == -1 else values[key]
+                    for key in ("task", "start", "finish", "turnaround", "waiting", "response")
                 ),
             )
 
         scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
         tree.configure(yscroll=scrollbar.set)
-
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        button_frame = ttk.Frame(data_window, padding=(10, 5, 10, 10))
+        button_frame = ttk.Frame(metrics_window, padding=(10, 5, 10, 10))
         button_frame.pack(fill="x")
-        ok_button = ttk.Button(
-            button_frame, text="OK", command=data_window.destroy, style="TButton"
+        ttk.Button(
+            button_frame, text="OK", command=metrics_window.destroy, style="TButton"
+        ).pack()
+
+    def _show_compare_dialog(self):
+        if not self.config_path:
+            messagebox.showinfo("Informação", "Nenhum dado de simulação carregado.")
+            return
+
+        compare_window = tk.Toplevel(self.master)
+        compare_window.title("Comparar Algoritmos")
+        compare_window.geometry("1000x600")
+        compare_window.transient(self.master)
+
+        theme = "dark" if self.is_dark_theme.get() else "light"
+        colors = THEMES[theme]
+        compare_window.configure(bg=colors["background"])
+
+        top_frame = ttk.Frame(compare_window, padding=(10, 10, 10, 0))
+        top_frame.pack(fill="x")
+        ttk.Label(top_frame, text="Algoritmos:", font=("Segoe UI", 11, "bold")).pack(side=tk.LEFT)
+        selected = {}
+        for name in DEFAULT_ALGORITHMS:
+            selected[name] = tk.BooleanVar(value=True)
+            tk.Checkbutton(
+                top_frame, text=name, variable=selected[name],
+                bg=colors["background"], fg=colors["text"],
+                selectcolor=colors["canvas_bg"], activebackground=colors["background"],
+            ).pack(side=tk.LEFT, padx=5)
+        run_button = ttk.Button(top_frame, text="Comparar", command=lambda: run())
+        run_button.pack(side=tk.LEFT, padx=10)
+        status_label = ttk.Label(top_frame)
+        status_label.pack(side=tk.RIGHT)
+
+        # uma faixa por algoritmo, todas no mesmo eixo do tempo, encolhido p/ caber na largura
+        lanes_canvas = tk.Canvas(
+            compare_window, height=220, highlightthickness=0, bg=colors["canvas_bg"]
         )
-        ok_button.pack()
+        lanes_canvas.pack(fill="x", padx=10, pady=10)
+
+        table_frame = ttk.Frame(compare_window, padding=(10, 0, 10, 5))
+        table_frame.pack(expand=True, fill="both")
+        tree = ttk.Treeview(table_frame, show="headings", style="Treeview")
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        button_frame = ttk.Frame(compare_window, padding=(10, 5, 10, 10))
+        button_frame.pack(fill="x")
+        ttk.Button(
+            button_frame, text="OK", command=compare_window.destroy, style="TButton"
+        ).pack()
+
+        # a carga eh lida uma vez so (na primeira comparacao) e cada algoritmo roda nas suas
+        # proprias tarefas; a simulacao vai numa thread p/ a janela nao travar
+        state = {"workload": None, "results": [], "done": None}
+
+        def draw_lanes(event=None):
+            lanes_canvas.delete("all")
+            results = state["results"]
+            if not results:
+                return
+            axis_color = colors["text_axes"]
+            width = lanes_canvas.winfo_width()
+            end_tick = max([result["schedule"].end_tick for result in results] + [1])
+            pixels_per_tick = min(TICK_WIDTH, max(width - LANE_LEFT - 20, 1) / end_tick)
+            top = 40
+            right = LANE_LEFT + end_tick * pixels_per_tick
+            lanes_canvas.create_line(LANE_LEFT, top - 15, right, top - 15, fill=axis_color)
+            label_step = nice_step(50 / pixels_per_tick)
+            for tick in range(0, end_tick + 1, label_step):
+                x = LANE_LEFT + int(tick * pixels_per_tick)
+                lanes_canvas.create_line(x, top - 19, x, top - 11, fill=axis_color)
+                lanes_canvas.create_text(
+                    x, top - 28, text=str(tick), font=("Segoe UI", 8), fill=axis_color
+                )
+            for lane, result in enumerate(results):
+                y0 = top + lane * (LANE_HEIGHT + LANE_GAP)
+                lanes_canvas.create_text(
+                    LANE_LEFT - 8, y0 + LANE_HEIGHT // 2, text=result["algorithm"],
+                    anchor="e", fill=colors["text"], font=("Segoe UI", 9, "bold"),
+                )
+                labels = result["schedule"].labels
+                for x0, x1, number in lane_bars(result["schedule"], pixels_per_tick):
+                    lanes_canvas.create_rectangle(
+                        LANE_LEFT + x0, y0, LANE_LEFT + x1, y0 + LANE_HEIGHT,
+                        fill=labels[number][1], outline="",
+                    )
+            lanes_canvas.configure(height=top + len(results) * (LANE_HEIGHT + LANE_GAP) + 10)
+
+        def fill_table():
+            results = state["results"]
+            columns = ("metric",) + tuple(result["algorithm"] for result in results)
+            tree.delete(*tree.get_children())
+            tree.configure(columns=columns)
+            tree.heading("metric", text="Métrica")
+            tree.column("metric", width=180, anchor=tk.W)
+            for result in results:
+                tree.heading(result["algorithm"], text=result["algorithm"])
+                tree.column(result["algorithm"], width=110, anchor=tk.CENTER)
+            for title, cells in comparison_table(results):
+                tree.insert("", tk.END, values=(title, *cells))
+
+        def work(names):
+            try:
+                if state["workload"] is None:
+                    state["workload"] = Workload.load(self.config_path)
+                state["done"] = compare_algorithms(state["workload"], names)
+            except Exception as e:
+                state["done"] = e
+
+        def wait():
+            if not compare_window.winfo_exists():
+                return
+            if state["done"] is None:
+                compare_window.after(100, wait)
+                return
+            done, state["done"] = state["done"], None
+            run_button.config(state="normal")
+            if isinstance(done, Exception):
+                status_label.config(text="")
+                messagebox.showerror("Erro", f"Não foi possível comparar.\nDetalhe: {done}", parent=compare_window)
+                return
+            state["results"] = done
+            status_label.config(
+                text=f"{len(state['workload'])} tarefas | Quantum: {done[0]['quantum']}"
+            )
+            draw_lanes()
+            fill_table()
+
+        def run():
+            names = [name for name in DEFAULT_ALGORITHMS if selected[name].get()]
+            if not names:
+                messagebox.showwarning("Aviso", "Escolha pelo menos um algoritmo.", parent=compare_window)
+                return
+            run_button.config(state="disabled")
+            status_label.config(text="Simulando...")
+            threading.Thread(target=work, args=(names,), daemon=True).start()
+            wait()
+
+        lanes_canvas.bind("<Configure>", draw_lanes)
+        run()
+
+    def _attach_profiler(self):
+        # (re)coloca os embrulhos de medicao no simulador atual e nos desenhos da janela
+        self.profiler.detach()
+        if self.simulator is not None:
+            self.profiler.attach(self.simulator)
+        for name, phase in GUI_PHASES:
+            self.profiler.wrap(self, name, phase)
+
+    def _set_profiling(self, enabled):
+        self._stop_playback()
+        if enabled and self.profiler is None:
+            self.profiler = Profiler()
+            self._attach_profiler()
+        elif not enabled and self.profiler is not None:
+            self.profiler.detach()
+            self.profiler = None
+
+    def _show_profile_dialog(self):
+        profile_window = tk.Toplevel(self.master)
+        profile_window.title("Desempenho")
+        profile_window.geometry("820x480")
+        profile_window.transient(self.master)
+
+        theme = "dark" if self.is_dark_theme.get() else "light"
+        colors = THEMES[theme]
+        profile_window.configure(bg=colors["background"])
+
+        top_frame = ttk.Frame(profile_window, padding=(10, 10, 10, 0))
+        top_frame.pack(fill="x")
+        enabled = tk.BooleanVar(value=self.profiler is not None)
+        tk.Checkbutton(
+            top_frame, text="Medir desempenho", variable=enabled,
+            command=lambda: self._set_profiling(enabled.get()),
+            bg=colors["background"], fg=colors["text"],
+            selectcolor=colors["canvas_bg"], activebackground=colors["background"],
+        ).pack(side=tk.LEFT)
+        info_label = ttk.Label(top_frame, font=("Segoe UI", 9))
+        info_label.pack(side=tk.RIGHT)
+
+        table_frame = ttk.Frame(profile_window, padding=(10, 10, 10, 5))
+        table_frame.pack(expand=True, fill="both")
+        columns = ("calls", "total", "self", "mean")
+        tree = ttk.Treeview(table_frame, columns=columns, style="Treeview")
+        tree.heading("#0", text="Fase")
+        tree.column("#0", width=260, anchor=tk.W)
+        for key, title in zip(columns, ("Chamadas", "Total (ms)", "Próprio (ms)", "Média (us)")):
+            tree.heading(key, text=title)
+            tree.column(key, width=110, anchor=tk.CENTER)
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscroll=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        queue_label = ttk.Label(profile_window, font=("Consolas", 9), padding=(10, 0))
+        queue_label.pack(fill="x")
+
+        def refresh():
+            # a arvore segue os caminhos das fases (tick > dispatch > select...)
+            if not profile_window.winfo_exists():
+                return
+            profiler = self.profiler
+            if profiler is None:
+                info_label.config(text="Medição desligada")
+            else:
+                report = profiler.report(self.simulator)
+                for path, calls, total, own, mean in profiler.phase_rows():
+                    values = (calls, f"{total * 1000:.2f}", f"{own * 1000:.2f}", f"{mean:.2f}")
+                    if tree.exists(path):
+                        tree.item(path, values=values)
+                    else:
+                        parent = path.rpartition(";")[0]
+                        tree.insert(
+                            parent if tree.exists(parent) else "", tk.END, iid=path,
+                            text=path.rpartition(";")[2], values=values, open=True,
+                        )
+                histogram = ", ".join(
+                    f"{key}: {count}" for key, count in report["ready_queue_length"].items()
+                )
+                queue_label.config(text=f"Fila de prontos a cada despacho: {histogram or '-'}")
+                counters = report.get("counters")
+                if counters:
+                    info_label.config(
+                        text=f"Ticks: {counters['ticks']} | Ociosos: {counters['idle_ticks']} | "
+                        f"Preempções: {counters['preemptions']}"
+                    )
+            profile_window.after(PROFILE_REFRESH_MS, refresh)
+
+        def clear():
+            if self.profiler is not None:
+                self.profiler.reset()
+            tree.delete(*tree.get_children())
+
+        def save():
+            if self.profiler is None:
+                messagebox.showinfo("Informação", "Ligue a medição primeiro.", parent=profile_window)
+                return
+            path = filedialog.asksaveasfilename(
+                parent=profile_window,
+                defaultextension=".json",
+                filetypes=[("JSON", "*.json"), ("Pilhas dobradas (flamegraph)", "*.folded")],
+            )
+            if path:
+                self.profiler.save(path, self.simulator)
+
+        button_frame = ttk.Frame(profile_window, padding=(10, 5, 10, 10))
+        button_frame.pack(fill="x")
+        ttk.Button(button_frame, text="Zerar", command=clear).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Salvar...", command=save).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            button_frame, text="OK", command=profile_window.destroy, style="TButton"
+        ).pack(side=tk.RIGHT)
+        refresh()
 
     def _show_about_dialog(self):
         about_window = tk.Toplevel(self.master)
@@ -540,11 +1039,25 @@ class AppGUI:
         )
         if not file_path:
             return
+        self._stop_playback()
         self._reset_simulation_gui()
-        self.simulator = Simulator(file_path)
+        # a janela ja mostra tudo: sem rastro no console (imprimir cada tick segurava o "Executar Tudo")
+        self.simulator = Simulator(file_path, trace=NullSink())
+        self.config_path = file_path
+        if self.profiler is not None: # medicao ligada: passa a medir o simulador novo
+            self._attach_profiler()
+        self.checkpoints = Checkpointer(self.simulator)
+        if self.simulator.load_errors:
+            details = "\n".join(str(e) for e in self.simulator.load_errors[:10])
+            messagebox.showwarning(
+                "Aviso", f"Algumas linhas do arquivo foram ignoradas:\n{details}"
+            )
         self.btn_next_step.config(state="normal")
         self.btn_run_all.config(state="normal")
+        self.btn_goto.config(state="normal")
         self.btn_show_data.config(state="normal")
+        self.btn_metrics.config(state="normal")
+        self.btn_compare.config(state="normal")
         self.btn_save.config(state="disabled")
         filename = os.path.basename(file_path)
         self.master.title(f"{self.base_title} - [{filename}]")
@@ -553,71 +1066,80 @@ class AppGUI:
         self.lbl_algorithm.config(text=f"Algoritmo: {algo_name}")
 
         
-        for task in self.simulator.original_task_list:
-            if task.arrival_time == 0:
-                 if task.task_id not in self.task_y_positions:
-                     next_y_pos = len(self.task_y_positions)
-                     self.task_y_positions[task.task_id] = next_y_pos
-                 
-                 self._ensure_legend_item(task)
-                 self._draw_arrival_marker(0, task)
-
-        self.canvas.xview_moveto(0)
-        self.canvas.yview_moveto(0)
+        self.display_tick = 0
+        for task in self.simulator.arrivals.arriving_at(0):
+            self._ensure_task_row(task)
+        self._render_gantt()
 
 
     def _reset_simulation_gui(self):
         self.is_running = False
         self.task_y_positions = {}
+        self.task_rows = []
+        self.gantt_drawn = None
+        self.viewport.first_tick = self.viewport.first_row = 0
+        self.follow_tick = True
        
         if hasattr(self, 'canvas'):
             self.canvas.delete("all")
         
-        if hasattr(self, 'legend_frame'):
-            for widget in self.legend_frame.winfo_children():
-                widget.destroy()
+        self.legend_entries = []
+        self.legend_index = {}
+        self.legend_first_row = 0
+        self._render_legend()
 
-        self._draw_axes()
         self.btn_run_all.config(text="Executar Tudo", state="disabled") 
         self.btn_next_step.config(state="disabled") 
+        self.btn_step_back.config(state="disabled")
+        self.btn_goto.config(state="disabled")
         if hasattr(self, "btn_show_data"):
             self.btn_show_data.config(state="disabled")
+        if hasattr(self, "btn_metrics"):
+            self.btn_metrics.config(state="disabled")
+        if hasattr(self, "btn_compare"):
+            self.btn_compare.config(state="disabled")
         self.lbl_tick.config(text="Tick: --")
         self.lbl_algorithm.config(text="Algoritmo: --")
-
-        if hasattr(self, 'canvas'):
-            self.canvas.xview_moveto(0)
-            self.canvas.yview_moveto(0)
-            self.canvas.config(scrollregion=(0, 0, 5000, 2000)) 
+        self.simulator = None
+        self._render_gantt()
 
 
     def _draw_axes(self):
+        # eixo do tempo so da faixa visivel: o passo dos numeros acompanha o zoom
         self.canvas.delete("axes")
         theme = "dark" if self.is_dark_theme.get() else "light"
         colors = THEMES[theme]
         axis_color = colors["text_axes"]
+        view = self.viewport
+        width, height = view.width, view.height
 
         self.canvas.create_line(
-            X_OFFSET, Y_OFFSET - 20, 5000, Y_OFFSET - 20,
+            X_OFFSET, Y_OFFSET - 20, width, Y_OFFSET - 20,
             arrow=tk.LAST, fill=axis_color, tags="axes",
         )
         self.canvas.create_text(
-            X_OFFSET + 40, Y_OFFSET - 35, text="Tempo (ticks)",
+            X_OFFSET + 40, Y_OFFSET - 50, text="Tempo (ticks)",
             fill=axis_color, font=("Segoe UI", 9), tags="axes",
         )
-        for i in range(0, 151):
-            x = X_OFFSET + i * TICK_WIDTH
+        label_step = view.label_step()
+        # tracinho a cada tick de perto, e 5 por numero de longe
+        mark_step = 1 if view.pixels_per_tick >= 5 else max(label_step // 5, 1)
+        first, last = view.visible_ticks()
+        for i in range(first - first % mark_step, last + 1, mark_step):
+            x = view.tick_to_x(i)
+            if x < X_OFFSET:
+                continue
             self.canvas.create_line(
                 x, Y_OFFSET - 25, x, Y_OFFSET - 15, fill=axis_color, tags="axes"
             )
-            if i % 5 == 0:
+            if i % label_step == 0:
                 self.canvas.create_text(
                     x, Y_OFFSET - 35, text=str(i), font=("Segoe UI", 8),
                     fill=axis_color, tags="axes",
                 )
 
         self.canvas.create_line(
-            X_OFFSET, Y_OFFSET - 20, X_OFFSET, 2000,
+            X_OFFSET, Y_OFFSET - 20, X_OFFSET, height,
             arrow=tk.LAST, fill=axis_color, tags="axes",
         )
         self.canvas.create_text(
@@ -626,146 +1148,319 @@ class AppGUI:
         )
 
     
-    def _ensure_legend_item(self, task):
-        
-        legend_exists = any(
-            isinstance(w, ttk.Label) and w.cget("text") == f"- {task.task_id}"
-            for item_frame in self.legend_frame.winfo_children()
-            if isinstance(item_frame, ttk.Frame)
-            for w in item_frame.winfo_children()
+    def _setup_legend(self):
+        # legenda num canvas com rolagem: so as linhas visiveis viram itens, entao
+        # milhares de tarefas nao pesam na janela
+        self.legend_entries = [] # (id, cor) na ordem em que as tarefas apareceram
+        self.legend_index = {} # id -> posicao em legend_entries
+        self.legend_first_row = 0
+        self._legend_dirty = False
+        self.legend_canvas = tk.Canvas(
+            self.legend_frame, height=LEGEND_ROWS * LEGEND_ROW_HEIGHT, highlightthickness=0
         )
+        self.legend_bar = ttk.Scrollbar(
+            self.legend_frame, orient=tk.VERTICAL, command=self._on_legend_scroll
+        )
+        self.legend_bar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.legend_canvas.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.legend_canvas.bind("<Configure>", lambda event: self._render_legend())
+        self.legend_canvas.bind("<MouseWheel>", self._on_legend_wheel)
+        self.legend_canvas.bind("<Button-4>", self._on_legend_wheel)
+        self.legend_canvas.bind("<Button-5>", self._on_legend_wheel)
 
-        if not legend_exists:
-            theme = "dark" if self.is_dark_theme.get() else "light"
-            colors = THEMES[theme]
-
-            legend_item_frame = ttk.Frame(self.legend_frame, style='Legend.TFrame')
-            legend_item_frame.pack(side=tk.LEFT, padx=10)
-
-            color_box = tk.Frame(legend_item_frame, width=20, height=20, bg=task.color)
-            color_box.pack(side=tk.LEFT)
-
-            task_label = ttk.Label(legend_item_frame, text=f"- {task.task_id}", style="Legend.TLabel")
-           
-            self.style.configure("Legend.TLabel", background=colors["header_footer"], foreground=colors["text"])
-            task_label.pack(side=tk.LEFT, padx=(5,0))
-
-
-    def _draw_gantt_bar(self, tick_to_draw, task):
-        
-        if task.task_id not in self.task_y_positions:
-            next_y_pos = len(self.task_y_positions)
-            self.task_y_positions[task.task_id] = next_y_pos
-        self._ensure_legend_item(task) 
-
-        y0 = Y_OFFSET + self.task_y_positions[task.task_id] * (BAR_HEIGHT + 5)
-        y1 = y0 + BAR_HEIGHT
-        x0 = X_OFFSET + (tick_to_draw * TICK_WIDTH)
-        x1 = x0 + TICK_WIDTH
+    def _ensure_legend_item(self, task):
+        # O(1): o dicionario diz se ja tem; o desenho fica p/ o proximo _render_gantt
+        if task.task_id in self.legend_index:
+            return
+        self.legend_index[task.task_id] = len(self.legend_entries)
+        self.legend_entries.append((task.task_id, task.color))
+        self._legend_dirty = True
+
+    def _legend_columns(self):
+        return max(self.legend_canvas.winfo_width() // LEGEND_ITEM_WIDTH, 1)
+
+    def _legend_total_rows(self):
+        columns = self._legend_columns()
+        return (len(self.legend_entries) + columns - 1) // columns
+
+    def _render_legend(self):
+        self._legend_dirty = False
+        canvas = self.legend_canvas
+        canvas.delete("legend")
+        colors = self.current_theme if hasattr(self, "current_theme") else THEMES["light"]
+        columns = self._legend_columns()
+        total_rows = self._legend_total_rows()
+        self.legend_first_row = max(0, min(self.legend_first_row, total_rows - LEGEND_ROWS))
+        first = self.legend_first_row * columns
+        last = min(len(self.legend_entries), first + LEGEND_ROWS * columns)
+        for i in range(first, last):
+            task_id, color = self.legend_entries[i]
+            x = (i - first) % columns * LEGEND_ITEM_WIDTH + 4
+            y = (i - first) // columns * LEGEND_ROW_HEIGHT + 4
+            canvas.create_rectangle(x, y, x + 18, y + 18, fill=color, outline="", tags="legend")
+            canvas.create_text(
+                x + 24, y + 9, text=f"- {task_id}", anchor="w",
+                fill=colors["text"], font=("Segoe UI", 9), tags="legend",
+            )
+        if total_rows > LEGEND_ROWS:
+            self.legend_bar.set(
+                self.legend_first_row / total_rows,
+                (self.legend_first_row + LEGEND_ROWS) / total_rows,
+            )
+        else:
+            self.legend_bar.set(0, 1)
 
-        
-        outline_color = self.current_theme["canvas_bg"]
+    def _on_legend_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.legend_first_row = int(float(amount) * self._legend_total_rows())
+        else:
+            step = LEGEND_ROWS if unit == "pages" else 1
+            self.legend_first_row += int(amount) * step
+        self._render_legend()
 
-        self.canvas.delete(f"tick_{tick_to_draw}_{task.task_id}") 
-        self.canvas.create_rectangle(x0, y0, x1, y1, fill=task.color, outline=outline_color)
+    def _on_legend_wheel(self, event):
+        if getattr(event, "num", None) in (4, 5):
+            direction = -1 if event.num == 4 else 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self._on_legend_scroll("scroll", direction, "units")
 
 
-    def _draw_arrival_marker(self, tick_marker, task):
-        # garante que a task tenha posição Y e item na legenda
+    def _ensure_task_row(self, task):
+        # linha do gantt e item na legenda, na ordem em que as tarefas aparecem
         if task.task_id not in self.task_y_positions:
-            next_y_pos = len(self.task_y_positions)
-            self.task_y_positions[task.task_id] = next_y_pos
-        self._ensure_legend_item(task) 
-
-        y_pos = self.task_y_positions[task.task_id]
-
-        x = X_OFFSET + (tick_marker * TICK_WIDTH)
-        # ajusta para desenhar a linha EXATAMENTE no início do tick
-        x_line = x 
-        y0 = Y_OFFSET + y_pos * (BAR_HEIGHT + 5) - 2
-        y1 = y0 + BAR_HEIGHT + 4
+            self.task_y_positions[task.task_id] = len(self.task_y_positions)
+            self.task_rows.append(task.task_id)
+            self._ensure_legend_item(task)
+
+    def _render_gantt(self):
+        # redesenha so a janela visivel a partir da escala gravada: o numero de itens no
+        # canvas depende do tamanho da tela e do zoom, nao de quantos ticks ja rodaram.
+        # se os retangulos e marcadores sairam iguais aos da ultima vez, o canvas fica como esta
+        if self._legend_dirty:
+            self._render_legend()
+        view = self.viewport
+        bars = []
+        markers = []
+        if self.simulator and self.simulator.schedule is not None:
+            schedule = self.simulator.schedule
+            task_rows = self.task_rows
+            task_at_row = lambda row: task_rows[row] if row < len(task_rows) else None
+            # a thread do "Executar Tudo" pode estar escrevendo na escala; corta no que ja foi mostrado
+            with self.render_lock:
+                bars = view.bars(schedule, task_at_row, self.display_tick)
+
+            # marcadores de chegada (so de quem ja chegou) dentro da janela
+            rows = self.task_y_positions
+            first, last = view.visible_ticks()
+            last = min(last, max(self.display_tick - 1, 0) + 1)
+            row_start, row_end = view.visible_rows()
+            for task in self.simulator.arrivals.arriving_between(first, last):
+                row = rows.get(task.task_id)
+                if row is not None and row_start <= row < row_end:
+                    markers.append((view.tick_to_x(task.arrival_time), view.row_to_y(row) - 2))
+
+        drawn = (
+            view.first_tick, view.first_row, view.zoom, view.width, view.height,
+            self.is_dark_theme.get(), bars, markers,
+        )
+        if drawn != self.gantt_drawn:
+            self.gantt_drawn = drawn
+            self.canvas.delete("gantt")
+            self._draw_axes()
+            labels = self.simulator.schedule.labels if bars else None
+            outline_color = self.current_theme["canvas_bg"]
+            for row, x0, x1, number in bars:
+                y0 = view.row_to_y(row)
+                self.canvas.create_rectangle(
+                    x0, y0, x1, y0 + BAR_HEIGHT, fill=labels[number][1],
+                    outline=outline_color if x1 - x0 > 2 else "", tags="gantt",
+                )
+            for x, y0 in markers:
+                self.canvas.create_line(x, y0, x, y0 + BAR_HEIGHT + 4,
+                                        width=3,
+                                        fill="#32CD32",
+                                        tags="gantt")
+        self._update_scrollbars()
+
+    def _total_ticks(self): # ate onde da p/ rolar: o tick atual (ou a tela, se ainda cabe)
+        first, last = self.viewport.visible_ticks()
+        current = self.display_tick if self.simulator else 0
+        return max(current, last - first)
+
+    def _update_scrollbars(self):
+        view = self.viewport
+        total = self._total_ticks()
+        first, last = view.visible_ticks()
+        self.hbar.set(first / total, min(last / total, 1.0))
+        rows = max(len(self.task_y_positions), 1)
+        row_start, row_end = view.visible_rows()
+        self.vbar.set(min(row_start / rows, 1.0), min(row_end / rows, 1.0))
+
+    def _on_hscroll(self, action, amount, unit=None):
+        view = self.viewport
+        total = self._total_ticks()
+        first, last = view.visible_ticks()
+        if action == "moveto":
+            tick = float(amount) * total
+        else:
+            step = (last - first) if unit == "pages" else max((last - first) // 10, 1)
+            tick = first + int(amount) * step
+        view.scroll_to_tick(tick, total)
+        # voltou p/ o fim: a janela volta a acompanhar a simulacao
+        self.follow_tick = view.visible_ticks()[1] >= total
+        self._render_gantt()
+
+    def _on_vscroll(self, action, amount, unit=None):
+        view = self.viewport
+        rows = len(self.task_y_positions)
+        if action == "moveto":
+            row = float(amount) * rows
+        else:
+            row_start, row_end = view.visible_rows()
+            row = row_start + int(amount) * ((row_end - row_start) if unit == "pages" else 1)
+        view.scroll_to_row(row, rows)
+        self._render_gantt()
+
+    def _on_mouse_wheel(self, event):
+        if getattr(event, "num", None) in (4, 5):
+            direction = -1 if event.num == 4 else 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        if event.state & 0x0004: # ctrl: zoom em volta do mouse
+            self._zoom(direction, event.x)
+        elif event.state & 0x0001: # shift: tarefas
+            self._on_vscroll("scroll", direction, "units")
+        else:
+            self._on_hscroll("scroll", direction, "units")
 
-        marker_color = "#32CD32" 
+    def _zoom(self, direction, anchor_x=None):
+        # direction > 0 afasta (mais ticks por pixel), < 0 aproxima
+        self.viewport.set_zoom(self.viewport.zoom + direction, anchor_x)
+        self._render_gantt()
 
-        # verifica se já existe um marcador para não redesenhar
-        if not self.canvas.find_withtag(f"arrival_{task.task_id}"):
-            self.canvas.create_line(x_line, y0, x_line, y1,
-                                    width=3,
-                                    fill=marker_color,
-                                    tags=f"arrival_{task.task_id}")
+    def _on_canvas_resize(self, event):
+        self.viewport.resize(event.width, event.height)
+        self._render_gantt()
 
-    def _update_gui(self, task_that_ran):
-        if not self.simulator: return
+    def _show_ticks(self, results):
+        # mostra um lote de ticks ja simulados [(tick, tarefa que rodou)] com um redesenho so
+        if not self.simulator or not results: return
 
-        tick_to_draw = self.simulator.global_tick - 1
-        if tick_to_draw < 0: return # nao desenha nada antes do tick 0
+        previous = self.display_tick
+        self.display_tick = results[-1][0] + 1
+        self.lbl_tick.config(text=f"Tick: {self.display_tick}")
 
-        self.lbl_tick.config(text=f"Tick: {self.simulator.global_tick}")
+        # quem chegou nesses ticks ganha linha e legenda
+        # usa o indice de chegadas do simulador, sem varrer a lista toda
+        for task in self.simulator.arrivals.arriving_between(previous, self.display_tick):
+            self._ensure_task_row(task)
 
-        # desenha marcadores de chegada para tarefas que chegaram neste tick
-        #  garante que a posição Y seja criada
-        for task in self.simulator.original_task_list:
-            if task.arrival_time == tick_to_draw:
-                 if task.task_id not in self.task_y_positions:
-                     next_y_pos = len(self.task_y_positions)
-                     self.task_y_positions[task.task_id] = next_y_pos
-                 self._draw_arrival_marker(tick_to_draw, task)
-
-        # desenha o bloco colorido para a tarefa que realmente executou neste tick
-        if task_that_ran:
-            # garante que a task tenha posição Y antes de desenhar a barra
-            if task_that_ran.task_id not in self.task_y_positions:
-                next_y_pos = len(self.task_y_positions)
-                self.task_y_positions[task_that_ran.task_id] = next_y_pos
-            self._draw_gantt_bar(tick_to_draw, task_that_ran)
-
-        # ajusta o scrollregion do canvas 
-        max_tick_visible = tick_to_draw + 30
-        max_y_visible = Y_OFFSET + (len(self.task_y_positions) * (BAR_HEIGHT + 5)) + 50
-        max_x_visible = X_OFFSET + (max_tick_visible * TICK_WIDTH)
-        # garante que as coordenadas sejam não negativas
-        scroll_x1 = max(1, max_x_visible)
-        scroll_y1 = max(1, max_y_visible)
-        self.canvas.config(scrollregion=(0, 0, scroll_x1, scroll_y1))
+        if self.follow_tick:
+            self.viewport.follow(self.display_tick, self._total_ticks())
+        self._render_gantt()
 
 
     def _run_simulation_step(self):
         if not self.simulator:
             return False
+        if self.simulator._is_simulation_complete():
+            return False
         # roda a lógica do tick atual (isso incrementa global_tick para o próximo)
-        task_that_ran = self.simulator.tick()
-        # desenha o resultado do tick que acabou de rodar (global_tick - 1)
-        self._update_gui(task_that_ran)
+        # (pelo historico, que guarda o que mudou p/ poder voltar depois)
+        tick = self.simulator.global_tick
+        task_that_ran = self.checkpoints.tick()
+        # desenha o resultado do tick que acabou de rodar
+        self._show_ticks([(tick, task_that_ran)])
+        self.btn_step_back.config(state="normal")
+
+        if self.simulator._is_simulation_complete():
+            self._simulation_finished()
+            return False
+        return True
+
+    def _simulation_finished(self):
+        self.btn_next_step.config(state="disabled")
+        self.btn_run_all.config(text="Finalizado", state="disabled")
+        self.btn_save.config(state="normal")
+        self.is_running = False
 
-        is_complete = self.simulator._is_simulation_complete()
-        if is_complete:
+    def _redraw_gantt(self):
+        # depois de voltar/pular no tempo: garante linha p/ todo mundo que ja chegou
+        # (pulando p/ frente os ticks do meio nao passaram pelo _show_ticks) e redesenha
+        for task in self.simulator.arrivals.arriving_between(0, self.simulator.global_tick):
+            self._ensure_task_row(task)
+        self.display_tick = self.simulator.global_tick
+        if self.follow_tick:
+            self.viewport.follow(self.display_tick, self._total_ticks())
+        self._render_gantt()
+
+    def _after_time_travel(self):
+        # acerta o desenho e os botoes depois de voltar passo / ir p/ tick
+        self._redraw_gantt()
+        self.lbl_tick.config(text=f"Tick: {self.simulator.global_tick}")
+        at_start = self.simulator.global_tick <= self.checkpoints.first_tick
+        self.btn_step_back.config(state="disabled" if at_start else "normal")
+        if self.simulator._is_simulation_complete():
             self.btn_next_step.config(state="disabled")
             self.btn_run_all.config(text="Finalizado", state="disabled")
             self.btn_save.config(state="normal")
-            self.is_running = False
-            return False
-        return True
+        else:
+            self.btn_next_step.config(state="normal")
+            self.btn_run_all.config(text="Executar Tudo", state="normal")
+            self.btn_save.config(state="disabled")
+
+    def _step_back_clicked(self):
+        self._stop_playback()
+        if self.checkpoints.step_back():
+            self._after_time_travel()
+
+    def _goto_tick_clicked(self):
+        self._stop_playback()
+        tick = simpledialog.askinteger(
+            "Ir para Tick",
+            f"Tick de destino (agora: {self.simulator.global_tick}):",
+            parent=self.master,
+            minvalue=0,
+        )
+        if tick is None:
+            return
+        # p/ tras restaura do historico; p/ frente simula sem desenhar tick a tick
+        self.checkpoints.seek(tick)
+        self._after_time_travel()
 
     def _save_canvas_as_image(self):
+        # desenha a escala inteira direto no arquivo (png ou svg), no zoom e na ordem de
+        # tarefas da janela; nao depende do que esta visivel nem de captura de tela
+        self._stop_playback()
         try:
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".png",
-                filetypes=[("PNG file", "*.png"), ("All files", "*.*")],
+                filetypes=[("PNG file", "*.png"), ("SVG file", "*.svg"), ("All files", "*.*")],
             )
             if not file_path:
                 return
 
-
-            x0_main = self.master.winfo_rootx() + self.main_content_frame.winfo_x()
-            y0_main = self.master.winfo_rooty() + self.main_content_frame.winfo_y()
-            x1_main = x0_main + self.main_content_frame.winfo_width()
-            y1_main = y0_main + self.main_content_frame.winfo_height()
-
-
-            self.master.update_idletasks()
-
-            ImageGrab.grab(bbox=(x0_main, y0_main, x1_main, y1_main)).save(file_path)
-            print(f"Imagem salva em: {file_path}")
+            colors = self.current_theme
+            with self.render_lock:
+                written = export_gantt(
+                    self.simulator.schedule,
+                    file_path,
+                    zoom=self.viewport.zoom,
+                    rows=self.task_y_positions,
+                    colors={
+                        "background": colors["canvas_bg"],
+                        "text": colors["text"],
+                        "axes": colors["text_axes"],
+                    },
+                )
+            print(f"Imagem salva em: {', '.join(written)}")
+            if len(written) > 1:
+                messagebox.showinfo(
+                    "Imagem Salva",
+                    f"O gráfico é grande e foi dividido em {len(written)} arquivos:\n"
+                    f"{written[0]} ... {written[-1]}",
+                )
         except Exception as e:
             print(f"Erro ao salvar a imagem: {e}")
             messagebox.showerror(
@@ -773,14 +1468,26 @@ class AppGUI:
             )
 
     def _next_step_clicked(self):
-        self.is_running = False
-        self.btn_run_all.config(text="Executar Tudo")
+        self._stop_playback()
         self._run_simulation_step()
 
+    def _speed_changed(self, value):
+        index = int(round(float(value)))
+        speed = SPEEDS[index]
+        self.lbl_speed.config(
+            text="Velocidade: máxima" if speed == 0 else f"Velocidade: {speed} ticks/s"
+        )
+
+    def _worker_step(self):
+        # roda na thread do "Executar Tudo" (com render_lock pego): um tick pelo historico
+        if self.simulator._is_simulation_complete():
+            return None
+        tick = self.simulator.global_tick
+        return tick, self.checkpoints.tick()
+
     def _run_all_clicked(self):
         if self.is_running:
-            self.is_running = False
-            self.btn_run_all.config(text="Executar Tudo")
+            self._stop_playback()
         else:
             if not self.simulator:
                 messagebox.showwarning(
@@ -789,16 +1496,48 @@ class AppGUI:
                 return
             self.is_running = True
             self.btn_run_all.config(text="Parar")
+            self.btn_step_back.config(state="normal")
+            self.playback = PlaybackWorker(self._worker_step, self.render_lock)
+            self.playback.start()
+            self._tick_budget = 0.0
+            self._last_frame = time.perf_counter()
             self._run_loop()
 
+    def _stop_playback(self):
+        # para a thread e volta o simulador p/ o tick que esta na tela (ela pode ter
+        # simulado na frente); o historico deixa isso barato
+        self.is_running = False
+        if self.playback is None:
+            return
+        self.playback.stop()
+        self.playback = None
+        if self.simulator.global_tick != self.display_tick:
+            self.checkpoints.restore(self.display_tick)
+        if not self.simulator._is_simulation_complete():
+            self.btn_run_all.config(text="Executar Tudo")
+
     def _run_loop(self):
-        if self.is_running:
-            if self._run_simulation_step():
-                self.master.after(200, self._run_loop)
-            else:
-                
-                self.btn_run_all.config(text="Finalizado", state="disabled")
-                self.is_running = False 
+        # um quadro: pega da thread quantos ticks a velocidade permite desde o ultimo quadro
+        if not self.is_running or self.playback is None:
+            return
+        now = time.perf_counter()
+        elapsed, self._last_frame = now - self._last_frame, now
+        speed = SPEEDS[int(round(float(self.speed_scale.get())))]
+        if speed == 0:
+            limit = None
+        else:
+            # o acumulado nao passa de meio segundo, p/ nao dar um salto depois de um engasgo
+            self._tick_budget = min(self._tick_budget + speed * elapsed, speed * 0.5 + 1)
+            limit = int(self._tick_budget)
+            self._tick_budget -= limit
+        results, finished = self.playback.poll(limit) if limit != 0 else ([], False)
+        self._show_ticks(results)
+        if finished:
+            self.playback.stop()
+            self.playback = None
+            self._simulation_finished()
+            return
+        self.master.after(FRAME_MS, self._run_loop)
 
     def start(self):
         self.master.mainloop()
@@ -1,7 +1,14 @@
-import tkinter as tk
-from gui import AppGUI
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # com argumentos roda sem janela (as mesmas opcoes do cli.py), sem nem carregar o tkinter
+        from cli import main
+        sys.exit(main(sys.argv[1:]))
+
+    # a parte grafica so eh importada quando vai abrir a janela
+    import tkinter as tk
+    from gui import AppGUI
 
     root = tk.Tk()  # cria a janela
     app = AppGUI(root)
@@ -0,0 +1,255 @@
+#metricas de escalonamento calculadas durante a simulacao (sem segunda passada pelas tarefas):
+#tempo de vida (turnaround), espera na fila, resposta, uso da cpu e trocas de contexto
+import copy
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+#ate quantos valores guardar exatos; passando disso os percentis viram estimativa P2
+#(memoria fixa, nao importa quantas tarefas a simulacao tenha)
+EXACT_LIMIT = 4096
+
+
+class P2Quantile:
+    #estimador P-quadrado (Jain & Chlamtac, 1985): acompanha um percentil com so 5
+    #marcadores, ajustando as alturas por interpolacao parabolica a cada valor novo
+    def __init__(self, p):
+        self.p = p
+        self.count = 0
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value):
+        self.count += 1
+        heights = self.heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self.positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            delta = self.desired[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or (
+                delta <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if delta > 0 else -1
+                candidate = self._parabolic(i, step)
+                if heights[i - 1] < candidate < heights[i + 1]:
+                    heights[i] = candidate
+                else:
+                    heights[i] = self._linear(i, step)
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        q = self.heights
+        n = self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i, step):
+        q = self.heights
+        n = self.positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    def value(self):
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            return exact_quantile(self.heights, self.p)
+        return self.heights[2]
+
+
+def exact_quantile(sorted_values, p):
+    #interpolacao linear entre as posicoes vizinhas (mesma regra padrao do numpy)
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * p
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+class StreamingStat:
+    #media e percentis de uma metrica, alimentados um valor por vez.
+    #guarda os valores exatos enquanto sao poucos; depois troca p/ estimadores P2
+    def __init__(self, quantiles=QUANTILES, exact_limit=EXACT_LIMIT):
+        self.quantiles = quantiles
+        self.exact_limit = exact_limit
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self._values = []
+        self._sorted = True
+        self._estimators = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if self._estimators is not None:
+            for estimator in self._estimators:
+                estimator.add(value)
+            return
+        self._values.append(value)
+        self._sorted = False
+        if len(self._values) > self.exact_limit:
+            self._estimators = [P2Quantile(p) for p in self.quantiles]
+            for buffered in self._values:
+                for estimator in self._estimators:
+                    estimator.add(buffered)
+            self._values = []
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    @property
+    def is_exact(self):
+        return self._estimators is None
+
+    def quantile(self, p):
+        if self._estimators is not None:
+            for estimator in self._estimators:
+                if estimator.p == p:
+                    return estimator.value()
+            raise KeyError(f"percentil {p} não acompanhado")
+        if not self._sorted:
+            self._values.sort()
+            self._sorted = True
+        return exact_quantile(self._values, p)
+
+    def summary(self):
+        result = {"count": self.count, "mean": self.mean, "min": self.minimum, "max": self.maximum}
+        for p in self.quantiles:
+            result[f"p{round(p * 100)}"] = self.quantile(p)
+        return result
+
+
+def task_metrics(task):
+    #metricas de uma tarefa, direto dos campos que o simulador ja atualiza (O(1), sem varrer nada)
+    started = task.start_time != -1
+    finished = task.finish_time != -1
+    return {
+        "task": task.task_id,
+        "arrival": task.arrival_time,
+        "duration": task.duration,
+        "start": task.start_time,
+        "finish": task.finish_time,
+        "turnaround": task.finish_time - task.arrival_time if finished else None,
+        "waiting": task.waiting_time,
+        "response": task.start_time - task.arrival_time if started else None,
+    }
+
+
+class MetricsCollector:
+    #o simulador avisa cada despacho, preempcao, termino e quantos ticks a cpu ficou
+    #ocupada/ociosa; tudo eh atualizado na hora, entao o resumo sai a qualquer momento
+    def __init__(self, exact_limit=EXACT_LIMIT):
+        self.turnaround = StreamingStat(exact_limit=exact_limit)
+        self.waiting = StreamingStat(exact_limit=exact_limit)
+        self.response = StreamingStat(exact_limit=exact_limit)
+        self.busy_ticks = 0
+        self.idle_ticks = 0
+        self.context_switches = 0 #cpu passou a rodar uma tarefa diferente da ultima que rodou
+        self.preemptions = 0
+        self.dispatches = 0
+        self.finished_tasks = 0
+        self._last_on_cpu = {} #ultima tarefa que rodou em cada nucleo (so o 0 sem smp)
+
+    def on_dispatch(self, task, tick, cpu=0):
+        self.dispatches += 1
+        last = self._last_on_cpu.get(cpu)
+        if last is not None and last != task:
+            self.context_switches += 1
+        self._last_on_cpu[cpu] = task
+        if task.start_time == tick: #primeira vez na cpu
+            self.response.add(tick - task.arrival_time)
+
+    def copy(self):
+        #copia independente das estatisticas (p/ checkpoint); as tarefas sao so referencias
+        clone = copy.copy(self)
+        clone.turnaround = copy.deepcopy(self.turnaround)
+        clone.waiting = copy.deepcopy(self.waiting)
+        clone.response = copy.deepcopy(self.response)
+        clone._last_on_cpu = dict(self._last_on_cpu)
+        return clone
+
+    def on_preempt(self, task, tick):
+        self.preemptions += 1
+
+    def on_run(self, ticks):
+        self.busy_ticks += ticks
+
+    def on_idle(self, ticks):
+        self.idle_ticks += ticks
+
+    def on_finish(self, task, tick):
+        self.finished_tasks += 1
+        self.turnaround.add(tick - task.arrival_time)
+        self.waiting.add(task.waiting_time)
+
+    @property
+    def utilization(self): #fracao dos ticks em que a cpu rodou alguem
+        total = self.busy_ticks + self.idle_ticks
+        return self.busy_ticks / total if total else 0.0
+
+    def summary(self):
+        return {
+            "finished_tasks": self.finished_tasks,
+            "ticks": self.busy_ticks + self.idle_ticks,
+            "busy_ticks": self.busy_ticks,
+            "idle_ticks": self.idle_ticks,
+            "cpu_utilization": self.utilization,
+            "context_switches": self.context_switches,
+            "preemptions": self.preemptions,
+            "dispatches": self.dispatches,
+            "turnaround": self.turnaround.summary(),
+            "waiting": self.waiting.summary(),
+            "response": self.response.summary(),
+        }
+
+
+def format_summary(summary):
+    #texto do resumo, usado tanto pela linha de comando quanto pela janela
+    lines = [
+        f"Tarefas concluídas: {summary['finished_tasks']}",
+        f"Uso da CPU: {summary['cpu_utilization'] * 100:.1f}% "
+        f"({summary['busy_ticks']} ocupada / {summary['idle_ticks']} ociosa)",
+        f"Trocas de contexto: {summary['context_switches']} | Preempções: {summary['preemptions']}",
+        f"{'':<12}{'média':>10}{'p50':>10}{'p95':>10}{'p99':>10}",
+    ]
+    for key, label in (("turnaround", "Turnaround"), ("waiting", "Espera"), ("response", "Resposta")):
+        stat = summary[key]
+        cells = [_format_number(stat[name]) for name in ("mean", "p50", "p95", "p99")]
+        lines.append(f"{label:<12}" + "".join(f"{cell:>10}" for cell in cells))
+    return "\n".join(lines)
+
+
+def _format_number(value):
+    if value is None:
+        return "-"
+    return f"{value:.2f}"
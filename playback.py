@@ -0,0 +1,81 @@
+import queue
+import threading
+import time
+
+#quanto tempo o trabalhador segura a trava por lote (a janela espera no maximo isso p/ desenhar)
+BATCH_SECONDS = 0.005
+MAX_BATCH = 1000
+#quantos lotes ele pode ficar na frente da janela antes de esperar ela consumir
+QUEUE_BATCHES = 64
+
+
+class PlaybackWorker:
+    #roda a simulacao numa thread separada, na frente do que a janela mostra, e entrega os
+    #resultados (tick, tarefa que rodou) em lotes por uma queue.Queue. a janela so consome
+    #no ritmo dela (poll), entao continua respondendo mesmo com a simulacao a toda.
+    #step() faz um tick e devolve (tick, tarefa) ou None quando acabou; roda sempre com a
+    #trava (lock) pega, a mesma que a janela usa p/ ler a escala enquanto desenha
+    def __init__(self, step, lock):
+        self._step = step
+        self._lock = lock
+        self._results = queue.Queue(maxsize=QUEUE_BATCHES)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._pending = [] #lote ja tirado da fila mas ainda nao todo entregue
+        self._done = False #a thread avisou que a simulacao acabou
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self): #para a thread e espera ela sair (o que nao foi consumido eh jogado fora)
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = []
+            finished = False
+            with self._lock:
+                deadline = time.perf_counter() + BATCH_SECONDS
+                while len(batch) < MAX_BATCH:
+                    result = self._step()
+                    if result is None:
+                        finished = True
+                        break
+                    batch.append(result)
+                    if time.perf_counter() >= deadline:
+                        break
+            if batch:
+                self._put(batch)
+            if finished:
+                self._put(None) #fim da simulacao
+                return
+
+    def _put(self, item):
+        #fila cheia = a janela ta atrasada; espera, mas sem travar o stop()
+        while not self._stop.is_set():
+            try:
+                self._results.put(item, timeout=0.05)
+                return
+            except queue.Full:
+                pass
+
+    def poll(self, limit=None):
+        #ate limit resultados ja prontos (None = todos), sem esperar. devolve
+        #(resultados, acabou), e acabou so vira True depois de entregar o ultimo tick
+        results = []
+        while limit is None or len(results) < limit:
+            if not self._pending:
+                try:
+                    batch = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is None:
+                    self._done = True
+                    break
+                self._pending = batch
+            take = len(self._pending) if limit is None else limit - len(results)
+            results.extend(self._pending[:take])
+            del self._pending[:take]
+        finished = self._done and not self._pending and self._results.empty()
+        return results, finished
@@ -0,0 +1,208 @@
+import json
+import threading
+import time
+
+#medicao opcional de onde o tempo vai: as fases sao metodos do simulador (e da janela) que,
+#so quando alguem liga o perfil, ganham por cima um embrulho que cronometra a chamada.
+#desligado nao tem embrulho nenhum, entao o laco da simulacao roda exatamente como antes.
+#as fases aninham (tick;dispatch;select), p/ sair tanto o tempo total quanto o proprio de cada uma
+
+#metodo do simulador -> nome da fase
+SIMULATOR_PHASES = (
+    ("run", "run"),
+    ("tick", "tick"),
+    ("step", "step"),
+    ("_check_for_new_arrivals", "arrivals"),
+    ("_dispatch", "dispatch"),
+    ("_leave_cpu", "leave_cpu"),
+)
+
+#so no simulador com varios nucleos (smp.py): o despacho eh por nucleo (dispatch, com a fila
+#daquele nucleo no histograma), o global distribui entre eles, e ainda tem a escolha do nucleo
+#de quem chega (placement) e o roubo de trabalho (balance)
+SMP_PHASES = (
+    ("_dispatch_global", "dispatch_global"),
+    ("_dispatch_on", "dispatch"),
+    ("_make_ready", "placement"),
+    ("_balance", "balance"),
+    ("_skip_idle", "skip_idle"),
+)
+
+
+def _bucket(length):
+    #faixas de tamanho da fila em potencias de 2: 0, 1, 2-3, 4-7, 8-15...
+    if length < 2:
+        return str(length)
+    low = 1 << (length.bit_length() - 1)
+    return f"{low}-{2 * low - 1}"
+
+
+class Profiler:
+    def __init__(self):
+        self.phases = {} #caminho (fase;subfase) -> [chamadas, tempo total, tempo dos filhos]
+        self.queue_lengths = {} #faixa do tamanho da fila de prontos a cada despacho -> vezes
+        self._local = threading.local() #pilha de fases por thread (a janela e o executar tudo)
+        self._lock = threading.Lock()
+        self._wrapped = [] #(objeto, nome) p/ tirar os embrulhos depois
+        self.started = time.perf_counter()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def wrap(self, owner, name, phase, before=None):
+        #troca owner.name por uma versao cronometrada (so nessa instancia); before, se tem,
+        #roda antes de cada chamada com os mesmos argumentos (fora do tempo da fase)
+        original = getattr(owner, name)
+        stack_of = self._stack
+        phases = self.phases
+        lock = self._lock
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            stack = stack_of()
+            path = f"{stack[-1]};{phase}" if stack else phase
+            if before is not None:
+                before(*args)
+            stack.append(path)
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                stack.pop()
+                with lock:
+                    entry = phases.get(path)
+                    if entry is None:
+                        entry = phases[path] = [0, 0.0, 0.0]
+                    entry[0] += 1
+                    entry[1] += elapsed
+                    if stack:
+                        parent = phases.get(stack[-1])
+                        if parent is None:
+                            parent = phases[stack[-1]] = [0, 0.0, 0.0]
+                        parent[2] += elapsed
+
+        setattr(owner, name, timed)
+        self._wrapped.append((owner, name))
+
+    def attach(self, simulator):
+        #liga a medicao num simulador (depois de montado: restart troca o escalonador)
+        for name, phase in SIMULATOR_PHASES:
+            if hasattr(simulator, name):
+                before = None
+                if name == "_dispatch":
+                    before = lambda: self._sample_queue(len(simulator.ready_queue))
+                self.wrap(simulator, name, phase, before)
+        cpus = getattr(simulator, "cpus", None)
+        if cpus:
+            for name, phase in SMP_PHASES:
+                before = None
+                if name == "_dispatch_on":
+                    before = lambda cpu: self._sample_queue(len(cpu.ready_queue))
+                self.wrap(simulator, name, phase, before)
+            #cada nucleo tem o seu escalonador; o do Simulator nem eh usado
+            for cpu in cpus:
+                self.wrap(cpu.scheduler, "select_next_task", "select")
+        elif simulator.scheduler is not None:
+            self.wrap(simulator.scheduler, "select_next_task", "select")
+
+    def detach(self):
+        #tira todos os embrulhos (o objeto volta a usar o metodo da classe)
+        for owner, name in reversed(self._wrapped):
+            try:
+                delattr(owner, name)
+            except AttributeError:
+                pass
+        self._wrapped = []
+
+    def _sample_queue(self, length):
+        key = _bucket(length)
+        with self._lock:
+            self.queue_lengths[key] = self.queue_lengths.get(key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self.phases.clear()
+            self.queue_lengths.clear()
+            self.started = time.perf_counter()
+
+    def phase_rows(self):
+        #(caminho, chamadas, total s, proprio s, media us) na ordem do caminho
+        with self._lock:
+            items = sorted((path, list(entry)) for path, entry in self.phases.items())
+        rows = []
+        for path, (calls, total, children) in items:
+            mean = total / calls * 1e6 if calls else 0.0
+            rows.append((path, calls, total, max(total - children, 0.0), mean))
+        return rows
+
+    def report(self, simulator=None):
+        #tudo num dict (o que vai p/ o json); com o simulador junta os contadores das metricas
+        with self._lock:
+            histogram = dict(
+                sorted(self.queue_lengths.items(), key=lambda item: int(item[0].split("-")[0]))
+            )
+        result = {
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "phases": {
+                path: {
+                    "calls": calls,
+                    "total_seconds": round(total, 6),
+                    "self_seconds": round(own, 6),
+                    "mean_us": round(mean, 3),
+                }
+                for path, calls, total, own, mean in self.phase_rows()
+            },
+            "ready_queue_length": histogram,
+        }
+        if simulator is not None:
+            metrics = simulator.metrics
+            result["counters"] = {
+                "ticks": simulator.global_tick,
+                "busy_ticks": metrics.busy_ticks,
+                "idle_ticks": metrics.idle_ticks,
+                "dispatches": metrics.dispatches,
+                "context_switches": metrics.context_switches,
+                "preemptions": metrics.preemptions,
+            }
+        return result
+
+    def folded(self):
+        #formato "pilhas dobradas" (fase;subfase microssegundos), o que o flamegraph.pl e o
+        #speedscope leem: cada linha eh o tempo proprio daquele caminho
+        return "\n".join(
+            f"{path} {int(round(own * 1e6))}" for path, _, _, own, _ in self.phase_rows() if own > 0
+        ) + "\n"
+
+    def save(self, path, simulator=None):
+        #.json = relatorio completo, qualquer outra extensao = pilhas dobradas
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            if path.lower().endswith(".json"):
+                json.dump(self.report(simulator), f, indent=2)
+                f.write("\n")
+            else:
+                f.write(self.folded())
+
+
+def format_report(report):
+    #texto p/ o console (mesmas colunas da janela)
+    lines = [f"{'Fase':<48}{'Chamadas':>10}{'Total (ms)':>12}{'Próprio (ms)':>14}{'Média (us)':>12}"]
+    for path, phase in report["phases"].items():
+        lines.append(
+            f"{path:<48}{phase['calls']:>10}{phase['total_seconds'] * 1000:>12.2f}"
+            f"{phase['self_seconds'] * 1000:>14.2f}{phase['mean_us']:>12.2f}"
+        )
+    if report["ready_queue_length"]:
+        lines.append("Fila de prontos a cada despacho: " + ", ".join(
+            f"{key}: {count}" for key, count in report["ready_queue_length"].items()
+        ))
+    counters = report.get("counters")
+    if counters:
+        lines.append(
+            f"Ticks: {counters['ticks']} | Ociosos: {counters['idle_ticks']} | "
+            f"Despachos: {counters['dispatches']} | Preempções: {counters['preemptions']}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,163 @@
+from collections import deque
+
+
+class ReadyQueue:
+    #fila de prontos em heap binario indexado (estilo fila de prioridade do Cormen).
+    #cada entrada eh (chave, ordem de chegada na fila, tarefa), entao no empate de
+    #chave ganha quem entrou primeiro, igual o deque antigo fazia.
+    #o dicionario _position guarda onde cada tarefa esta no heap p/ remover/atualizar em O(log n)
+
+    def __init__(self, key=None):
+        self._key = key #funcao que da a chave de ordenacao (menor sai primeiro), None = so ordem de chegada
+        self._heap = []
+        self._position = {}
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __contains__(self, task):
+        return task in self._position
+
+    def __iter__(self):
+        #percorre na ordem em que sairiam da fila (copia ordenada, nao eh p/ usar no laco quente)
+        return iter([entry[2] for entry in sorted(self._heap)])
+
+    def _make_entry(self, task):
+        self._counter += 1
+        key = self.key_of(task)
+        return (key, self._counter, task)
+
+    def append(self, task): #insere no fim da "fila": O(log n)
+        entry = self._make_entry(task)
+        self._heap.append(entry)
+        self._position[task] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def key_of(self, task): #chave que a tarefa teria na fila (menor = sai antes)
+        return self._key(task) if self._key else ()
+
+    def peek(self): #quem sairia agora, sem tirar: O(1)
+        return self._heap[0][2] if self._heap else None
+
+    def popleft(self): #tira quem tem a menor chave: O(log n)
+        if not self._heap:
+            raise IndexError("pop de fila de prontos vazia")
+        task = self._heap[0][2]
+        self._remove_at(0)
+        return task
+
+    def remove(self, task): #tira uma tarefa qualquer: O(log n)
+        index = self._position.get(task)
+        if index is None:
+            raise ValueError(f"{task} nao esta na fila de prontos")
+        self._remove_at(index)
+
+    def requeue(self, task):
+        #recalcula a chave de quem ja ta na fila (ex: prioridade mudou) mantendo a ordem de chegada
+        index = self._position[task]
+        _, order, _ = self._heap[index]
+        key = self.key_of(task)
+        self._heap[index] = (key, order, task)
+        self._sift_up(index)
+        self._sift_down(self._position[task])
+
+    def clear(self):
+        self._heap = []
+        self._position = {}
+
+    def _remove_at(self, index):
+        heap = self._heap
+        removed = heap[index]
+        del self._position[removed[2]]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self._position[last[2]] = index
+            self._sift_up(index)
+            self._sift_down(self._position[last[2]])
+
+    def _sift_up(self, index):
+        heap = self._heap
+        position = self._position
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][2]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def _sift_down(self, index):
+        heap = self._heap
+        position = self._position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][2]] = index
+            index = child
+        heap[index] = entry
+        position[entry[2]] = index
+
+
+class RoundRobinQueue:
+    #fila do round robin: ninguem tem chave, a ordem eh so quem entrou primeiro, entao
+    #um deque resolve com entrada no fim e saida no comeco em O(1) (sem heap).
+    #o set de membros deixa o "in" do simulador O(1) tbm
+    def __init__(self):
+        self._queue = deque()
+        self._members = set()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __bool__(self):
+        return bool(self._queue)
+
+    def __contains__(self, task):
+        return task in self._members
+
+    def __iter__(self):
+        return iter(list(self._queue))
+
+    def append(self, task):
+        self._queue.append(task)
+        self._members.add(task)
+
+    def key_of(self, task): #sem chave: so a ordem de chegada conta
+        return ()
+
+    def peek(self):
+        return self._queue[0] if self._queue else None
+
+    def popleft(self):
+        if not self._queue:
+            raise IndexError("pop de fila de prontos vazia")
+        task = self._queue.popleft()
+        self._members.discard(task)
+        return task
+
+    def remove(self, task):
+        #O(n), mas o round robin sempre tira pelo comeco; so fica aqui p/ manter a mesma interface
+        if task not in self._members:
+            raise ValueError(f"{task} nao esta na fila de prontos")
+        self._queue.remove(task)
+        self._members.discard(task)
+
+    def clear(self):
+        self._queue.clear()
+        self._members.clear()
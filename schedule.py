@@ -0,0 +1,249 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+
+#por que um intervalo acabou (o que fez a cpu trocar)
+REASON_RUNNING = 0 #ainda aberto: a simulacao parou (ou acabou) com ele rodando
+REASON_FINISHED = 1 #a tarefa terminou
+REASON_PREEMPTED = 2 #o escalonador tirou a tarefa da cpu
+REASON_DISPATCH = 3 #fim de ociosidade: alguem chegou e foi escalonado
+REASON_BLOCKED = 4 #a tarefa parou p/ esperar E/S
+REASON_NAMES = ("executando", "terminou", "preemptada", "despacho", "bloqueada")
+
+IDLE = -1 #numero de tarefa usado nos intervalos de cpu ociosa
+
+#formato do arquivo: cabecalho, tabela de tarefas (id e cor) e registros de tamanho fixo
+#ordenados pelo inicio. como o tamanho eh fixo, o proprio bloco de registros serve de indice:
+#da p/ fazer busca binaria direto no arquivo (O(log n) leituras) sem carregar tudo
+MAGIC = b"SCHD"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQI") #magic, versao, reservado, n de intervalos, n de tarefas
+LABEL_SIZE = struct.Struct("<H")
+RECORD = struct.Struct("<qqib") #inicio, fim, tarefa, motivo
+
+
+class Schedule:
+    #escala da simulacao codificada por intervalos (run-length): cada vez que a mesma tarefa
+    #continua rodando o ultimo intervalo so estica, entao o tamanho cresce com as trocas de
+    #contexto e nao com os ticks. colunas em arrays, ordenadas pelo inicio
+    def __init__(self):
+        self.starts = array("q")
+        self.ends = array("q")
+        self.tasks = array("i") #numero da tarefa em labels, IDLE p/ cpu ociosa
+        self.reasons = array("b")
+        self.labels = [] #(id, cor) de cada numero de tarefa
+        self._label_numbers = {}
+        self._last_task = None #objeto da tarefa do ultimo intervalo, p/ saber se eh a mesma continuando
+        #posicao onde cada truncate cortou, p/ quem indexa a escala (gantt_view) saber o que refazer
+        self.truncations = array("q")
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self): #(id da tarefa ou None, inicio, fim, motivo)
+        for i in range(len(self.starts)):
+            yield self.interval(i)
+
+    @property
+    def end_tick(self):
+        return self.ends[-1] if self.ends else 0
+
+    def interval(self, i):
+        number = self.tasks[i]
+        task_id = None if number == IDLE else self.labels[number][0]
+        return (task_id, self.starts[i], self.ends[i], self.reasons[i])
+
+    def color(self, i): #cor da tarefa do intervalo i (None se ociosa)
+        number = self.tasks[i]
+        return None if number == IDLE else self.labels[number][1]
+
+    def _label_number(self, task):
+        key = (task.task_id, task.color)
+        number = self._label_numbers.get(key)
+        if number is None:
+            number = len(self.labels)
+            self.labels.append(key)
+            self._label_numbers[key] = number
+        return number
+
+    def record(self, task, start, end):
+        #task None = cpu ociosa. se eh a mesma tarefa emendando no intervalo aberto, so estica
+        if (
+            self.starts
+            and self._last_task == task
+            and self.ends[-1] == start
+            and self.reasons[-1] == REASON_RUNNING
+        ):
+            self.ends[-1] = end
+            return
+        if self.reasons and self.reasons[-1] == REASON_RUNNING:
+            #ninguem fechou o anterior: ociosidade acaba com despacho, tarefa com preempcao
+            self.reasons[-1] = REASON_DISPATCH if self.tasks[-1] == IDLE else REASON_PREEMPTED
+        self.starts.append(start)
+        self.ends.append(end)
+        self.tasks.append(IDLE if task is None else self._label_number(task))
+        self.reasons.append(REASON_RUNNING)
+        self._last_task = task
+
+    def close(self, reason): #fecha o intervalo aberto dizendo por que a cpu trocou
+        if self.reasons and self.reasons[-1] == REASON_RUNNING:
+            self.reasons[-1] = reason
+
+    def truncate(self, tick, last_task=None):
+        #descarta tudo a partir desse tick (o intervalo que cruza o tick fica aberto, cortado nele).
+        #last_task = tarefa que rodava no tick anterior, p/ o proximo record emendar nela
+        i = bisect_right(self.starts, tick - 1)
+        del self.starts[i:], self.ends[i:], self.tasks[i:], self.reasons[i:]
+        self.truncations.append(i)
+        if self.ends and self.ends[-1] > tick:
+            self.ends[-1] = tick
+            self.reasons[-1] = REASON_RUNNING
+        elif self.reasons and self.reasons[-1] in (REASON_PREEMPTED, REASON_DISPATCH):
+            #preempcao e despacho sao decididos no tick seguinte, que foi descartado
+            self.reasons[-1] = REASON_RUNNING
+        self._last_task = last_task
+
+    def _find(self, tick): #indice do intervalo que contem o tick, ou -1
+        i = bisect_right(self.starts, tick) - 1
+        if i >= 0 and self.ends[i] > tick:
+            return i
+        return -1
+
+    def at(self, tick):
+        #o que rodou nesse tick, em O(log n); None se o tick ta fora da escala
+        i = self._find(tick)
+        return self.interval(i) if i >= 0 else None
+
+    def range(self, start, end):
+        #intervalos que encostam em [start, end), em O(log n + k)
+        i = max(bisect_right(self.starts, start) - 1, 0)
+        result = []
+        while i < len(self.starts) and self.starts[i] < end:
+            if self.ends[i] > start:
+                result.append(self.interval(i))
+            i += 1
+        return result
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, len(self.starts), len(self.labels)))
+            for task_id, color in self.labels:
+                for text in (task_id, color):
+                    data = text.encode("utf-8")
+                    f.write(LABEL_SIZE.pack(len(data)))
+                    f.write(data)
+            pack = RECORD.pack
+            for i in range(len(self.starts)):
+                f.write(pack(self.starts[i], self.ends[i], self.tasks[i], self.reasons[i]))
+
+    @classmethod
+    def load(cls, path):
+        #carrega o arquivo inteiro de volta p/ memoria
+        schedule = cls()
+        with ScheduleFile(path) as schedule_file:
+            for task_id, color in schedule_file.labels:
+                schedule._label_numbers[(task_id, color)] = len(schedule.labels)
+                schedule.labels.append((task_id, color))
+            for i in range(len(schedule_file)):
+                start, end, number, reason = schedule_file.record(i)
+                schedule.starts.append(start)
+                schedule.ends.append(end)
+                schedule.tasks.append(number)
+                schedule.reasons.append(reason)
+        return schedule
+
+
+class ScheduleFile:
+    #acesso aleatorio a um arquivo salvo sem carregar os intervalos: le so o cabecalho e a
+    #tabela de tarefas e faz busca binaria nos registros com seek
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        magic, version, _, self._count, label_count = HEADER.unpack(
+            self._file.read(HEADER.size)
+        )
+        if magic != MAGIC or version != VERSION:
+            self._file.close()
+            raise ValueError(f"{path} não é um arquivo de escala válido")
+        self.labels = []
+        for _ in range(label_count):
+            texts = []
+            for _ in range(2):
+                (size,) = LABEL_SIZE.unpack(self._file.read(LABEL_SIZE.size))
+                texts.append(self._file.read(size).decode("utf-8"))
+            self.labels.append(tuple(texts))
+        self._records_offset = self._file.tell()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        self._file.close()
+
+    def record(self, i): #registro cru (inicio, fim, numero da tarefa, motivo)
+        self._file.seek(self._records_offset + i * RECORD.size)
+        return RECORD.unpack(self._file.read(RECORD.size))
+
+    def interval(self, i):
+        start, end, number, reason = self.record(i)
+        task_id = None if number == IDLE else self.labels[number][0]
+        return (task_id, start, end, reason)
+
+    def _last_starting_at_or_before(self, tick):
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self.record(mid)[0] <= tick:
+                low = mid + 1
+            else:
+                high = mid
+        return low - 1
+
+    def at(self, tick):
+        i = self._last_starting_at_or_before(tick)
+        if i >= 0:
+            interval = self.interval(i)
+            if interval[2] > tick:
+                return interval
+        return None
+
+    def range(self, start, end):
+        i = max(self._last_starting_at_or_before(start), 0)
+        result = []
+        while i < self._count:
+            interval = self.interval(i)
+            if interval[1] >= end:
+                break
+            if interval[2] > start:
+                result.append(interval)
+            i += 1
+        return result
+
+
+def _describe(interval):
+    task_id, start, end, reason = interval
+    who = task_id if task_id is not None else "(ociosa)"
+    return f"{start:>8} {end:>8}  {who:<16} {REASON_NAMES[reason]}"
+
+
+if __name__ == "__main__":
+    #consulta rapida: python schedule.py escala.sched [tick | inicio fim]
+    if len(sys.argv) < 2:
+        print("uso: python schedule.py ARQUIVO [TICK | INICIO FIM]")
+        sys.exit(2)
+    with ScheduleFile(sys.argv[1]) as schedule_file:
+        if len(sys.argv) == 3:
+            found = schedule_file.at(int(sys.argv[2]))
+            intervals = [found] if found else []
+        elif len(sys.argv) >= 4:
+            intervals = schedule_file.range(int(sys.argv[2]), int(sys.argv[3]))
+        else:
+            intervals = [schedule_file.interval(i) for i in range(len(schedule_file))]
+        for interval in intervals:
+            print(_describe(interval))
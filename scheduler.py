@@ -1,61 +1,137 @@
-from collections import deque
+from ready_queue import ReadyQueue, RoundRobinQueue
 
 class FifoScheduler:  #mais simples, quem chega primeiro roda primeiro
+    def make_ready_queue(self): #fila sem chave, sai na ordem em que entrou
+        return ReadyQueue()
+
     def select_next_task(self, ready_queue, running_task=None): #se ja tem alguem rodando, deixa ele terminar
         if running_task:
             return running_task
-        
+
         if not ready_queue: #se nao tem ninguem rodando e a fila ta vazia, fica ocioso
             return None
         return ready_queue.popleft() #se tem gente na fila, pega o primeiro que chegou, no caso o da esquerda
 
+    def decision_horizon(self, ready_queue, running_task):
+        #quantos ticks a decisao atual vale se nao chegar ninguem (None = ate a tarefa terminar)
+        #fifo nunca preempta, entao so muda quando a tarefa termina
+        return None
+
 class PriorityScheduler:
-    #escolhe pela prioridade (menor = mais importante)
+    #escolhe pela prioridade (o maior numero ganha, igual o max() sempre fez)
     #ele preempta se chega alguem mais importante
+    def make_ready_queue(self):
+        #heap com a prioridade invertida: o topo eh o de maior prioridade e,
+        #no empate, o que entrou primeiro na fila
+        return ReadyQueue(key=lambda task: -task.priority)
+
     def select_next_task(self, ready_queue, running_task=None):
-        #junta todos que podem rodar e/ou quem ta na fila e quem ta rodando caso seja o caso
-        candidates = list(ready_queue)
-        if running_task:
-            candidates.append(running_task)
-        
+        #so precisa comparar o topo da fila com quem ta rodando
+        best_ready = ready_queue.peek()
+
         #se nao tem nada, cpu fica ociosa.
-        if not candidates:
-            return None
-        
-        #acha quem tem o menor numero de prioridade da lista
-        highest_priority_task = max(candidates, key=lambda task: task.priority)
-        return highest_priority_task
+        if best_ready is None:
+            return running_task
+
+        #quem ta rodando so continua se for estritamente mais importante,
+        #no empate o da fila ganha (antes ele vinha primeiro na lista do max())
+        if running_task and running_task.priority > best_ready.priority:
+            return running_task
+        return best_ready
+
+    def decision_horizon(self, ready_queue, running_task):
+        #se alguem na fila empata com quem ta rodando eles se revezam a cada tick
+        best_ready = ready_queue.peek()
+        if running_task and best_ready and best_ready.priority >= running_task.priority:
+            return 1
+        return None
 
 
 #escolhe quem tem menos tempo faltando p/ terminar, tbm preemptivo, se chega alguem que termina mais rapido ele troca.
 class SrtfScheduler:
-    #mesma logica do de prioridades, junta todos que podem rodar (fila + quem ta na cpu).
+    def make_ready_queue(self):
+        #o tempo restante de quem ta na fila nao muda (so quem ta rodando diminui),
+        #entao da p/ usar ele direto como chave do heap
+        return ReadyQueue(key=lambda task: task.remaining_time)
+
     def select_next_task(self, ready_queue, running_task=None):
-        candidates = list(ready_queue)
-        if running_task:
-            candidates.append(running_task)
-            
-        if not candidates:
-            return None
-        
+        best_ready = ready_queue.peek()
+
+        if best_ready is None:
+            return running_task
+
         # --- lógica de desempate ---
-        #chave de ordenação  p/ o caso de empate
-    
-        def sort_key(task):
-            #o critério principal é o tempo restante (quem tem menos, ganha)
-            remaining_time = task.remaining_time
-            
-            #critério de desempate: se o tempo for igual,
-            #quem já estava rodando (running_task) tem preferência.
-            #  0 p/ quem ta rodando e 1 p/ quem ta na fila,
-            #assim o min() sempre vai pegar o 0 em caso de empate.
-            is_running = 0 if task is running_task else 1
-            
-            #retorna uma tupla. o python ordena primeiro pelo tempo, depois pelo desempate.
-            return (remaining_time, is_running)
-        
-        #acha a tarefa "mínima" usando a  chave de desempate
-        shortest_remaining_task = min(candidates, key=sort_key)
-        
-    
-        return shortest_remaining_task
+        #o critério principal é o tempo restante (quem tem menos, ganha)
+        #critério de desempate: se o tempo for igual,
+        #quem já estava rodando (running_task) tem preferência.
+        #entre os da fila o heap ja desempata pela ordem de chegada na fila
+        if running_task and running_task.remaining_time <= best_ready.remaining_time:
+            return running_task
+
+        return best_ready
+
+    def decision_horizon(self, ready_queue, running_task):
+        #quem ta rodando so fica mais curto e ganha no empate, entao so chegada ou termino mudam a escolha
+        return None
+
+
+#round robin: cada tarefa roda no maximo um quantum seguido e depois vai p/ o fim da fila.
+#a fila eh um deque (gira em O(1)) e a fatia eh contada pelo tempo restante de quem ta rodando,
+#entao nunca precisa varrer a fila nem guardar nada por tarefa na fila
+class RoundRobinScheduler:
+    def __init__(self, quantum=1):
+        self.quantum = max(quantum, 1) #quantum 0 ou negativo no arquivo vira 1
+        self._slice_task = None #quem ta usando a fatia atual
+        self._slice_until = 0 #a fatia acaba quando o tempo restante dela chegar nesse valor
+
+    def make_ready_queue(self):
+        return RoundRobinQueue()
+
+    def _start_slice(self, task):
+        self._slice_task = task
+        self._slice_until = task.remaining_time - self.quantum
+
+    def select_next_task(self, ready_queue, running_task=None):
+        #== e nao "is": no modo compacto a mesma tarefa pode vir em views diferentes
+        if running_task is not None and running_task == self._slice_task:
+            overshoot = self._slice_until - running_task.remaining_time
+            if overshoot > 0:
+                #o motor de eventos pulou fatias que acabaram com a fila vazia (ela so renovou);
+                #anda direto p/ fatia que vale agora, igual se tivesse renovado tick a tick
+                self._slice_until -= self.quantum * -(-overshoot // self.quantum)
+            if running_task.remaining_time > self._slice_until: #ainda tem fatia
+                return running_task
+            if not ready_queue: #fatia acabou mas nao tem mais ninguem: ganha outra
+                self._slice_until -= self.quantum
+                return running_task
+
+        if not ready_queue:
+            return running_task
+        #o simulador poe quem saiu no fim da fila, depois de quem chegou nesse tick
+        next_task = ready_queue.popleft()
+        self._start_slice(next_task)
+        return next_task
+
+    def decision_horizon(self, ready_queue, running_task):
+        #com gente esperando a troca acontece quando a fatia acaba; sem ninguem so chegada ou termino mudam algo
+        if running_task is not None and ready_queue:
+            return running_task.remaining_time - self._slice_until
+        return None
+
+
+#nome do algoritmo no cabecalho do arquivo -> classe do escalonador
+SCHEDULERS = {
+    "FIFO": FifoScheduler,
+    "FCFS": FifoScheduler,
+    "PRIOP": PriorityScheduler,
+    "SRTF": SrtfScheduler,
+    "RR": RoundRobinScheduler,
+}
+
+
+def create_scheduler(algorithm_name, quantum=1):
+    #algoritmo desconhecido cai no fifo, como o simulador sempre fez
+    scheduler_class = SCHEDULERS.get(algorithm_name, FifoScheduler)
+    if scheduler_class is RoundRobinScheduler: #so o round robin usa o quantum
+        return scheduler_class(quantum)
+    return scheduler_class()
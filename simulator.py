@@ -1,76 +1,177 @@
-import time
-from collections import deque
-from task import Task
-from scheduler import FifoScheduler, PriorityScheduler, SrtfScheduler
+from metrics import MetricsCollector
+from ready_queue import ReadyQueue
+from arrivals import ArrivalIndex, StreamingArrivalIndex, TableArrivalIndex
+from schedule import REASON_BLOCKED, REASON_FINISHED, REASON_PREEMPTED, Schedule
+from scheduler import SCHEDULERS, create_scheduler
+from task_table import TaskTable
+from timing_wheel import TimingWheel
+from workload import WorkloadError, WorkloadReader
+from trace_sinks import TextSink
 
 
 class Simulator:
-    def __init__(self, config_file_path):
+    def __init__(
+        self,
+        config_file_path,
+        trace=None,
+        streaming=False,
+        compact=False,
+        record_schedule=True,
+    ):
         self.global_tick = 0
+        #p/ onde vai o rastro da simulacao; sem nada imprime no console como sempre foi
+        self.trace = trace if trace is not None else TextSink()
         self.running_task = None
-        self.task_list = []
+        #escala em intervalos (quem rodou de quando ate quando e por que trocou); None = nao grava
+        self.schedule = Schedule() if record_schedule else None
+        #metricas atualizadas a cada despacho/termino (turnaround, espera, resposta, uso da cpu...)
+        self.metrics = MetricsCollector()
+        self.arrivals = ArrivalIndex([]) #tarefas que ainda vao chegar, ordenadas por ingresso
         self.original_task_list = [] #copia da lista p/ mostrar na janela ver dados
-        self.ready_queue = deque()
+        self.task_table = None #so no modo compacto: as tarefas ficam em colunas (TaskTable)
+        self.ready_queue = ReadyQueue() #vazia ate o escalonador montar a dele (_use_scheduler)
+        #tarefas bloqueadas em E/S, cada uma agendada p/ o tick em que acorda
+        self.blocked = TimingWheel()
         self.scheduler = None
         self.scheduling_algorithm_name = "N/A"
-        self.quantum = 0 #para o projeto b
-        self._load_tasks_from_file(config_file_path)
+        self.quantum = 0 #fatia de tempo do round robin (RR)
+        self.load_errors = [] #erros de leitura por linha (a linha ruim eh ignorada, o resto roda)
+        if config_file_path is not None: #sem arquivo = vai ser montado por from_workload
+            self._load_tasks_from_file(config_file_path, streaming, compact)
+
+    @classmethod
+    def from_workload(cls, workload, algorithm_name=None, quantum=None, **options):
+        #simulacao de uma carga ja lida (Workload), sem abrir o arquivo de novo.
+        #algorithm_name/quantum trocam o que veio no cabecalho
+        simulator = cls(None, **options)
+        simulator.quantum = workload.quantum if quantum is None else quantum
+        simulator._use_scheduler(algorithm_name or workload.algorithm_name)
+        simulator.load_errors = list(workload.errors)
+        simulator.original_task_list = workload.tasks()
+        simulator.arrivals = ArrivalIndex(simulator.original_task_list)
+        return simulator
+
+    def _use_scheduler(self, algorithm_name):
+        self.scheduling_algorithm_name = algorithm_name
+        self.scheduler = create_scheduler(algorithm_name, self.quantum)
+        #cada escalonador monta a fila de prontos do jeito que precisa (heap indexado)
+        self.ready_queue = self.scheduler.make_ready_queue()
+
+    def restart(self, quantum=None, algorithm_name=None):
+        #volta a mesma carga p/ o tick 0 (outro quantum/algoritmo) sem ler o arquivo nem
+        #ordenar as chegadas de novo. nao funciona no modo em fluxo, que ja consumiu o arquivo
+        if quantum is not None:
+            self.quantum = quantum
+        self._use_scheduler(algorithm_name or self.scheduling_algorithm_name)
+        if self.task_table is not None:
+            self.task_table.reset()
+        else:
+            for task in self.original_task_list:
+                task.reset()
+        self.arrivals.rewind()
+        self.blocked = TimingWheel()
+        self.global_tick = 0
+        self.running_task = None
+        self.schedule = Schedule() if self.schedule is not None else None
+        self.metrics = MetricsCollector()
 
-    def _load_tasks_from_file(self, file_path):
+    def _load_tasks_from_file(self, file_path, streaming=False, compact=False):
         try:
-            with open(file_path, "r") as f:
-                first_line = f.readline().strip().split(";")
-                self.scheduling_algorithm_name = first_line[0].upper()
-                self.quantum = int(first_line[1])
-
-                if self.scheduling_algorithm_name in ("FIFO", "FCFS"):
-                    self.scheduler = FifoScheduler()
-                elif self.scheduling_algorithm_name == "PRIOP":
-                    self.scheduler = PriorityScheduler()
-                elif self.scheduling_algorithm_name == "SRTF":
-                    self.scheduler = SrtfScheduler()
-                else:
-                    self.scheduler = FifoScheduler()
-
-                for line in f:
-                    parts = line.strip().split(";")
-                    task_id, color, arrival_time, duration = parts[0:4]
-                    priority = parts[4] if len(parts) > 4 else "99"
-                    events = parts[5:] if len(parts) > 5 else []
-                    new_task = Task(
-                        task_id, color, arrival_time, duration, priority, events
-                    )
-                    self.task_list.append(new_task)
-
-            self.original_task_list = list(self.task_list)
-
-        except Exception as e: 
+            reader = WorkloadReader(file_path, on_error=self._report_load_error)
+        except OSError as e:
             print(f"Erro ao ler o arquivo de configuração: {e}")
-            self.task_list = []
-            self.original_task_list = []
+            return
+
+        self.quantum = reader.quantum
+        if reader.algorithm_name not in SCHEDULERS:
+            reader.report(
+                WorkloadError(1, f"algoritmo desconhecido {reader.algorithm_name!r}, usando FIFO")
+            )
+        self._use_scheduler(reader.algorithm_name)
+        self.load_errors = reader.errors
+
+        if streaming:
+            #arquivo ja ordenado por ingresso: as tarefas vao sendo lidas conforme chegam,
+            #sem guardar a lista inteira (original_task_list fica vazia nesse modo)
+            self.arrivals = StreamingArrivalIndex(reader)
+        elif compact:
+            #tabela em colunas; original_task_list vira uma lista "virtual" que cria
+            #as views sob demanda, entao quem usa a api do Task continua funcionando
+            self.task_table = TaskTable.from_records(reader.records())
+            self.original_task_list = self.task_table.views()
+            self.arrivals = TableArrivalIndex(self.task_table)
+        else:
+            self.original_task_list = list(reader)
+            self.arrivals = ArrivalIndex(self.original_task_list)
+
+    def _report_load_error(self, error): #linha ruim vira aviso, o resto do arquivo continua valendo
+        print(f"Erro no arquivo de configuração, {error}")
 
     def _check_for_new_arrivals(self): #checa se vem tarefa pronta no tick
-        for task in self.task_list[:]:
-            if task.arrival_time == self.global_tick:
-                task.status = "PRONTO"
-                self.ready_queue.append(task)
-                self.task_list.remove(task)
-                print(
-                    f"Tick {self.global_tick}: Tarefa {task.task_id} chegou e está PRONTA."
-                )
+        #o indice ja ta ordenado, entao so pega quem chega agora sem olhar o resto
+        for task in self.arrivals.pop_due(self.global_tick):
+            self.trace.arrived(self.global_tick, task)
+            io_length = self._io_due(task)
+            if io_length is not None: #E/S logo no comeco, antes de rodar
+                self._block(task, self.global_tick, io_length)
+            else:
+                self._make_ready(task)
+        #depois quem terminou a E/S agora (a roda so mexe no que vence nesse tick)
+        for task in self.blocked.advance(self.global_tick):
+            self._make_ready(task)
+            self.trace.woke(self.global_tick, task)
+
+    def _io_due(self, task):
+        #se a tarefa chegou no ponto do proximo evento de E/S, devolve quanto tempo ela bloqueia
+        if task.next_io < len(task.io_events):
+            at, length = task.io_events[task.next_io]
+            if task.duration - task.remaining_time == at:
+                return length
+        return None
+
+    def _ticks_until_io(self, task): #ticks de cpu ate a proxima E/S (None se nao tem mais)
+        if task.next_io < len(task.io_events):
+            return task.io_events[task.next_io][0] - (task.duration - task.remaining_time)
+        return None
+
+    def _block(self, task, tick, length):
+        task.status = "BLOQUEADO"
+        task.next_io += 1
+        self.blocked.schedule(task, tick + length)
+        self.trace.blocked(tick, task, tick + length)
+
+    def _leave_cpu(self, task, end):
+        #depois de rodar ate end: termina, bloqueia p/ E/S ou continua (devolve True se saiu da cpu)
+        if task.remaining_time <= 0:   #checa se terminou
+            task.status = "TERMINADO"
+            task.finish_time = end
+            self.metrics.on_finish(task, end)
+            self.trace.finished(end, task)
+            if self.schedule is not None:
+                self.schedule.close(REASON_FINISHED)
+            return True
+        io_length = self._io_due(task)
+        if io_length is not None:
+            if self.schedule is not None:
+                self.schedule.close(REASON_BLOCKED)
+            self._block(task, end, io_length)
+            return True
+        return False
+
+    def _make_ready(self, task): #coloca na fila de prontos e marca desde quando ta esperando
+        task.status = "PRONTO"
+        task.waiting_since = self.global_tick
+        self.ready_queue.append(task)
 
     def _is_simulation_complete(self): #acaba se nao tem mais tarefa p/ chegar
-        return not self.task_list and not self.ready_queue and self.running_task is None
-
-    def tick(self): #roda o tick-tack 
-        if self._is_simulation_complete():
-            print(f"\n--- Simulação Concluída em {self.global_tick} ticks ---")
-            return None
-
-        print(f"Tick {self.global_tick}:")
+        return (
+            not self.arrivals
+            and not self.ready_queue
+            and self.running_task is None
+            and not self.blocked
+        )
 
-        self._check_for_new_arrivals()
-        #decisao do escalonador
+    def _dispatch(self): #decisao do escalonador, usada tanto pelo tick quanto pelo motor de eventos
         best_candidate = self.scheduler.select_next_task(
             self.ready_queue, self.running_task
         )
@@ -78,9 +179,11 @@ class Simulator:
         if self.running_task != best_candidate:
             #se tinha alguem rodando e ele n é o melhor...
             if self.running_task:
-                print(f"  > Tarefa {self.running_task.task_id} foi PREEMPTADA.")
-                self.running_task.status = "PRONTO"
-                self.ready_queue.append(self.running_task)
+                self.trace.preempted(self.global_tick, self.running_task)
+                if self.schedule is not None:
+                    self.schedule.close(REASON_PREEMPTED)
+                self.metrics.on_preempt(self.running_task, self.global_tick)
+                self._make_ready(self.running_task)
 
             self.running_task = best_candidate #melhor candidato vira a tarefa que vai rodar
             if self.running_task: #se for ninguem
@@ -88,29 +191,64 @@ class Simulator:
                     self.ready_queue.remove(self.running_task) #tira da fila, vai p pseudo cpu
 
                 self.running_task.status = "EXECUTANDO"
+                #soma o tempo que ela ficou parada na fila desde que entrou
+                if self.running_task.waiting_since != -1:
+                    self.running_task.waiting_time += self.global_tick - self.running_task.waiting_since
+                    self.running_task.waiting_since = -1
                 #se for a primeira vez rodando
                 if self.running_task.start_time == -1:
                     self.running_task.start_time = self.global_tick
-                print(
-                    f"  > Tarefa {self.running_task.task_id} (Prio:{self.running_task.priority} | Restante:{self.running_task.remaining_time}) começou/continuou a EXECUTAR."
-                )
+                self.metrics.on_dispatch(self.running_task, self.global_tick)
+                self.trace.dispatched(self.global_tick, self.running_task)
+
+    def tick(self): #roda o tick-tack 
+        if self._is_simulation_complete():
+            self.trace.completed(self.global_tick)
+            return None
+
+        self.trace.tick_started(self.global_tick)
+
+        self._check_for_new_arrivals()
+        self._dispatch()
 
         task_that_ran_this_tick = None #guarda quem rodou nesse tick p desenhar depois, começando com ninguem
         if self.running_task:
             #avisa que esta rodando
-            print(f"  > Tarefa {self.running_task.task_id} está executando...")
+            self.trace.ran(self.running_task, self.global_tick, self.global_tick + 1)
             #diminui o tempo p/ terminar
             self.running_task.remaining_time -= 1
             #marca como tarefa que rodou neste tick
             task_that_ran_this_tick = self.running_task
+            if self.schedule is not None:
+                self.schedule.record(self.running_task, self.global_tick, self.global_tick + 1)
+            self.metrics.on_run(1)
 
-            if self.running_task.remaining_time <= 0:   #checa se terminou
-                self.running_task.status = "TERMINADO"
-                self.running_task.finish_time = self.global_tick + 1
-                print(f"  > Tarefa {self.running_task.task_id} TERMINOU.")
+            if self._leave_cpu(self.running_task, self.global_tick + 1): #terminou ou foi p/ E/S
                 self.running_task = None
         else:
-            print("  > CPU Ociosa.")
+            self.trace.idle(self.global_tick, self.global_tick + 1)
+            if self.schedule is not None:
+                self.schedule.record(None, self.global_tick, self.global_tick + 1)
+            self.metrics.on_idle(1)
 
         self.global_tick += 1 #avança o relogio global p proximo round
         return task_that_ran_this_tick
+
+    def run(self, collect=True): #roda ate o fim sem parar (modo sem janela) e devolve os intervalos de execucao
+        #(collect=False nao guarda nada, p/ cargas que nao cabem na memoria)
+        intervals = []
+        while not self._is_simulation_complete():
+            start = self.global_tick
+            task = self.tick()
+            if collect:
+                append_interval(intervals, task, start, start + 1)
+        self.trace.completed(self.global_tick)
+        return intervals
+
+
+def append_interval(intervals, task, start, end):
+    #junta com o ultimo intervalo se for a mesma tarefa (ou ociosidade) continuando
+    if intervals and intervals[-1][0] == task and intervals[-1][2] == start:
+        intervals[-1] = (task, intervals[-1][1], end)
+    else:
+        intervals.append((task, start, end))
@@ -0,0 +1,331 @@
+import heapq
+
+from schedule import REASON_BLOCKED, REASON_FINISHED, REASON_PREEMPTED, Schedule
+from scheduler import create_scheduler
+from simulator import Simulator, append_interval
+
+#global = uma fila de prontos so, qualquer nucleo pega dela
+#percore = cada nucleo com a sua fila; chegadas vao p/ o menos carregado e o balanceador rouba trabalho
+QUEUE_MODES = ("percore", "global")
+
+
+class Cpu:
+    #um nucleo: quem ta rodando nele, a fila que ele olha e os contadores dele
+    def __init__(self, index, scheduler, ready_queue):
+        self.index = index
+        self.scheduler = scheduler #um por nucleo (o round robin guarda a fatia de quem ta rodando)
+        self.ready_queue = ready_queue #a propria (percore) ou a global, compartilhada
+        self.running_task = None
+        self.busy_ticks = 0
+        self.context_switches = 0
+        self.migrations = 0 #vezes que uma tarefa voltou a rodar aqui vindo de outro nucleo
+        self.last_task = None
+        self.schedule = None
+
+    @property
+    def load(self): #quanta coisa ja ta esperando esse nucleo
+        return len(self.ready_queue) + (self.running_task is not None)
+
+    @property
+    def waiting(self): #quantas da fila nao vao rodar agora (da p/ roubar sem deixar ele parado)
+        return len(self.ready_queue) - (self.running_task is None)
+
+
+class SmpSimulator(Simulator):
+    #mesma simulacao tick a tick, mas com varios nucleos. o laco de cada tick so passa pelos
+    #nucleos que tem algo p/ fazer (conjunto _active), entao o custo cresce com os nucleos
+    #ocupados e nao com o total de tarefas nem de nucleos parados
+    def __init__(
+        self,
+        config_file_path,
+        cpus=4,
+        queue_mode="percore",
+        affinity=None,
+        balance_interval=10,
+        record_schedule=True,
+        **options
+    ):
+        if queue_mode not in QUEUE_MODES:
+            raise ValueError(f"modo de fila desconhecido: {queue_mode!r}")
+        if cpus < 1:
+            raise ValueError("precisa de pelo menos 1 núcleo")
+        if affinity and queue_mode == "global":
+            raise ValueError("afinidade só funciona com fila por núcleo (percore)")
+        self.cpu_count = cpus
+        self.queue_mode = queue_mode
+        #id da tarefa -> nucleos onde ela pode rodar; quem nao ta aqui roda em qualquer um
+        self.affinity = {task_id: sorted(set(cores)) for task_id, cores in (affinity or {}).items()}
+        for cores in self.affinity.values():
+            if not cores or not all(0 <= core < cpus for core in cores):
+                raise ValueError(f"afinidade com núcleo inexistente: {cores}")
+        self.balance_interval = balance_interval #0 = sem balanceamento
+        self.record_core_schedules = record_schedule #uma escala por nucleo em cpus[i].schedule
+        self.cpus = []
+        self._active = set()
+        self._idle = []
+        self._idle_members = set()
+        self._last_core = {}
+        self.migrations = 0
+        #a escala unica do Simulator nao serve aqui, cada nucleo tem a sua
+        super().__init__(config_file_path, record_schedule=False, **options)
+
+    def _use_scheduler(self, algorithm_name):
+        super()._use_scheduler(algorithm_name) #self.ready_queue vira a fila global
+        self.cpus = []
+        for index in range(self.cpu_count):
+            scheduler = create_scheduler(algorithm_name, self.quantum)
+            if self.queue_mode == "global":
+                ready_queue = self.ready_queue
+            else:
+                ready_queue = scheduler.make_ready_queue()
+            cpu = Cpu(index, scheduler, ready_queue)
+            cpu.schedule = Schedule() if self.record_core_schedules else None
+            self.cpus.append(cpu)
+        self._active = set() #nucleos rodando alguem ou (percore) com fila nao vazia
+        self._idle = list(range(self.cpu_count)) #heap dos parados, o de menor numero no topo
+        self._idle_members = set(self._idle)
+        self._last_core = {} #tarefa -> ultimo nucleo onde rodou, p/ contar migracao
+        self.migrations = 0
+
+    def _is_simulation_complete(self):
+        return not self.arrivals and not self._active and not self.ready_queue and not self.blocked
+
+    def _deactivate(self, index):
+        self._active.discard(index)
+        if index not in self._idle_members:
+            self._idle_members.add(index)
+            heapq.heappush(self._idle, index)
+
+    def _pop_idle(self):
+        #menor nucleo parado, ou None. quem voltou a trabalhar por outro caminho (afinidade,
+        #roubo) ainda pode estar no heap; essas entradas velhas sao jogadas fora aqui
+        while self._idle:
+            index = heapq.heappop(self._idle)
+            self._idle_members.discard(index)
+            if index not in self._active:
+                return index
+        return None
+
+    def _allowed_cores(self, task):
+        return self.affinity.get(task.task_id) or range(self.cpu_count)
+
+    def _make_ready(self, task, cpu=None):
+        #cpu = nucleo de onde ela saiu (preempcao); None = acabou de chegar, escolhe um
+        task.status = "PRONTO"
+        task.waiting_since = self.global_tick
+        if self.queue_mode == "global":
+            self.ready_queue.append(task)
+            return
+        if cpu is None:
+            #vai p/ o nucleo parado de menor numero; se nao tem nenhum (ou tem afinidade),
+            #p/ o permitido menos carregado. so varre os nucleos quando todos estao ocupados
+            index = None if task.task_id in self.affinity else self._pop_idle()
+            if index is not None:
+                cpu = self.cpus[index]
+            else:
+                cpu = min(
+                    (self.cpus[index] for index in self._allowed_cores(task)),
+                    key=lambda candidate: (candidate.load, candidate.index),
+                )
+        cpu.ready_queue.append(task)
+        self._active.add(cpu.index)
+
+    def _balance(self):
+        #roubo de trabalho: cada nucleo com a fila vazia puxa a proxima tarefa da fila de quem
+        #tem mais gente esperando (so se sobra trabalho la, p/ nao so trocar de lugar).
+        #as vitimas saem de um heap montado so com os nucleos ativos
+        victims = []
+        for index in self._active:
+            waiting = self.cpus[index].waiting
+            if waiting > 0:
+                victims.append((-waiting, index))
+        heapq.heapify(victims)
+        for thief in self.cpus:
+            if not victims:
+                return #ninguem tem sobra, nem adianta olhar os outros
+            if thief.ready_queue:
+                continue
+            waiting, index = victims[0]
+            if thief.running_task is not None and -waiting < 2:
+                continue #ele ja ta ocupado, so vale puxar se la tem mais de um esperando
+            victim = self.cpus[index]
+            task = victim.ready_queue.peek()
+            if thief.index not in self._allowed_cores(task):
+                continue
+            victim.ready_queue.remove(task)
+            thief.ready_queue.append(task)
+            self._active.add(thief.index)
+            if victim.waiting > 0:
+                heapq.heapreplace(victims, (-victim.waiting, index))
+            else:
+                heapq.heappop(victims)
+
+    def _dispatch_on(self, cpu):
+        #o mesmo _dispatch do Simulator, mas p/ um nucleo
+        running_task = cpu.running_task
+        best_candidate = cpu.scheduler.select_next_task(cpu.ready_queue, running_task)
+        if running_task == best_candidate:
+            return
+        if running_task:
+            self.trace.preempted(self.global_tick, running_task)
+            if cpu.schedule is not None:
+                cpu.schedule.close(REASON_PREEMPTED)
+            self.metrics.on_preempt(running_task, self.global_tick)
+            self._make_ready(running_task, cpu)
+
+        cpu.running_task = best_candidate
+        if best_candidate is None:
+            return
+        if best_candidate in cpu.ready_queue:
+            cpu.ready_queue.remove(best_candidate)
+        self._active.add(cpu.index)
+        best_candidate.status = "EXECUTANDO"
+        if best_candidate.waiting_since != -1:
+            best_candidate.waiting_time += self.global_tick - best_candidate.waiting_since
+            best_candidate.waiting_since = -1
+        if best_candidate.start_time == -1:
+            best_candidate.start_time = self.global_tick
+
+        if cpu.last_task is not None and cpu.last_task != best_candidate:
+            cpu.context_switches += 1
+        cpu.last_task = best_candidate
+        previous_core = self._last_core.get(best_candidate)
+        if previous_core is not None and previous_core != cpu.index:
+            cpu.migrations += 1
+            self.migrations += 1
+        self._last_core[best_candidate] = cpu.index
+
+        self.metrics.on_dispatch(best_candidate, self.global_tick, cpu.index)
+        self.trace.dispatched(self.global_tick, best_candidate)
+
+    def _dispatch_global(self):
+        queue = self.ready_queue
+        #primeiro os nucleos parados pegam da fila (sem tirar ninguem), do menor numero p/ cima
+        filled = set()
+        while queue:
+            index = self._pop_idle()
+            if index is None:
+                break
+            self._dispatch_on(self.cpus[index])
+            filled.add(index)
+        if not queue:
+            return
+        #depois a fila disputa com quem ta rodando, comecando pelo pior (maior chave) p/ que a
+        #tarefa boa tire a pior e nao a primeira que aparecer
+        busy = sorted(
+            (self.cpus[index] for index in self._active if index not in filled),
+            key=lambda cpu: (queue.key_of(cpu.running_task), -cpu.index),
+            reverse=True,
+        )
+        for cpu in busy:
+            if not queue:
+                break
+            self._dispatch_on(cpu)
+
+    def tick(self):
+        #devolve [(numero do nucleo, tarefa)] de quem rodou nesse tick
+        if self._is_simulation_complete():
+            self.trace.completed(self.global_tick)
+            return None
+
+        tick = self.global_tick
+        self.trace.tick_started(tick)
+        self._check_for_new_arrivals()
+        if self.queue_mode == "global":
+            self._dispatch_global()
+        else:
+            if self.balance_interval and tick % self.balance_interval == 0:
+                self._balance()
+            for index in sorted(self._active):
+                self._dispatch_on(self.cpus[index])
+
+        ran = []
+        for index in sorted(self._active):
+            cpu = self.cpus[index]
+            task = cpu.running_task
+            if task is None:
+                if not cpu.ready_queue:
+                    self._deactivate(index)
+                continue
+            self.trace.ran(task, tick, tick + 1)
+            task.remaining_time -= 1
+            cpu.busy_ticks += 1
+            if cpu.schedule is not None:
+                cpu.schedule.record(task, tick, tick + 1)
+            ran.append((index, task))
+
+            if task.remaining_time <= 0:
+                task.status = "TERMINADO"
+                task.finish_time = tick + 1
+                self.metrics.on_finish(task, tick + 1)
+                self.trace.finished(tick + 1, task)
+                if cpu.schedule is not None:
+                    cpu.schedule.close(REASON_FINISHED)
+                self._last_core.pop(task, None)
+            else:
+                io_length = self._io_due(task)
+                if io_length is None:
+                    continue
+                if cpu.schedule is not None:
+                    cpu.schedule.close(REASON_BLOCKED)
+                self._block(task, tick + 1, io_length) #quando acordar vai p/ o nucleo que estiver livre
+            cpu.running_task = None
+            if self.queue_mode == "global" or not cpu.ready_queue:
+                self._deactivate(index)
+
+        if not ran:
+            self.trace.idle(tick, tick + 1)
+        self.metrics.on_run(len(ran))
+        self.metrics.on_idle(self.cpu_count - len(ran))
+        self.global_tick += 1
+        return ran
+
+    def _skip_idle(self):
+        #tudo parado esperando a proxima chegada (ou fim de E/S): pula direto p/ ela em vez de
+        #andar tick a tick
+        next_arrival = self.arrivals.peek_time()
+        next_wake = self.blocked.next_expiry()
+        if next_arrival is None or (next_wake is not None and next_wake < next_arrival):
+            next_arrival = next_wake
+        if next_arrival is None or next_arrival <= self.global_tick:
+            return
+        self.trace.idle(self.global_tick, next_arrival)
+        self.metrics.on_idle((next_arrival - self.global_tick) * self.cpu_count)
+        self.global_tick = next_arrival
+
+    def run(self, collect=True):
+        #devolve uma lista de intervalos por nucleo (so os ocupados; o que falta eh ociosidade)
+        intervals = [[] for _ in self.cpus]
+        while not self._is_simulation_complete():
+            if not self._active and not self.ready_queue:
+                self._skip_idle()
+            start = self.global_tick
+            for index, task in self.tick():
+                if collect:
+                    append_interval(intervals[index], task, start, start + 1)
+        self.trace.completed(self.global_tick)
+        return intervals
+
+    def core_summary(self):
+        ticks = self.global_tick
+        return [
+            {
+                "cpu": cpu.index,
+                "busy_ticks": cpu.busy_ticks,
+                "utilization": cpu.busy_ticks / ticks if ticks else 0.0,
+                "context_switches": cpu.context_switches,
+                "migrations": cpu.migrations,
+            }
+            for cpu in self.cpus
+        ]
+
+
+def format_core_summary(cores, migrations):
+    lines = [f"{'Núcleo':<8}{'Uso':>8}{'Ocupado':>10}{'Trocas':>10}{'Migrações':>11}"]
+    for core in cores:
+        lines.append(
+            f"{core['cpu']:<8}{core['utilization'] * 100:>7.1f}%{core['busy_ticks']:>10}"
+            f"{core['context_switches']:>10}{core['migrations']:>11}"
+        )
+    lines.append(f"Migrações no total: {migrations}")
+    return "\n".join(lines)
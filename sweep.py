@@ -0,0 +1,206 @@
+import argparse
+import csv
+import os
+import sys
+
+from compare import check_algorithms
+from event_simulator import EventSimulator
+from trace_sinks import NullSink
+from workload import Workload
+
+#colunas da tabela consolidada, na ordem em que saem no csv
+COLUMNS = (
+    "config",
+    "algorithm",
+    "quantum",
+    "tasks",
+    "ticks",
+    "cpu_utilization",
+    "context_switches",
+    "preemptions",
+    "turnaround_mean",
+    "turnaround_p95",
+    "waiting_mean",
+    "waiting_p95",
+    "response_mean",
+    "response_p95",
+)
+
+#cargas ja lidas, uma copia por processo (mandadas uma vez so pelo initializer do pool)
+_worker_workloads = {}
+
+
+def _init_worker(workloads):
+    _worker_workloads.update(workloads)
+
+
+def _round(value):
+    #arredonda p/ a tabela nao depender de ruido de ponto flutuante
+    return None if value is None else round(value, 4)
+
+
+def run_cell(workload, algorithm_name=None, quantum=None):
+    #uma celula da matriz: simula a carga com o algoritmo/quantum pedidos e devolve a linha da tabela
+    simulator = EventSimulator.from_workload(
+        workload,
+        algorithm_name=algorithm_name,
+        quantum=quantum,
+        trace=NullSink(),
+        record_schedule=False,
+    )
+    simulator.run(collect=False)
+    summary = simulator.metrics.summary()
+    return {
+        "config": workload.source,
+        "algorithm": simulator.scheduling_algorithm_name,
+        "quantum": simulator.quantum,
+        "tasks": len(workload),
+        "ticks": simulator.global_tick,
+        "cpu_utilization": _round(summary["cpu_utilization"]),
+        "context_switches": summary["context_switches"],
+        "preemptions": summary["preemptions"],
+        "turnaround_mean": _round(summary["turnaround"]["mean"]),
+        "turnaround_p95": _round(summary["turnaround"]["p95"]),
+        "waiting_mean": _round(summary["waiting"]["mean"]),
+        "waiting_p95": _round(summary["waiting"]["p95"]),
+        "response_mean": _round(summary["response"]["mean"]),
+        "response_p95": _round(summary["response"]["p95"]),
+    }
+
+
+def quantum_sensitivity(simulator, quanta, algorithm_name="RR"):
+    #roda a mesma carga com cada quantum, uma atras da outra. o arquivo eh lido e as chegadas
+    #ordenadas uma vez so (no simulador que vem pronto); cada rodada so volta tudo p/ o tick 0
+    rows = []
+    for quantum in quanta:
+        simulator.restart(quantum=quantum, algorithm_name=algorithm_name)
+        simulator.run(collect=False)
+        summary = simulator.metrics.summary()
+        rows.append(
+            {
+                "quantum": quantum,
+                "ticks": simulator.global_tick,
+                "context_switches": summary["context_switches"],
+                "preemptions": summary["preemptions"],
+                "response_mean": _round(summary["response"]["mean"]),
+                "response_p95": _round(summary["response"]["p95"]),
+                "turnaround_mean": _round(summary["turnaround"]["mean"]),
+            }
+        )
+    return rows
+
+
+def format_sensitivity(rows):
+    lines = [
+        f"{'Quantum':>8}{'Ticks':>10}{'Trocas':>10}{'Preempções':>12}"
+        f"{'Resposta média':>16}{'Resposta p95':>14}{'Turnaround médio':>18}"
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['quantum']:>8}{row['ticks']:>10}{row['context_switches']:>10}{row['preemptions']:>12}"
+            f"{_format_value(row['response_mean']):>16}{_format_value(row['response_p95']):>14}"
+            f"{_format_value(row['turnaround_mean']):>18}"
+        )
+    return "\n".join(lines)
+
+
+def _format_value(value):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def _run_cell_in_worker(cell):
+    path, algorithm_name, quantum = cell
+    return run_cell(_worker_workloads[path], algorithm_name, quantum)
+
+
+def build_cells(config_paths, algorithms=None, quanta=None):
+    #produto cartesiano arquivo x algoritmo x quantum, numa ordem fixa.
+    #None = usa o que veio no cabecalho de cada arquivo
+    return [
+        (path, algorithm_name, quantum)
+        for path in config_paths
+        for algorithm_name in (algorithms or [None])
+        for quantum in (quanta or [None])
+    ]
+
+
+def run_sweep(config_paths, algorithms=None, quanta=None, workers=None):
+    #cada arquivo eh lido uma vez so aqui no processo principal; as celulas rodam num pool
+    #de processos. o map devolve na ordem das celulas, entao a tabela sai igual com
+    #qualquer numero de processos
+    if algorithms:
+        #nome desconhecido eh erro antes de ler qualquer arquivo (o simulador cairia no fifo
+        #calado e a linha sairia com o nome pedido e o resultado do fifo)
+        algorithms = check_algorithms(algorithms)
+    workloads = {path: Workload.load(path) for path in dict.fromkeys(config_paths)}
+    cells = build_cells(list(workloads), algorithms, quanta)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(cells)))
+
+    if workers == 1:
+        return [run_cell(workloads[path], algorithm, quantum) for path, algorithm, quantum in cells]
+
+    from concurrent.futures import ProcessPoolExecutor #so quem usa o pool paga o import
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(workloads,)
+    ) as executor:
+        chunksize = max(1, len(cells) // (workers * 4))
+        return list(executor.map(_run_cell_in_worker, cells, chunksize=chunksize))
+
+
+def write_table(rows, stream):
+    writer = csv.DictWriter(stream, fieldnames=COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def _split_list(text):
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Roda vários arquivos x algoritmos x quanta em paralelo e junta os resultados numa tabela."
+    )
+    parser.add_argument("configs", nargs="+", help="arquivos de configuração (.txt)")
+    parser.add_argument(
+        "--algorithms",
+        type=lambda text: [name.upper() for name in _split_list(text)],
+        help="algoritmos separados por vírgula, ex: FIFO,PRIOP,SRTF (padrão: o do cabeçalho)",
+    )
+    parser.add_argument(
+        "--quanta",
+        type=lambda text: [int(value) for value in _split_list(text)],
+        help="quanta separados por vírgula, ex: 1,2,4 (padrão: o do cabeçalho)",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, help="processos em paralelo (padrão: todos os núcleos)"
+    )
+    parser.add_argument("-o", "--output", help="arquivo csv de saída (padrão: saída padrão)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.algorithms:
+        try:
+            args.algorithms = check_algorithms(args.algorithms)
+        except ValueError as e:
+            parser.error(str(e))
+    try:
+        rows = run_sweep(args.configs, args.algorithms, args.quanta, args.workers)
+    except OSError as e: #arquivo que nao existe ou nao da p/ ler
+        parser.error(f"erro ao ler o arquivo de configuração: {e}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            write_table(rows, f)
+    else:
+        write_table(rows, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,25 @@
+def parse_io_events(events):
+    #eventos de E/S do projeto B: "IO:xx-yy" = depois de xx ticks de cpu a tarefa fica yy ticks
+    #bloqueada esperando E/S. devolve [(xx, yy)] ordenado; outros eventos (ML/MU) ficam de fora.
+    #dois no mesmo ponto viram uma espera so, somada
+    bursts = {}
+    for event in events:
+        event = event.strip()
+        if not event.upper().startswith("IO:"):
+            continue
+        start, separator, length = event[3:].partition("-")
+        if not separator:
+            raise ValueError(f"evento de E/S inválido: {event!r}, esperado IO:xx-yy")
+        try:
+            start, length = int(start), int(length)
+        except ValueError:
+            raise ValueError(f"evento de E/S inválido: {event!r}, esperado IO:xx-yy")
+        if start < 0 or length < 1:
+            raise ValueError(f"evento de E/S inválido: {event!r}, precisa xx >= 0 e yy >= 1")
+        bursts[start] = bursts.get(start, 0) + length
+    return sorted(bursts.items())
+
+
 class Task: 
     #classe pseudo tcb
 
@@ -11,8 +33,10 @@ class Task:
         self.duration = int(duration)
         
         self.priority = int(priority_str) if priority_str else 0
-        #isso aqui fica para o projeto B
+        #eventos do projeto B; por enquanto so a E/S ("IO:xx-yy") eh simulada
         self.events = events_list if events_list is not None else []
+        # rajadas de E/S: (ticks de cpu ja usados quando bloqueia, quanto tempo fica bloqueada)
+        self.io_events = parse_io_events(self.events)
         # começa igual ao tempo total dela
         self.remaining_time = self.duration
         self.status = "NOVO"
@@ -21,8 +45,21 @@ class Task:
         self.start_time = -1
         # que terminou
         self.finish_time = -1
-        # que entrou na fila de prontos
+        # que entrou na fila de prontos (-1 = nao ta na fila)
+        self.waiting_since = -1
+        # quantos ticks ja passou esperando na fila de prontos (somando todas as vezes)
+        self.waiting_time = 0
+        # qual o proximo evento de E/S (indice em io_events)
+        self.next_io = 0
+
+    def reset(self): #volta ao estado de quando foi lida do arquivo, p/ rodar a mesma carga de novo
+        self.remaining_time = self.duration
+        self.status = "NOVO"
+        self.start_time = -1
+        self.finish_time = -1
         self.waiting_since = -1
+        self.waiting_time = 0
+        self.next_io = 0
 
     def __repr__(self): # isso  define como a tarefa aparece se der um print nela
 
@@ -0,0 +1,212 @@
+import sys
+from array import array
+
+from task import parse_io_events
+
+#o Task guarda o estado como string; a tabela guarda so um codigo pequeno por tarefa
+STATUS_NAMES = ("NOVO", "PRONTO", "EXECUTANDO", "TERMINADO", "BLOQUEADO")
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+
+class TaskTable:
+    #todas as tarefas em colunas paralelas (struct of arrays) em vez de um objeto por tarefa.
+    #cada coluna eh um array tipado do modulo array, entao uma tarefa custa algumas dezenas
+    #de bytes em vez de um Task inteiro com __dict__. a linha i de cada coluna eh a tarefa i
+    def __init__(self):
+        self.task_ids = []
+        self.colors = []
+        self.arrival = array("q")
+        self.duration = array("q")
+        self.remaining = array("q")
+        self.priority = array("q")
+        self.start = array("q")
+        self.finish = array("q")
+        self.waiting_since = array("q")
+        self.waited = array("q") #ticks acumulados na fila de prontos
+        self.state = array("b")
+        self.events = {} #so quem tem eventos entra aqui (quase ninguem no projeto A)
+        self.io_events = {} #idem p/ as rajadas de E/S ja interpretadas
+        self.next_io = {} #proximo evento de E/S de quem ja bloqueou alguma vez
+
+    @classmethod
+    def from_records(cls, records):
+        #records = tuplas (id, cor, ingresso, duracao, prioridade, eventos) como as do WorkloadReader
+        table = cls()
+        for record in records:
+            table.add(*record)
+        return table
+
+    def __len__(self):
+        return len(self.task_ids)
+
+    def add(self, task_id, color, arrival_time, duration, priority_str, events_list=None):
+        index = len(self.task_ids)
+        self.task_ids.append(task_id)
+        self.colors.append(sys.intern(color)) #as cores se repetem muito, guarda uma string so
+        self.arrival.append(int(arrival_time))
+        self.duration.append(int(duration))
+        self.remaining.append(int(duration))
+        #mesma regra do Task: prioridade vazia vira 0
+        self.priority.append(int(priority_str) if priority_str else 0)
+        self.start.append(-1)
+        self.finish.append(-1)
+        self.waiting_since.append(-1)
+        self.waited.append(0)
+        self.state.append(STATUS_CODES["NOVO"])
+        if events_list:
+            self.events[index] = events_list
+            io_events = parse_io_events(events_list)
+            if io_events:
+                self.io_events[index] = io_events
+        return index
+
+    def reset(self):
+        #volta todas as tarefas ao estado inicial de uma vez (coluna por coluna, sem criar views)
+        size = len(self.task_ids)
+        self.remaining = array("q", self.duration)
+        self.start = array("q", [-1]) * size
+        self.finish = array("q", [-1]) * size
+        self.waiting_since = array("q", [-1]) * size
+        self.waited = array("q", [0]) * size
+        self.state = array("b", [STATUS_CODES["NOVO"]]) * size
+        self.next_io.clear()
+
+    def view(self, index):
+        return TaskView(self, index)
+
+    def views(self):
+        return TaskViewList(self)
+
+
+class TaskView:
+    #"ponteiro" p/ uma linha da tabela com a mesma cara do Task (task_id, remaining_time, status...),
+    #assim escalonadores, simulador e gui funcionam sem saber que a tarefa mora na tabela.
+    #__slots__ deixa o objeto com so dois campos; duas views da mesma linha sao a mesma tarefa
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, TaskView)
+            and other.table is self.table
+            and other.index == self.index
+        )
+
+    def __hash__(self):
+        return self.index
+
+    @property
+    def task_id(self):
+        return self.table.task_ids[self.index]
+
+    @property
+    def color(self):
+        return self.table.colors[self.index]
+
+    @property
+    def arrival_time(self):
+        return self.table.arrival[self.index]
+
+    @property
+    def duration(self):
+        return self.table.duration[self.index]
+
+    @property
+    def priority(self):
+        return self.table.priority[self.index]
+
+    @property
+    def events(self):
+        return self.table.events.get(self.index, [])
+
+    @property
+    def io_events(self):
+        return self.table.io_events.get(self.index, ())
+
+    @property
+    def next_io(self):
+        return self.table.next_io.get(self.index, 0)
+
+    @next_io.setter
+    def next_io(self, value):
+        self.table.next_io[self.index] = value
+
+    @property
+    def remaining_time(self):
+        return self.table.remaining[self.index]
+
+    @remaining_time.setter
+    def remaining_time(self, value):
+        self.table.remaining[self.index] = value
+
+    @property
+    def status(self):
+        return STATUS_NAMES[self.table.state[self.index]]
+
+    @status.setter
+    def status(self, value):
+        self.table.state[self.index] = STATUS_CODES[value]
+
+    @property
+    def start_time(self):
+        return self.table.start[self.index]
+
+    @start_time.setter
+    def start_time(self, value):
+        self.table.start[self.index] = value
+
+    @property
+    def finish_time(self):
+        return self.table.finish[self.index]
+
+    @finish_time.setter
+    def finish_time(self, value):
+        self.table.finish[self.index] = value
+
+    @property
+    def waiting_since(self):
+        return self.table.waiting_since[self.index]
+
+    @waiting_since.setter
+    def waiting_since(self, value):
+        self.table.waiting_since[self.index] = value
+
+    @property
+    def waiting_time(self):
+        return self.table.waited[self.index]
+
+    @waiting_time.setter
+    def waiting_time(self, value):
+        self.table.waited[self.index] = value
+
+    def __repr__(self):
+        return (
+            f"Task({self.task_id}, Chegada:{self.arrival_time}, "
+            f"Duração:{self.duration}, Prio:{self.priority})"
+        )
+
+
+class TaskViewList:
+    #faz a tabela parecer uma lista de tarefas (len, indice, for) criando as views sob demanda,
+    #p/ usar no lugar do original_task_list sem materializar um objeto por tarefa
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return len(self.table)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [TaskView(self.table, i) for i in range(*index.indices(len(self.table)))]
+        if index < 0:
+            index += len(self.table)
+        if not 0 <= index < len(self.table):
+            raise IndexError("índice de tarefa fora da tabela")
+        return TaskView(self.table, index)
+
+    def __iter__(self):
+        table = self.table
+        return (TaskView(table, i) for i in range(len(table)))
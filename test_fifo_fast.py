@@ -0,0 +1,110 @@
+import glob
+import os
+import sys
+import tempfile
+
+from event_simulator import EventSimulator
+from fifo_fast import can_use_closed_form
+from simulator import Simulator
+from trace_sinks import NullSink
+
+#o atalho do fifo (fifo_fast.py) escreve sozinho tudo o que o laco escreveria: tempos de cada
+#tarefa, espera, restante, estado, metricas e escala. aqui ele eh comparado campo a campo com o
+#motor de referencia (Simulator.tick) em cada exemplo e em cargas feitas p/ os casos de borda.
+#roda com "python test_fifo_fast.py" ou pelo pytest
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLES = os.path.join(HERE, "testes_exemplos", "*.txt")
+
+#cargas de borda (cabecalho + tarefas no formato do arquivo de configuracao)
+EDGE_CASES = {
+    #duracao 0 gasta 1 tick no tick(), inclusive no comeco e colada em outra
+    "duracao-zero": ["FIFO;1", "Z1;red;0;0;1", "A;blue;0;3;1", "Z2;green;3;0;1", "B;gray;4;0;1"],
+    #cpu ociosa no comeco, entre tarefas e depois de uma duracao 0
+    "ociosa": ["FIFO;1", "A;blue;5;2;1", "B;red;20;3;1", "Z;green;30;0;1", "C;gray;40;1;1"],
+    #chegadas no mesmo tick e arquivo fora de ordem (o indice ordena de forma estavel)
+    "fora-de-ordem": ["FIFO;1", "C;gray;7;2;1", "A;blue;0;4;1", "B;red;0;1;1", "D;green;7;0;1", "E;black;2;3;1"],
+}
+
+
+def task_fields(simulator):
+    return [
+        (task.task_id, task.start_time, task.finish_time, task.waiting_time, task.remaining_time, task.status)
+        for task in simulator.original_task_list
+    ]
+
+
+def run_reference(path):
+    simulator = Simulator(path, trace=NullSink())
+    simulator.restart(algorithm_name="FIFO")
+    while not simulator._is_simulation_complete():
+        simulator.tick()
+    return simulator
+
+
+def run_closed_form(path, compact=False):
+    simulator = EventSimulator(path, trace=NullSink(), compact=compact)
+    simulator.restart(algorithm_name="FIFO")
+    assert can_use_closed_form(simulator), f"{path}: o atalho do fifo devia valer aqui"
+    simulator.run(collect=False)
+    return simulator
+
+
+def compare(path):
+    #devolve a lista de diferencas (vazia = igual a referencia)
+    reference = run_reference(path)
+    problems = []
+    for compact in (False, True):
+        label = f"{os.path.basename(path)}{' [compacto]' if compact else ''}"
+        simulator = run_closed_form(path, compact)
+        if simulator.global_tick != reference.global_tick:
+            problems.append(f"{label}: fim em {simulator.global_tick}, referência {reference.global_tick}")
+        expected_tasks, actual_tasks = task_fields(reference), task_fields(simulator)
+        if len(actual_tasks) != len(expected_tasks): #o zip abaixo pararia na lista menor
+            problems.append(f"{label}: {len(actual_tasks)} tarefa(s), referência {len(expected_tasks)}")
+        for expected, actual in zip(expected_tasks, actual_tasks):
+            if expected != actual:
+                problems.append(f"{label}: tarefa {expected[0]}: referência {expected[1:]}, atalho {actual[1:]}")
+        if simulator.metrics.summary() != reference.metrics.summary():
+            problems.append(
+                f"{label}: métricas {simulator.metrics.summary()} != referência {reference.metrics.summary()}"
+            )
+        if list(simulator.schedule) != list(reference.schedule):
+            problems.append(f"{label}: escala diferente da referência")
+    return problems
+
+
+def _write_case(directory, name, lines):
+    path = os.path.join(directory, f"{name}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+def test_samples():
+    paths = sorted(glob.glob(SAMPLES))
+    assert paths, f"nenhum exemplo em {SAMPLES}"
+    for path in paths:
+        assert compare(path) == []
+
+
+def test_edge_cases():
+    with tempfile.TemporaryDirectory() as directory:
+        for name, lines in EDGE_CASES.items():
+            assert compare(_write_case(directory, name, lines)) == []
+
+
+def main():
+    problems = []
+    for path in sorted(glob.glob(SAMPLES)):
+        problems += compare(path)
+    with tempfile.TemporaryDirectory() as directory:
+        for name, lines in EDGE_CASES.items():
+            problems += compare(_write_case(directory, name, lines))
+    for problem in problems:
+        print(problem)
+    print(f"{len(problems)} diferença(s)")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import heapq
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS #64 posicoes por nivel
+SLOT_MASK = SLOTS - 1
+
+
+class TimingWheel:
+    #roda de temporizadores hierarquica (estilo a do kernel do linux) p/ acordar tarefas bloqueadas.
+    #o nivel 0 tem uma posicao por tick, o nivel 1 uma por 64 ticks, o 2 uma por 64*64...
+    #cada item fica no nivel mais baixo cuja janela ainda contem o tick atual, na posicao
+    #dada pelos bits do tick em que vence. quando o relogio entra numa janela nova, a posicao
+    #correspondente do nivel de cima desce ("cascata"). assim agendar eh O(1), um tick sem
+    #ninguem vencendo so olha uma posicao vazia, e mil tarefas dormindo nao custam nada por tick.
+    #o que passa do ultimo nivel fica num heap e desce quando a janela de cima chega nele
+    def __init__(self, levels=4, now=0):
+        self.levels = levels
+        self.now = now
+        self._wheel = [[[] for _ in range(SLOTS)] for _ in range(levels)]
+        self._overflow = []
+        self._size = 0
+        self._counter = 0 #ordem de insercao, desempata quem vence no mesmo tick
+        self._next = None #proximo vencimento ja calculado (None = precisa recalcular)
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def schedule(self, item, tick):
+        #acorda item no tick (tem que ser depois do relogio atual)
+        if tick <= self.now:
+            raise ValueError(f"vencimento {tick} não é depois do tick atual {self.now}")
+        self._counter += 1
+        self._size += 1
+        self._place((tick, self._counter, item))
+        if self._next is not None and tick < self._next:
+            self._next = tick
+
+    def _place(self, entry):
+        tick = entry[0]
+        for level in range(self.levels):
+            shift = SLOT_BITS * (level + 1)
+            if tick >> shift == self.now >> shift: #cabe na janela atual desse nivel
+                self._wheel[level][(tick >> (SLOT_BITS * level)) & SLOT_MASK].append(entry)
+                return
+        heapq.heappush(self._overflow, entry)
+
+    def _move_to(self, tick):
+        #anda o relogio ate tick; quem chama garante que ninguem vence antes dele
+        old = self.now
+        self.now = tick
+        top_shift = SLOT_BITS * self.levels
+        if tick >> top_shift != old >> top_shift:
+            overflow = self._overflow
+            while overflow and overflow[0][0] >> top_shift == tick >> top_shift:
+                self._place(heapq.heappop(overflow))
+        #de cima p/ baixo, assim o que desce de um nivel ainda pode descer do seguinte
+        for level in range(self.levels - 1, 0, -1):
+            shift = SLOT_BITS * level
+            if tick >> shift != old >> shift:
+                slot = self._wheel[level][(tick >> shift) & SLOT_MASK]
+                if slot:
+                    entries = slot[:]
+                    slot.clear()
+                    for entry in entries:
+                        self._place(entry)
+
+    def next_expiry(self):
+        #tick do proximo vencimento, None se nao tem ninguem
+        if not self._size:
+            return None
+        if self._next is None:
+            self._next = self._find_next()
+        return self._next
+
+    def _find_next(self):
+        #o primeiro slot ocupado, nivel por nivel a partir da posicao atual, tem o menor vencimento:
+        #tudo num nivel vence antes de qualquer coisa dos niveis de cima
+        for level in range(self.levels):
+            shift = SLOT_BITS * level
+            slots = self._wheel[level]
+            for index in range((self.now >> shift) & SLOT_MASK, SLOTS):
+                if slots[index]:
+                    return min(entry[0] for entry in slots[index])
+        return self._overflow[0][0]
+
+    def advance(self, tick):
+        #anda ate tick e devolve quem venceu ate ele (inclusive), em ordem de vencimento
+        #e, no mesmo tick, na ordem em que foram agendados
+        due = []
+        while self._size:
+            expiry = self.next_expiry()
+            if expiry > tick:
+                break
+            self._move_to(expiry)
+            slot = self._wheel[0][expiry & SLOT_MASK]
+            entries = sorted(slot)
+            slot.clear()
+            self._size -= len(entries)
+            self._next = None
+            due.extend(entry[2] for entry in entries)
+        if tick > self.now:
+            self._move_to(tick)
+        return due
+
+    def items(self):
+        #(vencimento, item) de todo mundo agendado, na ordem em que acordariam
+        entries = list(self._overflow)
+        for level in self._wheel:
+            for slot in level:
+                entries.extend(slot)
+        entries.sort()
+        return [(entry[0], entry[2]) for entry in entries]
+
+    def clear(self):
+        for level in self._wheel:
+            for slot in level:
+                slot.clear()
+        self._overflow = []
+        self._size = 0
+        self._next = None
@@ -0,0 +1,207 @@
+import csv
+import json
+import sys
+
+#niveis de detalhe do rastro da simulacao
+VERBOSITY_SUMMARY = 0 #so o fim da simulacao
+VERBOSITY_EVENTS = 1 #chegadas, trocas de contexto e terminos
+VERBOSITY_TICKS = 2 #tudo, inclusive o que rodou em cada tick (igual os print antigos)
+
+
+class TraceSink:
+    #interface dos destinos do rastro. o simulador chama esses metodos e cada destino
+    #decide o que escrever; a classe base nao faz nada, entao serve como destino nulo
+    def __init__(self, stream=None, verbosity=VERBOSITY_TICKS):
+        self.stream = stream if stream is not None else sys.stdout
+        self.verbosity = verbosity
+
+    def tick_started(self, tick):
+        pass
+
+    def arrived(self, tick, task):
+        pass
+
+    def preempted(self, tick, task):
+        pass
+
+    def dispatched(self, tick, task):
+        pass
+
+    def ran(self, task, start, end): #tarefa rodou de start ate end (end exclusivo)
+        pass
+
+    def idle(self, start, end):
+        pass
+
+    def blocked(self, tick, task, until): #parou p/ E/S, volta a ficar pronta no tick until
+        pass
+
+    def woke(self, tick, task):
+        pass
+
+    def finished(self, tick, task):
+        pass
+
+    def completed(self, tick):
+        pass
+
+    def close(self):
+        if self.stream not in (sys.stdout, sys.stderr):
+            self.stream.close()
+
+
+class NullSink(TraceSink):
+    #nao escreve nada, p/ rodar sem pagar formatacao de texto no laco
+    def __init__(self):
+        super().__init__(stream=None, verbosity=VERBOSITY_SUMMARY)
+
+    def close(self):
+        pass
+
+
+class TextSink(TraceSink):
+    #texto p/ gente ler, no nivel maximo sai exatamente o que o simulador imprimia antes
+    def _write(self, text):
+        self.stream.write(text + "\n")
+
+    def tick_started(self, tick):
+        if self.verbosity >= VERBOSITY_TICKS:
+            self._write(f"Tick {tick}:")
+
+    def arrived(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._write(f"Tick {tick}: Tarefa {task.task_id} chegou e está PRONTA.")
+
+    def preempted(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._write(f"  > Tarefa {task.task_id} foi PREEMPTADA.")
+
+    def dispatched(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._write(
+                f"  > Tarefa {task.task_id} (Prio:{task.priority} | Restante:{task.remaining_time}) começou/continuou a EXECUTAR."
+            )
+
+    def ran(self, task, start, end):
+        if self.verbosity >= VERBOSITY_TICKS:
+            if end - start == 1:
+                self._write(f"  > Tarefa {task.task_id} está executando...")
+            else:
+                self._write(
+                    f"  > Tarefa {task.task_id} está executando (ticks {start} a {end - 1})..."
+                )
+
+    def idle(self, start, end):
+        if self.verbosity >= VERBOSITY_TICKS:
+            if end - start == 1:
+                self._write("  > CPU Ociosa.")
+            else:
+                self._write(f"  > CPU Ociosa (ticks {start} a {end - 1}).")
+
+    def blocked(self, tick, task, until):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._write(f"  > Tarefa {task.task_id} BLOQUEOU esperando E/S (até o tick {until}).")
+
+    def woke(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._write(f"Tick {tick}: Tarefa {task.task_id} terminou a E/S e está PRONTA.")
+
+    def finished(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._write(f"  > Tarefa {task.task_id} TERMINOU.")
+
+    def completed(self, tick):
+        self._write(f"\n--- Simulação Concluída em {tick} ticks ---")
+
+
+class RecordSink(TraceSink):
+    #base dos formatos de maquina (csv e json lines): cada evento vira um registro
+    #(evento, tick, fim, tarefa, prioridade, restante)
+    def _record(self, event, tick, end=None, task=None):
+        raise NotImplementedError
+
+    def arrived(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._record("arrival", tick, task=task)
+
+    def preempted(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._record("preempt", tick, task=task)
+
+    def dispatched(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._record("dispatch", tick, task=task)
+
+    def ran(self, task, start, end):
+        if self.verbosity >= VERBOSITY_TICKS:
+            self._record("run", start, end, task)
+
+    def idle(self, start, end):
+        if self.verbosity >= VERBOSITY_TICKS:
+            self._record("idle", start, end)
+
+    def blocked(self, tick, task, until):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._record("block", tick, until, task)
+
+    def woke(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._record("wake", tick, task=task)
+
+    def finished(self, tick, task):
+        if self.verbosity >= VERBOSITY_EVENTS:
+            self._record("finish", tick, task=task)
+
+    def completed(self, tick):
+        self._record("complete", tick)
+
+
+class CsvSink(RecordSink):
+    FIELDS = ("event", "tick", "end", "task", "priority", "remaining")
+
+    def __init__(self, stream=None, verbosity=VERBOSITY_TICKS):
+        super().__init__(stream, verbosity)
+        self._writer = csv.writer(self.stream, lineterminator="\n")
+        self._writer.writerow(self.FIELDS)
+
+    def _record(self, event, tick, end=None, task=None):
+        if task is None:
+            self._writer.writerow((event, tick, "" if end is None else end, "", "", ""))
+        else:
+            self._writer.writerow(
+                (
+                    event,
+                    tick,
+                    "" if end is None else end,
+                    task.task_id,
+                    task.priority,
+                    task.remaining_time,
+                )
+            )
+
+
+class JsonLinesSink(RecordSink):
+    def _record(self, event, tick, end=None, task=None):
+        record = {"event": event, "tick": tick}
+        if end is not None:
+            record["end"] = end
+        if task is not None:
+            record["task"] = task.task_id
+            record["priority"] = task.priority
+            record["remaining"] = task.remaining_time
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+SINKS = {
+    "null": NullSink,
+    "text": TextSink,
+    "csv": CsvSink,
+    "jsonl": JsonLinesSink,
+}
+
+
+def create_sink(name, stream=None, verbosity=VERBOSITY_TICKS):
+    #monta o destino pelo nome usado na linha de comando
+    if name == "null":
+        return NullSink()
+    return SINKS[name](stream, verbosity)
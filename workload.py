@@ -0,0 +1,160 @@
+from task import Task, parse_io_events
+
+#quantos erros guardar com detalhe; depois disso so conta (arquivo gigante todo errado nao estoura a memoria)
+MAX_STORED_ERRORS = 100
+
+
+class WorkloadError(ValueError):
+    #erro numa linha do arquivo de configuracao, com o numero da linha p/ achar facil
+    def __init__(self, line_number, message, line=""):
+        super().__init__(f"linha {line_number}: {message}")
+        self.line_number = line_number
+        self.message = message
+        self.line = line
+
+
+def parse_header(line, line_number=1):
+    #primeira linha: ALGORITMO;quantum
+    parts = [part.strip() for part in line.strip().split(";")]
+    if not parts[0]:
+        raise WorkloadError(line_number, "cabeçalho vazio, esperado ALGORITMO;quantum", line)
+    algorithm_name = parts[0].upper()
+    if len(parts) < 2 or not parts[1]:
+        raise WorkloadError(line_number, "quantum ausente no cabeçalho", line)
+    try:
+        quantum = int(parts[1])
+    except ValueError:
+        raise WorkloadError(line_number, f"quantum inválido: {parts[1]!r}", line)
+    return algorithm_name, quantum
+
+
+def parse_task_fields(line, line_number):
+    #linhas de tarefa: id;cor;ingresso;duracao;prioridade;eventos...
+    #devolve os campos ja validados (mesma ordem dos argumentos do Task)
+    parts = line.strip().split(";")
+    if len(parts) < 4:
+        raise WorkloadError(
+            line_number, "esperado id;cor;ingresso;duracao[;prioridade;eventos...]", line
+        )
+    task_id, color, arrival_time, duration = parts[0:4]
+    if not task_id:
+        raise WorkloadError(line_number, "id da tarefa vazio", line)
+    try:
+        arrival_time = int(arrival_time)
+    except ValueError:
+        raise WorkloadError(line_number, f"ingresso inválido: {arrival_time!r}", line)
+    try:
+        duration = int(duration)
+    except ValueError:
+        raise WorkloadError(line_number, f"duração inválida: {duration!r}", line)
+    if arrival_time < 0:
+        raise WorkloadError(line_number, f"ingresso negativo: {arrival_time}", line)
+    if duration < 0:
+        raise WorkloadError(line_number, f"duração negativa: {duration}", line)
+    priority = parts[4] if len(parts) > 4 else "99"
+    if priority:
+        try:
+            int(priority)
+        except ValueError:
+            raise WorkloadError(line_number, f"prioridade inválida: {priority!r}", line)
+    events = parts[5:] if len(parts) > 5 else []
+    try:
+        io_events = parse_io_events(events)
+    except ValueError as e:
+        raise WorkloadError(line_number, str(e), line)
+    if io_events and io_events[-1][0] >= duration:
+        raise WorkloadError(
+            line_number, f"evento de E/S em {io_events[-1][0]}, depois do fim da tarefa ({duration})", line
+        )
+    return task_id, color, arrival_time, duration, priority, events
+
+
+def decode_line(raw, line_number, encoding="utf-8"):
+    #o arquivo eh lido em bytes e cada linha decodificada na hora: arquivo salvo em outra
+    #codificacao (ex: latin-1 do bloco de notas) so estraga as linhas com acento, nao a leitura toda
+    try:
+        return raw.decode(encoding)
+    except UnicodeDecodeError as e:
+        raise WorkloadError(
+            line_number, f"texto não é UTF-8 (byte {raw[e.start]:#04x} na coluna {e.start + 1})",
+            raw.decode(encoding, errors="replace"),
+        )
+
+
+def parse_task_line(line, line_number):
+    return Task(*parse_task_fields(line, line_number))
+
+
+class WorkloadReader:
+    #le o arquivo de configuracao sob demanda: o cabecalho na criacao e as tarefas
+    #uma por uma enquanto alguem itera, sem carregar o arquivo inteiro.
+    #linha com erro nao derruba o resto: vai p/ errors (com o numero da linha) e a leitura segue
+    def __init__(self, file_path, on_error=None):
+        self.algorithm_name = "FIFO"
+        self.quantum = 0
+        self.errors = []
+        self.error_count = 0
+        self._on_error = on_error
+        self._file = open(file_path, "rb")
+        self.line_number = 1 #linha que acabou de ser lida
+        try:
+            #utf-8-sig: tira o BOM que alguns editores poem no comeco do arquivo
+            header = decode_line(self._file.readline(), 1, "utf-8-sig")
+            self.algorithm_name, self.quantum = parse_header(header)
+        except WorkloadError as e:
+            self.report(e)
+
+    def report(self, error):
+        self.error_count += 1
+        if len(self.errors) < MAX_STORED_ERRORS:
+            self.errors.append(error)
+        if self._on_error:
+            self._on_error(error)
+
+    def __iter__(self): #tarefas como objetos Task
+        for fields in self.records():
+            yield Task(*fields)
+
+    def records(self):
+        #campos crus de cada tarefa valida, p/ quem guarda em outro formato (ex: TaskTable)
+        try:
+            for raw in self._file:
+                self.line_number += 1
+                if not raw.strip(): #linha em branco nao eh erro, so ignora
+                    continue
+                try:
+                    line = decode_line(raw, self.line_number)
+                    fields = parse_task_fields(line, self.line_number)
+                except WorkloadError as e:
+                    self.report(e)
+                    continue
+                yield fields
+        finally:
+            self.close()
+
+    def close(self):
+        self._file.close()
+
+
+class Workload:
+    #carga inteira ja lida: cabecalho + os campos de cada tarefa em tuplas (imutaveis e
+    #faceis de mandar p/ outro processo). serve p/ rodar varias simulacoes lendo o arquivo uma vez so;
+    #cada simulacao cria as suas proprias Task com tasks()
+    def __init__(self, algorithm_name, quantum, records, errors=None, source=None):
+        self.algorithm_name = algorithm_name
+        self.quantum = quantum
+        self.records = records
+        self.errors = errors if errors is not None else []
+        self.source = source
+
+    @classmethod
+    def load(cls, file_path):
+        reader = WorkloadReader(file_path)
+        records = [tuple(fields) for fields in reader.records()]
+        return cls(reader.algorithm_name, reader.quantum, records, reader.errors, file_path)
+
+    def __len__(self):
+        return len(self.records)
+
+    def tasks(self): #Task novas (estado zerado) p/ uma simulacao
+        return [Task(*fields) for fields in self.records]
@@ -0,0 +1,70 @@
+import argparse
+import random
+import sys
+
+#formatos de carga sinteticos p/ os benchmarks, todos no mesmo .txt do simulador
+SHAPES = ("burst", "sparse", "long", "short", "io")
+COLORS = ("blue", "orange", "green", "red", "purple", "gray", "black", "yellow")
+
+
+def generate_tasks(shape, count, seed=0):
+    #devolve (id, cor, ingresso, duracao, prioridade, eventos) na ordem do arquivo (ordenado por ingresso).
+    #a semente fixa deixa a carga igual em toda execucao
+    rng = random.Random(f"{shape}:{count}:{seed}")
+    tasks = []
+    arrival = 0
+    for i in range(count):
+        events = []
+        if shape == "burst":
+            #rajadas: grupos grandes chegando no mesmo tick, com pausas entre eles
+            if i % 50 == 0 and i:
+                arrival += rng.randint(50, 200)
+            duration = rng.randint(1, 20)
+        elif shape == "sparse":
+            #chegadas espalhadas, cpu ociosa boa parte do tempo
+            arrival += rng.randint(10, 100)
+            duration = rng.randint(1, 10)
+        elif shape == "long":
+            #poucas chegadas e tarefas longas de cpu
+            arrival += rng.randint(0, 500)
+            duration = rng.randint(500, 5000)
+        elif shape == "short":
+            #muitas tarefas curtinhas chegando quase todo tick
+            arrival += rng.randint(0, 2)
+            duration = rng.randint(1, 3)
+        elif shape == "io":
+            #mistura cpu e E/S: cada tarefa alterna rajadas de cpu com esperas de E/S
+            arrival += rng.randint(0, 10)
+            duration = rng.randint(5, 60)
+            offsets = sorted(rng.sample(range(1, duration), rng.randint(1, min(4, duration - 1))))
+            events = [f"IO:{offset}-{rng.randint(5, 200)}" for offset in offsets]
+        else:
+            raise ValueError(f"formato desconhecido: {shape}")
+        priority = rng.randint(1, 10)
+        tasks.append((f"T{i}", COLORS[i % len(COLORS)], arrival, duration, priority, events))
+    return tasks
+
+
+def write_workload(path, shape, count, algorithm_name="FIFO", quantum=1, seed=0):
+    with open(path, "w") as f:
+        f.write(f"{algorithm_name};{quantum}\n")
+        for task_id, color, arrival, duration, priority, events in generate_tasks(shape, count, seed):
+            f.write(";".join([task_id, color, str(arrival), str(duration), str(priority)] + events) + "\n")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera uma carga sintética no formato .txt do simulador.")
+    parser.add_argument("shape", choices=SHAPES, help="formato da carga")
+    parser.add_argument("count", type=int, help="quantidade de tarefas")
+    parser.add_argument("output", help="arquivo de saída")
+    parser.add_argument("--algorithm", default="FIFO", help="algoritmo do cabeçalho (padrão: FIFO)")
+    parser.add_argument("--quantum", type=int, default=1, help="quantum do cabeçalho (padrão: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="semente (padrão: 0)")
+    args = parser.parse_args(argv)
+    write_workload(args.output, args.shape, args.count, args.algorithm.upper(), args.quantum, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())